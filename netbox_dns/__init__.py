@@ -31,6 +31,11 @@ class DNSConfig(PluginConfig):
         "zone_soa_minimum": 3600,
         "zone_active_status": ["active", "dynamic"],
         "zone_expiration_warning_days": 30,
+        "zone_soa_serial_on_commit": False,
+        "zone_journal_retention": 0,
+        "changes_feed_retention": 2592000,  # P30D
+        "changes_feed_max_timeout": 5,
+        "changes_feed_safety_lag": 5,
         "filter_record_types": [
             # Obsolete or experimental RRTypes
             "A6",  # RFC 6563: Historic
@@ -79,6 +84,8 @@ class DNSConfig(PluginConfig):
         "dnssync_ipaddress_active_status": ["active", "dhcp", "slaac"],
         "dnssync_conflict_deactivate": False,
         "dnssync_minimum_zone_labels": 2,
+        "dnssync_batch_bulk_operations": False,
+        "dnssync_job_threshold": 0,
         "tolerate_characters_in_zone_labels": "",
         "tolerate_underscores_in_labels": False,
         "tolerate_leading_underscore_types": [
@@ -110,11 +117,14 @@ class DNSConfig(PluginConfig):
         "dnssec_dnskey_ttl": 3600,  # PT1H
     }
     base_url = "netbox-dns"
+    middleware = ["netbox_dns.middleware.DNSsyncBatchMiddleware"]
 
     def ready(self):
         super().ready()
 
+        import netbox_dns.jobs  # noqa: F401
         import netbox_dns.signals.dnssec  # noqa: F401
+        import netbox_dns.signals.tombstones  # noqa: F401
 
         if not get_plugin_config("netbox_dns", "dnssync_disabled"):
             import netbox_dns.signals.ipam_dnssync  # noqa: F401
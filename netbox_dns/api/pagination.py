@@ -0,0 +1,97 @@
+import base64
+import binascii
+import json
+
+from django.utils.translation import gettext as _
+from rest_framework import serializers
+from rest_framework.response import Response
+from rest_framework.utils.urls import replace_query_param, remove_query_param
+
+from netbox.api.pagination import OptionalLimitOffsetPagination
+
+__all__ = ("KeysetPagination",)
+
+
+class KeysetPagination(OptionalLimitOffsetPagination):
+    """
+    Limit/offset pagination with an optional keyset pagination mode.
+
+    If the `cursor` query parameter is present, the objects are ordered by
+    their PK and each page starts after the last PK of the previous page,
+    which is passed in an opaque cursor. The cost of fetching a page does not
+    depend on its position, and the response does not contain a count. An
+    empty `cursor` parameter returns the first page.
+    """
+
+    cursor_query_param = "cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.keyset = self.cursor_query_param in request.query_params
+        if not self.keyset:
+            return super().paginate_queryset(queryset, request, view)
+
+        self.request = request
+        self.limit = self.get_limit(request) or self.default_limit
+
+        if (cursor := request.query_params[self.cursor_query_param]) != "":
+            queryset = queryset.filter(pk__gt=self.decode_cursor(cursor))
+
+        page = list(queryset.order_by("pk")[: self.limit + 1])
+
+        self.next_cursor = None
+        if len(page) > self.limit:
+            page = page[: self.limit]
+            self.next_cursor = self.encode_cursor(page[-1].pk)
+
+        return page
+
+    @staticmethod
+    def encode_cursor(pk):
+        return (
+            base64.urlsafe_b64encode(json.dumps({"id": pk}).encode())
+            .decode()
+            .rstrip("=")
+        )
+
+    @staticmethod
+    def decode_cursor(cursor):
+        try:
+            pk = json.loads(
+                base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+            )["id"]
+            if not isinstance(pk, int):
+                raise ValueError
+        except (binascii.Error, ValueError, TypeError, KeyError):
+            raise serializers.ValidationError(_("Invalid cursor"))
+
+        return pk
+
+    def get_next_link(self):
+        if not self.keyset:
+            return super().get_next_link()
+
+        if self.next_cursor is None:
+            return None
+
+        url = remove_query_param(
+            self.request.build_absolute_uri(), self.offset_query_param
+        )
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_previous_link(self):
+        if not self.keyset:
+            return super().get_previous_link()
+
+        return None
+
+    def get_paginated_response(self, data):
+        if not self.keyset:
+            return super().get_paginated_response(data)
+
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "previous": None,
+                "results": data,
+            }
+        )
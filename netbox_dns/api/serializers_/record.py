@@ -6,11 +6,17 @@ from ipam.api.serializers import IPAddressSerializer
 from tenancy.api.serializers import TenantSerializer
 
 from netbox_dns.models import Record
+from netbox_dns.choices import RecordStatusChoices
 
 from ..nested_serializers import NestedZoneSerializer, NestedRecordSerializer
 from ..field_serializers import TimePeriodField
 
-__all__ = ("RecordSerializer",)
+__all__ = (
+    "RecordSerializer",
+    "RecordSyncSerializer",
+    "RecordUpsertSerializer",
+    "RecordLookupSerializer",
+)
 
 
 class RecordSerializer(PrimaryModelSerializer):
@@ -103,3 +109,55 @@ class RecordSerializer(PrimaryModelSerializer):
         required=False,
         allow_null=True,
     )
+
+
+class RecordSyncSerializer(serializers.Serializer):
+    name = serializers.CharField()
+    type = serializers.CharField()
+    value = serializers.CharField()
+    ttl = TimePeriodField(
+        required=False,
+        allow_null=True,
+    )
+    status = serializers.ChoiceField(
+        choices=RecordStatusChoices,
+        required=False,
+    )
+    disable_ptr = serializers.BooleanField(
+        required=False,
+    )
+    description = serializers.CharField(
+        required=False,
+        allow_blank=True,
+    )
+    tenant = serializers.IntegerField(
+        required=False,
+        allow_null=True,
+        help_text=_("ID of the tenant of the record"),
+    )
+
+
+class RecordUpsertSerializer(RecordSyncSerializer):
+    zone = serializers.IntegerField(
+        help_text=_("ID of the zone the record belongs to"),
+    )
+
+
+class RecordLookupSerializer(serializers.Serializer):
+    fqdns = serializers.ListField(
+        child=serializers.CharField(),
+        required=False,
+        default=list,
+        max_length=100000,
+    )
+    ip_addresses = serializers.ListField(
+        child=serializers.CharField(),
+        required=False,
+        default=list,
+        max_length=100000,
+    )
+    view = serializers.IntegerField(
+        required=False,
+        allow_null=True,
+        help_text=_("ID of the view the records are looked up in"),
+    )
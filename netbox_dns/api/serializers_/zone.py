@@ -47,6 +47,7 @@ class ZoneSerializer(PrimaryModelSerializer):
             "soa_retry",
             "soa_expire",
             "soa_minimum",
+            "journal_retention",
             "rfc2317_prefix",
             "rfc2317_parent_managed",
             "rfc2317_parent_zone",
@@ -1,17 +1,35 @@
+import io
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.http import StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils.cache import get_conditional_response
 from django.utils.translation import gettext as _
-from rest_framework import serializers
+from rest_framework import serializers, status
+from rest_framework.exceptions import PermissionDenied
+from rest_framework.decorators import action
+from rest_framework.response import Response
 from rest_framework.routers import APIRootView
 
 from ipam.models import Prefix
 from ipam.filtersets import PrefixFilterSet
 
+from netbox.api.authentication import (
+    IsAuthenticatedOrLoginNotRequired,
+    TokenPermissions,
+)
 from netbox.api.viewsets import NetBoxModelViewSet
 
+from netbox_dns.api.pagination import KeysetPagination
 from netbox_dns.api.serializers import (
     ViewSerializer,
     ZoneSerializer,
     NameServerSerializer,
     RecordSerializer,
+    RecordSyncSerializer,
+    RecordUpsertSerializer,
+    RecordLookupSerializer,
     RegistrarSerializer,
     RegistrationContactSerializer,
     ZoneTemplateSerializer,
@@ -44,6 +62,36 @@ from netbox_dns.models import (
     DNSSECKeyTemplate,
     DNSSECPolicy,
 )
+from netbox_dns.mixins import DeferredSerialsMixin, ChangesFeedMixin
+from netbox_dns.utilities import (
+    get_zone_file_etag,
+    generate_zone_file,
+    get_zone_changes,
+    generate_zone_transfer,
+    upsert_records,
+    parse_zone_records,
+    sync_zone_records,
+    read_zone_file,
+    import_zone,
+    generate_record_export,
+    lookup_records,
+)
+
+
+class ZoneSyncPermissions(TokenPermissions):
+    """
+    Token permissions for the zone sync action, which changes the records of
+    an existing zone and therefore requires the change permission for zones
+    and the record permissions instead of the add permission for zones.
+    """
+
+    def get_required_permissions(self, method, model_cls):
+        return [
+            "netbox_dns.change_zone",
+            "netbox_dns.add_record",
+            "netbox_dns.change_record",
+            "netbox_dns.delete_record",
+        ]
 
 
 class NetBoxDNSRootView(APIRootView):
@@ -57,10 +105,134 @@ class ViewViewSet(NetBoxModelViewSet):
     filterset_class = ViewFilterSet
 
 
-class ZoneViewSet(NetBoxModelViewSet):
+class ZoneViewSet(ChangesFeedMixin, DeferredSerialsMixin, NetBoxModelViewSet):
     queryset = Zone.objects.prefetch_related("view", "nameservers", "soa_mname")
     serializer_class = ZoneSerializer
     filterset_class = ZoneFilterSet
+    pagination_class = KeysetPagination
+
+    @action(detail=True, methods=["get"], url_path="zonefile")
+    def zonefile(self, request, pk=None):
+        zone = self.get_object()
+        etag = get_zone_file_etag(zone)
+
+        if (response := get_conditional_response(request, etag=etag)) is None:
+            response = StreamingHttpResponse(
+                generate_zone_file(zone), content_type="text/dns; charset=utf-8"
+            )
+        response["ETag"] = etag
+
+        return response
+
+    @action(detail=True, methods=["get"], url_path="ixfr")
+    def ixfr(self, request, pk=None):
+        zone = self.get_object()
+
+        try:
+            serial = int(request.query_params["serial"])
+        except (KeyError, ValueError):
+            raise serializers.ValidationError(
+                _("The 'serial' query parameter must be an integer")
+            )
+
+        if (changes := get_zone_changes(zone, serial)) is None:
+            return StreamingHttpResponse(
+                generate_zone_transfer(zone), content_type="application/json"
+            )
+
+        return Response(
+            {
+                "zone": zone.pk,
+                "serial": zone.soa_serial,
+                "default_ttl": zone.default_ttl,
+                "type": "ixfr",
+                "changes": changes,
+            }
+        )
+
+    @action(
+        detail=True,
+        methods=["post"],
+        url_path="sync",
+        permission_classes=[ZoneSyncPermissions],
+    )
+    def sync(self, request, pk=None):
+        zone = get_object_or_404(Zone.objects.restrict(request.user, "change"), pk=pk)
+
+        dry_run = request.query_params.get("dry_run", "").lower() in ("true", "1")
+
+        try:
+            if request.content_type.startswith("text/"):
+                desired = parse_zone_records(zone, request.body.decode())
+            else:
+                serializer = RecordSyncSerializer(data=request.data, many=True)
+                serializer.is_valid(raise_exception=True)
+                desired = serializer.validated_data
+
+            diff, errors = sync_zone_records(
+                zone, desired, dry_run=dry_run, user=request.user
+            )
+        except ValidationError as exc:
+            raise serializers.ValidationError(exc.messages)
+
+        return Response(
+            {"dry_run": dry_run, **diff, "errors": errors},
+            status=(status.HTTP_400_BAD_REQUEST if errors else status.HTTP_200_OK),
+        )
+
+    @action(detail=False, methods=["post"], url_path="import", url_name="import")
+    def import_zone_file(self, request):
+        if not request.user.has_perms(("netbox_dns.add_zone", "netbox_dns.add_record")):
+            raise PermissionDenied()
+
+        params = request.query_params
+        try:
+            if (view_id := params.get("view_id")) is not None:
+                view = View.objects.get(pk=int(view_id))
+            else:
+                view = View.get_default_view()
+
+            default_ttl = params.get("default_ttl")
+            if default_ttl is not None:
+                default_ttl = int(default_ttl)
+        except (ValueError, View.DoesNotExist):
+            raise serializers.ValidationError(
+                _("The 'view_id' and 'default_ttl' query parameters must be valid")
+            )
+
+        try:
+            with transaction.atomic():
+                zone, errors = import_zone(
+                    read_zone_file(
+                        io.StringIO(request.body.decode()), origin=params.get("name")
+                    ),
+                    view,
+                    default_ttl=default_ttl,
+                    disable_ptr=params.get("disable_ptr", "").lower() in ("true", "1"),
+                    ignore_errors=params.get("ignore_errors", "").lower()
+                    in ("true", "1"),
+                )
+
+                if (
+                    zone is not None
+                    and not Zone.objects.restrict(request.user, "add")
+                    .filter(pk=zone.pk)
+                    .exists()
+                ):
+                    raise PermissionDenied()
+        except ValidationError as exc:
+            raise serializers.ValidationError(exc.messages)
+
+        if zone is None:
+            return Response({"errors": errors}, status=status.HTTP_400_BAD_REQUEST)
+
+        return Response(
+            {
+                **ZoneSerializer(zone, context={"request": request}).data,
+                "errors": errors,
+            },
+            status=status.HTTP_201_CREATED,
+        )
 
 
 class NameServerViewSet(NetBoxModelViewSet):
@@ -69,10 +241,82 @@ class NameServerViewSet(NetBoxModelViewSet):
     filterset_class = NameServerFilterSet
 
 
-class RecordViewSet(NetBoxModelViewSet):
+class RecordViewSet(ChangesFeedMixin, DeferredSerialsMixin, NetBoxModelViewSet):
     queryset = Record.objects.prefetch_related("zone", "zone__view")
     serializer_class = RecordSerializer
     filterset_class = RecordFilterSet
+    pagination_class = KeysetPagination
+
+    def get_feed_tombstones(self):
+        tombstones = super().get_feed_tombstones()
+
+        if zone_ids := self.request.query_params.getlist("zone_id"):
+            tombstones = tombstones.filter(zone_id__in=zone_ids)
+
+        return tombstones
+
+    @action(detail=False, methods=["get"], url_path="export")
+    def export(self, request):
+        try:
+            after = request.query_params.get("after")
+            if after is not None:
+                after = int(after)
+        except ValueError:
+            raise serializers.ValidationError(
+                _("The 'after' query parameter must be an integer")
+            )
+
+        return StreamingHttpResponse(
+            generate_record_export(
+                self.filter_queryset(self.get_queryset()), after=after
+            ),
+            content_type="application/x-ndjson",
+        )
+
+    @action(
+        detail=False,
+        methods=["post"],
+        url_path="lookup",
+        url_name="lookup",
+        permission_classes=[IsAuthenticatedOrLoginNotRequired],
+    )
+    def bulk_lookup(self, request):
+        # +
+        # The lookup does not change any data, so it requires the view
+        # permission instead of the add permission normally required for
+        # POST requests.
+        # -
+        if not request.user.has_perm("netbox_dns.view_record"):
+            raise PermissionDenied()
+
+        serializer = RecordLookupSerializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        try:
+            results = lookup_records(
+                Record.objects.restrict(request.user, "view"),
+                fqdns=serializer.validated_data["fqdns"],
+                ip_addresses=serializer.validated_data["ip_addresses"],
+                view=serializer.validated_data.get("view"),
+            )
+        except ValidationError as exc:
+            raise serializers.ValidationError(exc.message_dict)
+
+        return Response(results)
+
+    @action(detail=False, methods=["post"], url_path="upsert")
+    def upsert(self, request):
+        if not request.user.has_perms(
+            ("netbox_dns.add_record", "netbox_dns.change_record")
+        ):
+            raise PermissionDenied()
+
+        serializer = RecordUpsertSerializer(data=request.data, many=True)
+        serializer.is_valid(raise_exception=True)
+
+        results = upsert_records(serializer.validated_data, user=request.user)
+
+        return Response({"results": results})
 
     def create(self, request, *args, **kwargs):
         data = request.data
@@ -5,6 +5,7 @@ from utilities.choices import ChoiceSet
 __all__ = (
     "ZoneStatusChoices",
     "ZoneEPPStatusChoices",
+    "ZoneChangeActionChoices",
 )
 
 
@@ -116,3 +117,15 @@ class ZoneEPPStatusChoices(ChoiceSet):
             "cyan",
         ),
     ]
+
+
+class ZoneChangeActionChoices(ChoiceSet):
+    ACTION_DELETE = "delete"
+    ACTION_ADD = "add"
+    ACTION_RESET = "reset"
+
+    CHOICES = [
+        (ACTION_DELETE, _("Delete")),
+        (ACTION_ADD, _("Add")),
+        (ACTION_RESET, _("Reset")),
+    ]
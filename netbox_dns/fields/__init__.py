@@ -4,3 +4,4 @@ from .rfc2317 import *
 from .ipam import *
 from .choice_array import *
 from .timeperiod import *
+from .lookups import *
@@ -62,7 +62,7 @@ class AddressContained(Lookup):
         lhs, lhs_params = self.process_lhs(compiler, connection)
         rhs, rhs_params = self.process_rhs(compiler, connection)
         params = lhs_params + rhs_params
-        return f"CAST(HOST({lhs}) AS INET) <<= {rhs}", params
+        return f"{lhs} <<= {rhs}", params
 
 
 AddressField.register_lookup(AddressContained)
@@ -0,0 +1,31 @@
+from django.db.models import Lookup
+
+__all__ = ("ArrayAny",)
+
+
+class ArrayAny(Lookup):
+    """
+    Lookup matching a field against a list of values using `= ANY()` with the
+    list passed as a single array parameter, which keeps the query text and
+    planning cost independent of the number of values.
+
+    Used as an expression, e.g. `Record.objects.filter(ArrayAny(F("fqdn"),
+    fqdns))`.
+    """
+
+    lookup_name = "any"
+    prepare_rhs = False
+
+    def as_sql(self, compiler, connection):
+        lhs, lhs_params = self.process_lhs(compiler, connection)
+        output_field = self.lhs.output_field
+
+        values = [
+            output_field.get_db_prep_value(value, connection, prepared=False)
+            for value in self.rhs
+        ]
+
+        return (
+            f"{lhs} = ANY(%s::{output_field.db_type(connection)}[])",
+            (*lhs_params, values),
+        )
@@ -182,6 +182,7 @@ class ZoneForm(ZoneTemplateUpdateMixin, TenancyForm, PrimaryModelForm):
             "soa_retry",
             "soa_expire",
             "soa_minimum",
+            "journal_retention",
             "rfc2317_prefix",
             "rfc2317_parent_managed",
             "dnssec_policy",
@@ -239,6 +240,7 @@ class ZoneForm(ZoneTemplateUpdateMixin, TenancyForm, PrimaryModelForm):
             "soa_minimum",
             "soa_serial_auto",
             "soa_serial",
+            "journal_retention",
             name=_("SOA"),
         ),
         FieldSet(
@@ -662,6 +664,7 @@ class ZoneImportForm(ZoneTemplateUpdateMixin, PrimaryModelImportForm):
             "soa_retry",
             "soa_expire",
             "soa_minimum",
+            "journal_retention",
             "dnssec_policy",
             "parental_agents",
             "rfc2317_prefix",
@@ -882,6 +885,7 @@ class ZoneBulkEditForm(PrimaryModelBulkEditForm):
             "soa_minimum",
             "soa_serial_auto",
             "soa_serial",
+            "journal_retention",
             name=_("SOA"),
         ),
         FieldSet(
@@ -915,6 +919,7 @@ class ZoneBulkEditForm(PrimaryModelBulkEditForm):
     nullable_fields = (
         "description",
         "nameservers",
+        "journal_retention",
         "rfc2317_prefix",
         "registrar",
         "expiration_date",
@@ -992,6 +997,11 @@ class ZoneBulkEditForm(PrimaryModelBulkEditForm):
         validators=[MinValueValidator(1)],
         label=_("SOA Minimum TTL"),
     )
+    journal_retention = forms.IntegerField(
+        required=False,
+        validators=[MinValueValidator(0)],
+        label=_("Journal Retention"),
+    )
     rfc2317_prefix = RFC2317NetworkFormField(
         required=False,
         validators=[validate_ipv4, validate_prefix, validate_rfc2317],
@@ -95,6 +95,7 @@ class NetBoxDNSZoneType(PrimaryObjectType):
     soa_expire: BigInt
     soa_minimum: BigInt
     soa_serial_auto: bool
+    journal_retention: BigInt | None
     dnssec_policy: (
         Annotated[
             "NetBoxDNSDNSSECPolicyType", strawberry.lazy("netbox_dns.graphql.types")
@@ -0,0 +1,174 @@
+from bisect import bisect_right
+
+from django_rq import get_connection
+from rq.exceptions import NoSuchJobError
+from rq.job import Job as RQJob
+
+from django.db import transaction
+
+from netbox.jobs import JobRunner, system_job
+from core.choices import JobIntervalChoices, JobStatusChoices
+from ipam.models import IPAddress
+
+from netbox_dns.utilities import DNSsyncEngine, prune_tombstones
+
+__all__ = (
+    "DNSsyncJob",
+    "TombstoneCleanupJob",
+)
+
+
+class DNSsyncJob(JobRunner):
+    """
+    Background job synchronizing the address records of a list of IP
+    addresses with the DNSsync engine.
+
+    The PKs of the IP addresses are passed to the job as a keyword argument,
+    which is stored once with the queued job. The IP addresses are processed
+    in PK order in chunks, each in its own transaction. The job data only
+    contains the counters and the PK of the last IP address processed, which
+    are updated in the same transaction as the records of each chunk, so a job
+    interrupted by a worker crash can be resumed with `DNSsyncJob.resume()`
+    without processing any IP address twice.
+    """
+
+    class Meta:
+        name = "DNSsync"
+
+    chunk_size = 1000
+    max_errors = 100
+
+    def run(self, *args, ip_address_pks=None, resume_data=None, **kwargs):
+        pks = sorted(ip_address_pks or [])
+
+        if resume_data is not None:
+            data = dict(resume_data)
+            data.pop("resumed_by", None)
+        else:
+            data = {
+                "total": len(pks),
+                "processed": 0,
+                "cursor": None,
+                "created": 0,
+                "updated": 0,
+                "deleted": 0,
+                "error_count": 0,
+                "errors": [],
+            }
+
+        start = bisect_right(pks, data["cursor"]) if data["cursor"] is not None else 0
+        self._save_progress(data)
+
+        engine = DNSsyncEngine()
+
+        for index in range(start, len(pks), self.chunk_size):
+            chunk = pks[index : index + self.chunk_size]
+
+            with transaction.atomic():
+                result = engine.sync(
+                    IPAddress.objects.filter(pk__in=chunk)
+                    .select_related("vrf")
+                    .order_by("pk")
+                )
+
+                for ip_address, exc in result["errors"]:
+                    error = (
+                        f"{ip_address}, VRF {ip_address.vrf}: {', '.join(exc.messages)}"
+                    )
+                    self.logger.error(error)
+
+                    # +
+                    # All errors are logged, but only the first ones are kept
+                    # in the job data to limit its size.
+                    # -
+                    data["error_count"] += 1
+                    if len(data["errors"]) < self.max_errors:
+                        data["errors"].append(error)
+
+                for key in ("created", "updated", "deleted"):
+                    data[key] += result[key]
+                data["processed"] += len(chunk)
+                data["cursor"] = chunk[-1]
+
+                self._save_progress(data)
+
+            self.logger.info(
+                f"Processed {data['processed']} of {data['total']} IP addresses"
+            )
+
+    def _save_progress(self, data):
+        total = data["total"]
+        data["progress"] = round(100 * data["processed"] / total) if total else 100
+
+        self.job.data = data
+        self.job.save(update_fields=["data"])
+
+    @staticmethod
+    def get_ip_address_pks(job):
+        """
+        Return the PKs of the IP addresses passed to the queued job, or None
+        if the queued job no longer exists.
+        """
+        try:
+            rq_job = RQJob.fetch(str(job.job_id), connection=get_connection())
+        except NoSuchJobError:
+            return None
+
+        return rq_job.kwargs.get("ip_address_pks")
+
+    @classmethod
+    def resume(cls, job, **kwargs):
+        """
+        Enqueue a new job for the IP addresses not yet processed by an
+        interrupted job. The interrupted job is marked as failed if it is
+        still marked as pending or running.
+        """
+        data = job.data or {}
+
+        if "cursor" not in data:
+            raise ValueError(f"Job {job.pk} has no progress data and cannot be resumed")
+        if "resumed_by" in data:
+            raise ValueError(
+                f"Job {job.pk} has already been resumed as job {data['resumed_by']}"
+            )
+        if (ip_address_pks := cls.get_ip_address_pks(job)) is None:
+            raise ValueError(
+                f"The queued job for job {job.pk} has expired, it cannot be resumed"
+            )
+
+        if job.status in JobStatusChoices.ENQUEUED_STATE_CHOICES:
+            job.terminate(
+                status=JobStatusChoices.STATUS_FAILED,
+                error="Interrupted, resumed in a new job",
+            )
+
+        new_job = cls.enqueue(
+            instance=job.object,
+            user=job.user,
+            ip_address_pks=ip_address_pks,
+            resume_data={
+                **data,
+                "resumed_from": job.pk,
+            },
+            **kwargs,
+        )
+
+        job.data = {**data, "resumed_by": new_job.pk}
+        job.save(update_fields=["data"])
+
+        return new_job
+
+
+@system_job(interval=JobIntervalChoices.INTERVAL_HOURLY)
+class TombstoneCleanupJob(JobRunner):
+    """
+    System job removing the tombstones of deleted objects that are older than
+    the retention period of the changes feed.
+    """
+
+    class Meta:
+        name = "DNS tombstone cleanup"
+
+    def run(self, *args, **kwargs):
+        deleted, _ = prune_tombstones()
+        self.logger.info(f"Removed {deleted} expired tombstones")
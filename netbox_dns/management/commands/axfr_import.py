@@ -0,0 +1,264 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+from dns import tsig
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from netbox_dns.models import View, Zone
+from netbox_dns.utilities import ZoneTransfer, refresh_zone, transfer_zone
+
+TSIG_ALGORITHMS = {
+    algorithm.to_text().rstrip("."): algorithm
+    for algorithm in (
+        tsig.HMAC_MD5,
+        tsig.HMAC_SHA1,
+        tsig.HMAC_SHA224,
+        tsig.HMAC_SHA256,
+        tsig.HMAC_SHA256_128,
+        tsig.HMAC_SHA384,
+        tsig.HMAC_SHA384_192,
+        tsig.HMAC_SHA512,
+        tsig.HMAC_SHA512_256,
+    )
+}
+
+
+def _transfer(zone_name, server, view_pk, **options):
+    start = time.monotonic()
+
+    transfer = ZoneTransfer(
+        server,
+        zone_name,
+        port=options.get("port"),
+        tsig_key_name=options.get("tsig_key_name"),
+        tsig_key=options.get("tsig_key"),
+        tsig_algorithm=TSIG_ALGORITHMS[options.get("tsig_algorithm")],
+        timeout=options.get("timeout"),
+    )
+    zone = Zone.objects.filter(
+        view_id=view_pk, name=transfer.origin.to_text(omit_final_dot=True)
+    ).first()
+
+    try:
+        if zone is None:
+            zone, errors = transfer_zone(
+                transfer,
+                View.objects.get(pk=view_pk),
+                default_ttl=options.get("default_ttl"),
+                disable_ptr=options.get("disable_ptr"),
+                ignore_errors=options.get("ignore_errors"),
+            )
+            result = {
+                "action": "imported" if zone is not None else None,
+                "records": (
+                    f"{zone.records.filter(managed=False).count()} records"
+                    if zone is not None
+                    else ""
+                ),
+            }
+        else:
+            transfer_type, diff, errors = refresh_zone(
+                zone, transfer, force_axfr=options.get("axfr")
+            )
+            result = {
+                "action": (
+                    f"refreshed ({transfer_type.upper()})"
+                    if transfer_type != "current"
+                    else "unchanged"
+                ),
+                "records": ", ".join(
+                    f"{len(diff[key])} {label}"
+                    for key, label in (
+                        ("create", "created"),
+                        ("update", "updated"),
+                        ("delete", "deleted"),
+                    )
+                ),
+            }
+            if errors:
+                result["action"] = None
+    except ValidationError as exc:
+        return {"action": None, "errors": exc.messages}
+
+    result["errors"] = [
+        f"{error['name']} {error['type']} {error['value']}: "
+        + ", ".join(
+            message for messages in error["errors"].values() for message in messages
+        )
+        for error in errors
+    ]
+    result["time"] = time.monotonic() - start
+
+    return result
+
+
+def _transfer_thread(*args, **options):
+    try:
+        return _transfer(*args, **options)
+    finally:
+        connections.close_all()
+
+
+class Command(BaseCommand):
+    help = "Import or refresh zones from name servers using zone transfers"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "zones",
+            nargs="*",
+            help="Names of the zones to transfer from the server given by --server",
+        )
+        parser.add_argument(
+            "--server",
+            help="Name server the zones are transferred from",
+        )
+        parser.add_argument(
+            "--zones-file",
+            help="File containing one zone name and optionally a server per line",
+        )
+        parser.add_argument(
+            "--view",
+            help="Name of the view the zones are created in (default: default view)",
+        )
+        parser.add_argument(
+            "--port",
+            type=int,
+            default=53,
+            help="Port of the name servers (default: 53)",
+        )
+        parser.add_argument(
+            "--tsig-key-name",
+            help="Name of the TSIG key used for the transfers",
+        )
+        parser.add_argument(
+            "--tsig-key",
+            help="Base64 encoded secret of the TSIG key",
+        )
+        parser.add_argument(
+            "--tsig-algorithm",
+            choices=TSIG_ALGORITHMS.keys(),
+            default="hmac-sha256",
+            help="Algorithm of the TSIG key (default: hmac-sha256)",
+        )
+        parser.add_argument(
+            "--timeout",
+            type=float,
+            default=30,
+            help="Timeout for each transfer message in seconds (default: 30)",
+        )
+        parser.add_argument(
+            "--axfr",
+            action="store_true",
+            help="Use AXFR instead of IXFR to refresh existing zones",
+        )
+        parser.add_argument(
+            "--default-ttl",
+            type=int,
+            help="Default TTL of new zones (default: zone_default_ttl setting)",
+        )
+        parser.add_argument(
+            "--disable-ptr",
+            action="store_true",
+            help="Disable automatic creation of PTR records for address records",
+        )
+        parser.add_argument(
+            "--ignore-errors",
+            action="store_true",
+            help="Create zones even if some of their records cannot be imported",
+        )
+        parser.add_argument(
+            "--concurrency",
+            type=int,
+            default=1,
+            help="Number of zones transferred concurrently (default: 1)",
+        )
+
+    def handle(self, *model_names, **options):
+        start = time.monotonic()
+
+        if options.get("tsig_key_name") and not options.get("tsig_key"):
+            raise CommandError("--tsig-key is required with --tsig-key-name")
+
+        if options.get("view") is not None:
+            try:
+                view = View.objects.get(name=options.get("view"))
+            except View.DoesNotExist:
+                raise CommandError(f"View {options.get('view')} does not exist")
+        else:
+            view = View.get_default_view()
+
+        zones = [(zone_name, options.get("server")) for zone_name in options["zones"]]
+        if options.get("zones_file") is not None:
+            try:
+                with open(options.get("zones_file"), encoding="utf-8") as zones_file:
+                    for line in zones_file:
+                        if not (fields := line.split("#", 1)[0].split()):
+                            continue
+
+                        zones.append(
+                            (fields[0], fields[1] if len(fields) > 1 else None)
+                        )
+            except OSError as exc:
+                raise CommandError(f"Could not read zones file: {exc}")
+
+        zones = [
+            (zone_name, server or options.get("server")) for zone_name, server in zones
+        ]
+        if any(server is None for zone_name, server in zones):
+            raise CommandError("No server specified for some zones, use --server")
+
+        if options.get("verbosity") >= 2:
+            self.stdout.write(
+                f"Transferring {len(zones)} zones with concurrency "
+                f"{options.get('concurrency')}"
+            )
+
+        if options.get("concurrency") > 1 and len(zones) > 1:
+            with ThreadPoolExecutor(max_workers=options.get("concurrency")) as executor:
+                futures = {
+                    executor.submit(
+                        _transfer_thread, zone_name, server, view.pk, **options
+                    ): (zone_name, server)
+                    for zone_name, server in zones
+                }
+                for future in as_completed(futures):
+                    self._report_zone(
+                        *futures[future],
+                        future.exception() or future.result(),
+                        **options,
+                    )
+        else:
+            for zone_name, server in zones:
+                try:
+                    result = _transfer(zone_name, server, view.pk, **options)
+                except Exception as exc:
+                    result = exc
+
+                self._report_zone(zone_name, server, result, **options)
+
+        if options.get("verbosity") >= 2:
+            self.stdout.write(
+                f"Zone transfers completed in {time.monotonic() - start:.2f}s"
+            )
+
+    def _report_zone(self, zone_name, server, result, **options):
+        if isinstance(result, Exception):
+            self.stderr.write(f"Could not transfer zone {zone_name}: {result}")
+            return
+
+        for error in result["errors"]:
+            self.stderr.write(f"{zone_name}: {error}")
+
+        if result["action"] is None:
+            self.stderr.write(f"Could not transfer zone {zone_name} from {server}")
+            return
+
+        if options.get("verbosity") >= 1:
+            self.stdout.write(
+                f"Zone {zone_name} {result['action']} from {server}: "
+                f"{result['records']}, {len(result['errors'])} errors "
+                f"in {result['time']:.2f}s"
+            )
@@ -4,20 +4,29 @@ from django.core.management.base import BaseCommand
 
 from netbox_dns.models import Zone, Record
 from netbox_dns.choices import RecordTypeChoices
+from netbox_dns.utilities import deferred_serials, update_ptr_records, update_serials
 
 
 class Command(BaseCommand):
     help = "Clean up NetBox DNS database"
 
     def handle(self, *model_names, **options):
-        self._zone_cleanup_ns_records(**options)
-        self._zone_cleanup_soa_records(**options)
-        self._zone_update_arpa_network(**options)
-        self._record_cleanup_disable_ptr(**options)
-        self._record_update_ptr_records(**options)
-        self._record_update_ip_address(**options)
-        self._record_remove_orphaned_ptr_records(**options)
-        self._record_remove_orphaned_address_records(**options)
+        # +
+        # Each step runs in a transaction of its own, so locks are only held
+        # and changes only rolled back for the step that is running.
+        # -
+        for cleanup_step in (
+            self._zone_cleanup_ns_records,
+            self._zone_cleanup_soa_records,
+            self._zone_update_arpa_network,
+            self._record_cleanup_disable_ptr,
+            self._record_update_ptr_records,
+            self._record_update_ip_address,
+            self._record_remove_orphaned_ptr_records,
+            self._record_remove_orphaned_address_records,
+        ):
+            with deferred_serials():
+                cleanup_step(**options)
 
         if options.get("verbosity"):
             self.stdout.write("Database cleanup completed.")
@@ -141,10 +150,19 @@ class Command(BaseCommand):
         if options.get("verbosity"):
             self.stdout.write("Updating the PTR record for all address records")
 
-        for record in Record.objects.filter(
-            type__in=(RecordTypeChoices.A, RecordTypeChoices.AAAA)
-        ):
-            record.save(update_fields=["ptr_record"])
+        record_pks = list(
+            Record.objects.filter(
+                type__in=(RecordTypeChoices.A, RecordTypeChoices.AAAA)
+            ).values_list("pk", flat=True)
+        )
+
+        zone_pks = set()
+        for index in range(0, len(record_pks), 1000):
+            zone_pks |= update_ptr_records(
+                Record.objects.filter(pk__in=record_pks[index : index + 1000])
+            )
+
+        update_serials(zone_pks)
 
     def _record_update_ip_address(self, **options):
         if options.get("verbosity"):
@@ -3,6 +3,7 @@ from django.db.models import Max, Min
 
 from netbox_dns.models import Record
 from netbox_dns.choices import RecordTypeChoices
+from netbox_dns.utilities import deferred_serials
 
 
 class Command(BaseCommand):
@@ -22,7 +23,8 @@ class Command(BaseCommand):
         )
 
     def handle(self, *model_names, **options):
-        self._cleanup_rrset_ttl(**options)
+        with deferred_serials():
+            self._cleanup_rrset_ttl(**options)
 
     def _cleanup_rrset_ttl(self, **options):
         if options.get("verbosity"):
@@ -0,0 +1,188 @@
+import json
+import os
+import tempfile
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import suppress
+from pathlib import Path
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from netbox_dns.models import Zone
+from netbox_dns.utilities import generate_zone_file
+
+MANIFEST_NAME = ".netbox-dns-export.json"
+
+
+def _init_worker():
+    connections.close_all()
+
+
+def _write_file(file_path, lines):
+    # +
+    # Write to a temporary file in the target directory and replace the
+    # target file with it, so readers never see a partially written file.
+    # -
+    file_path.parent.mkdir(parents=True, exist_ok=True)
+    fd, temp_path = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.")
+
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as temp_file:
+            temp_file.writelines(lines)
+            temp_file.flush()
+            os.fsync(temp_file.fileno())
+
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, file_path)
+    except BaseException:
+        with suppress(FileNotFoundError):
+            os.unlink(temp_path)
+        raise
+
+
+def _export_zone(zone_pk, file_path):
+    zone = Zone.objects.select_related("view").get(pk=zone_pk)
+    _write_file(Path(file_path), generate_zone_file(zone))
+
+    return zone.soa_serial
+
+
+class Command(BaseCommand):
+    help = "Export the active zones to zone files"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "path",
+            help="Base directory for the zone files",
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of worker processes (default: 1)",
+        )
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Export all zones, even if their SOA serial is unchanged",
+        )
+
+    def handle(self, *model_names, **options):
+        start = time.monotonic()
+
+        base_path = Path(options.get("path"))
+        if not base_path.is_dir():
+            raise CommandError(f"Export path {base_path} is not a directory")
+
+        manifest_path = base_path / MANIFEST_NAME
+        manifest = self._load_manifest(manifest_path)
+        previous_manifest = manifest.copy()
+
+        # +
+        # The manifest maps zone PKs to the zone file and the SOA serial of the
+        # last export. Zones whose file and SOA serial are unchanged are skipped.
+        # -
+        exported = {}
+        exports = []
+        for zone in Zone.objects.filter(active=True).select_related("view"):
+            entry = {
+                "file": str(
+                    Path(zone.view.name.replace(os.sep, "_")) / f"{zone.name}.db"
+                ),
+                "soa_serial": zone.soa_serial,
+            }
+            exported[str(zone.pk)] = entry
+
+            if (
+                not options.get("force")
+                and manifest.get(str(zone.pk)) == entry
+                and (base_path / entry["file"]).exists()
+            ):
+                continue
+
+            exports.append((zone, entry))
+
+        if options.get("verbosity") >= 2:
+            self.stdout.write(
+                f"Exporting {len(exports)} of {len(exported)} active zones to {base_path}"
+            )
+
+        if options.get("workers") > 1 and len(exports) > 1:
+            connections.close_all()
+            with ProcessPoolExecutor(
+                max_workers=options.get("workers"),
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_init_worker,
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        _export_zone, zone.pk, str(base_path / entry["file"])
+                    ): (zone, entry)
+                    for zone, entry in exports
+                }
+                for future in as_completed(futures):
+                    self._report_zone(
+                        *futures[future],
+                        future.exception() or future.result(),
+                        manifest,
+                        **options,
+                    )
+        else:
+            for zone, entry in exports:
+                try:
+                    result = _export_zone(zone.pk, base_path / entry["file"])
+                except Exception as exc:
+                    result = exc
+
+                self._report_zone(zone, entry, result, manifest, **options)
+
+        # +
+        # Remove the files of zones that are no longer exported or have been
+        # exported to a different file.
+        # -
+        stale_files = set()
+        for zone_pk, entry in previous_manifest.items():
+            if zone_pk not in exported:
+                del manifest[zone_pk]
+            elif manifest[zone_pk]["file"] == entry["file"]:
+                continue
+
+            stale_files.add(entry["file"])
+
+        for stale_file in stale_files - {entry["file"] for entry in manifest.values()}:
+            with suppress(FileNotFoundError):
+                (base_path / stale_file).unlink()
+
+            if options.get("verbosity") >= 2:
+                self.stdout.write(f"Removed stale zone file {stale_file}")
+
+        _write_file(
+            manifest_path, [json.dumps({"zones": manifest}, indent=2, sort_keys=True)]
+        )
+
+        if options.get("verbosity") >= 2:
+            self.stdout.write(
+                f"Zone export completed in {time.monotonic() - start:.2f}s"
+            )
+
+    def _load_manifest(self, manifest_path):
+        try:
+            with open(manifest_path, encoding="utf-8") as manifest_file:
+                return json.load(manifest_file).get("zones", {})
+        except FileNotFoundError:
+            return {}
+        except (ValueError, AttributeError, OSError) as exc:
+            self.stderr.write(f"Ignoring invalid manifest {manifest_path}: {exc}")
+            return {}
+
+    def _report_zone(self, zone, entry, result, manifest, **options):
+        if isinstance(result, Exception):
+            self.stderr.write(f"Could not export zone {zone}: {result}")
+            return
+
+        manifest[str(zone.pk)] = {**entry, "soa_serial": result}
+
+        if options.get("verbosity") >= 1:
+            self.stdout.write(f"Exported zone {zone} to {entry['file']}")
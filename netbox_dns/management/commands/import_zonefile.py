@@ -0,0 +1,184 @@
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+from django.core.exceptions import ValidationError
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+
+from netbox_dns.models import Record, View
+from netbox_dns.utilities import import_zone, read_zone_file
+
+
+def _init_worker():
+    connections.close_all()
+
+
+def _import_file(file_path, view_pk, origin, **options):
+    start = time.monotonic()
+
+    try:
+        zone, errors = import_zone(
+            read_zone_file(file_path, origin=origin),
+            View.objects.get(pk=view_pk),
+            default_ttl=options.get("default_ttl"),
+            disable_ptr=options.get("disable_ptr"),
+            ignore_errors=options.get("ignore_errors"),
+        )
+    except ValidationError as exc:
+        return {"zone": None, "errors": exc.messages}
+
+    return {
+        "zone": str(zone) if zone is not None else None,
+        "records": (
+            Record.objects.filter(zone=zone, managed=False).count()
+            if zone is not None
+            else 0
+        ),
+        "errors": [
+            f"{error['name']} {error['type']} {error['value']}: "
+            + ", ".join(
+                message for messages in error["errors"].values() for message in messages
+            )
+            for error in errors
+        ],
+        "time": time.monotonic() - start,
+    }
+
+
+class Command(BaseCommand):
+    help = "Import zones from zone files"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "paths",
+            nargs="+",
+            help="Zone files or directories containing zone files",
+        )
+        parser.add_argument(
+            "--view",
+            help="Name of the view the zones are created in (default: default view)",
+        )
+        parser.add_argument(
+            "--origin",
+            help="Zone name for a single zone file without $ORIGIN",
+        )
+        parser.add_argument(
+            "--suffix",
+            default=".db",
+            help=(
+                "Suffix of the zone files in directories, the zone name is the file "
+                "name without the suffix if the file has no $ORIGIN (default: .db)"
+            ),
+        )
+        parser.add_argument(
+            "--default-ttl",
+            type=int,
+            help="Default TTL of the zones (default: zone_default_ttl setting)",
+        )
+        parser.add_argument(
+            "--disable-ptr",
+            action="store_true",
+            help="Disable automatic creation of PTR records for address records",
+        )
+        parser.add_argument(
+            "--ignore-errors",
+            action="store_true",
+            help="Create zones even if some of their records cannot be imported",
+        )
+        parser.add_argument(
+            "--jobs",
+            type=int,
+            default=1,
+            help="Number of zone files imported in parallel (default: 1)",
+        )
+
+    def handle(self, *model_names, **options):
+        start = time.monotonic()
+
+        if options.get("view") is not None:
+            try:
+                view = View.objects.get(name=options.get("view"))
+            except View.DoesNotExist:
+                raise CommandError(f"View {options.get('view')} does not exist")
+        else:
+            view = View.get_default_view()
+
+        files = []
+        for path in map(Path, options.get("paths")):
+            if path.is_dir():
+                files.extend(
+                    (file_path, file_path.name.removesuffix(options.get("suffix")))
+                    for file_path in sorted(path.rglob(f"*{options.get('suffix')}"))
+                    if file_path.is_file()
+                )
+            elif path.is_file():
+                files.append((path, options.get("origin")))
+            else:
+                raise CommandError(f"Zone file {path} does not exist")
+
+        if options.get("origin") is not None and len(files) > 1:
+            raise CommandError("--origin can only be used with a single zone file")
+
+        if options.get("verbosity") >= 2:
+            self.stdout.write(f"Importing {len(files)} zone files into view {view}")
+
+        import_options = {
+            option: options.get(option)
+            for option in ("default_ttl", "disable_ptr", "ignore_errors")
+        }
+
+        if options.get("jobs") > 1 and len(files) > 1:
+            connections.close_all()
+            with ProcessPoolExecutor(
+                max_workers=options.get("jobs"),
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_init_worker,
+            ) as executor:
+                futures = {
+                    executor.submit(
+                        _import_file, str(file_path), view.pk, origin, **import_options
+                    ): file_path
+                    for file_path, origin in files
+                }
+                for future in as_completed(futures):
+                    self._report_file(
+                        futures[future],
+                        future.exception() or future.result(),
+                        **options,
+                    )
+        else:
+            for file_path, origin in files:
+                try:
+                    result = _import_file(
+                        str(file_path), view.pk, origin, **import_options
+                    )
+                except Exception as exc:
+                    result = exc
+
+                self._report_file(file_path, result, **options)
+
+        if options.get("verbosity") >= 2:
+            self.stdout.write(
+                f"Zone import completed in {time.monotonic() - start:.2f}s"
+            )
+
+    def _report_file(self, file_path, result, **options):
+        if isinstance(result, Exception):
+            self.stderr.write(f"Could not import zone file {file_path}: {result}")
+            return
+
+        for error in result["errors"]:
+            self.stderr.write(f"{file_path}: {error}")
+
+        if result["zone"] is None:
+            self.stderr.write(f"Could not import zone file {file_path}")
+            return
+
+        if options.get("verbosity") >= 1:
+            self.stdout.write(
+                f"Imported zone {result['zone']} from {file_path}: "
+                f"{result['records']} records, {len(result['errors'])} errors "
+                f"in {result['time']:.2f}s"
+            )
@@ -1,23 +1,134 @@
+import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
 from django.core.management.base import BaseCommand
+from django.db import connections
 
 from ipam.models import IPAddress
 
-from netbox_dns.utilities import update_dns_records, get_zones
+from netbox_dns.utilities import (
+    DNSsyncEngine,
+    partition_ip_addresses,
+    prefix_view_tree,
+)
+
+_engine = None
+
+
+def _init_worker():
+    global _engine
+
+    connections.close_all()
+    _engine = DNSsyncEngine()
+
+
+def _sync_chunk(pks):
+    start = time.monotonic()
+    result = _engine.sync(
+        IPAddress.objects.filter(pk__in=pks).select_related("vrf").order_by("pk")
+    )
+    result["addresses"] = len(pks)
+    result["time"] = time.monotonic() - start
+
+    result["changed_addresses"] = [
+        f"{ip_address}, VRF {ip_address.vrf}"
+        for ip_address in result["changed_addresses"]
+    ]
+    result["errors"] = [
+        (f"{ip_address}, VRF {ip_address.vrf}", exc.messages)
+        for ip_address, exc in result["errors"]
+    ]
+
+    return result
 
 
 class Command(BaseCommand):
     help = "Rebuild DNSsync relationships between IP addresses and records"
 
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of worker processes (default: 1)",
+        )
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=1000,
+            help="Number of IP addresses processed per chunk (default: 1000)",
+        )
+        parser.add_argument(
+            "--partition",
+            choices=("none", "vrf", "prefix"),
+            default="none",
+            help="Partition the IP addresses by VRF or by top-level prefix",
+        )
+
     def handle(self, *model_names, **options):
-        ip_addresses = IPAddress.objects.all()
-        for ip_address in ip_addresses:
-            if options.get("verbosity") >= 2:
-                self.stdout.write(
-                    f"Updating DNS records for IP Address {ip_address}, VRF {ip_address.vrf}"
-                )
+        start = time.monotonic()
+
+        chunks = [
+            (label, index, len(partition_chunks), pks)
+            for label, partition_chunks in partition_ip_addresses(
+                partition=options.get("partition"),
+                chunk_size=options.get("chunk_size"),
+            )
+            for index, pks in enumerate(partition_chunks, start=1)
+        ]
+
+        if options.get("verbosity") >= 2:
+            self.stdout.write(
+                f"Rebuilding DNSsync for {sum(len(chunk[3]) for chunk in chunks)} "
+                f"IP addresses in {len(chunks)} chunks"
+            )
+
+        if options.get("workers") > 1:
+            connections.close_all()
+            with ProcessPoolExecutor(
+                max_workers=options.get("workers"),
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_init_worker,
+            ) as executor:
+                results = executor.map(_sync_chunk, [chunk[3] for chunk in chunks])
+                for chunk, result in zip(chunks, results):
+                    self._report_chunk(chunk, result, **options)
+        else:
+            global _engine
+
+            _engine = DNSsyncEngine()
+            for chunk in chunks:
+                self._report_chunk(chunk, _sync_chunk(chunk[3]), **options)
+
             if options.get("verbosity") >= 3:
-                self.stdout.write(f"  Zones: {get_zones(ip_address)}")
-            if update_dns_records(ip_address) and options.get("verbosity") >= 1:
+                stats = prefix_view_tree.stats
                 self.stdout.write(
-                    f"Updated DNS records for IP Address {ip_address}, VRF {ip_address.vrf}"
+                    f"Prefix view tree: {stats['hits']} hits, {stats['misses']} misses, "
+                    f"{stats['rebuilds']} rebuilds"
                 )
+
+        if options.get("verbosity") >= 2:
+            self.stdout.write(
+                f"DNSsync rebuild completed in {time.monotonic() - start:.2f}s"
+            )
+
+    def _report_chunk(self, chunk, result, **options):
+        label, index, count, pks = chunk
+
+        for address, messages in result["errors"]:
+            self.stderr.write(
+                f"Could not update DNS records for IP Address {address}: "
+                f"{', '.join(messages)}"
+            )
+
+        if options.get("verbosity") >= 1:
+            for address in result["changed_addresses"]:
+                self.stdout.write(f"Updated DNS records for IP Address {address}")
+
+            self.stdout.write(
+                f"{label}, chunk {index}/{count}: {result['addresses']} IP addresses, "
+                f"{result['created']} records created, {result['updated']} updated, "
+                f"{result['deleted']} deleted, {len(result['errors'])} errors "
+                f"in {result['time']:.2f}s"
+            )
@@ -0,0 +1,61 @@
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from netbox_dns.utilities import rebuild_effective_views, verify_effective_views
+
+
+class Command(BaseCommand):
+    help = "Rebuild or verify the effective DNS views of IPAM prefixes"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--verify",
+            action="store_true",
+            help="Only compare the effective views with the view assignments",
+        )
+
+    def handle(self, *model_names, **options):
+        start = time.monotonic()
+
+        if options.get("verify"):
+            self._verify(**options)
+        else:
+            result = rebuild_effective_views()
+
+            if options.get("verbosity") >= 1:
+                self.stdout.write(
+                    f"Effective views rebuilt: {result['created']} entries created, "
+                    f"{result['deleted']} deleted"
+                )
+
+        if options.get("verbosity") >= 2:
+            self.stdout.write(f"Completed in {time.monotonic() - start:.2f}s")
+
+    def _verify(self, **options):
+        differences = verify_effective_views()
+
+        for prefix, expected, actual in differences:
+            self.stderr.write(
+                f"Prefix {prefix}, VRF {prefix.vrf}: expected views "
+                f"{self._format_views(expected)}, found {self._format_views(actual)}"
+            )
+
+        if differences:
+            raise CommandError(
+                f"Effective views differ for {len(differences)} prefixes, "
+                "run rebuild_effective_views to fix them"
+            )
+
+        if options.get("verbosity") >= 1:
+            self.stdout.write("Effective views are consistent with view assignments")
+
+    @staticmethod
+    def _format_views(views):
+        if not views:
+            return "none"
+
+        return ", ".join(
+            f"{view_id}{' (inherited)' if inherited else ''}"
+            for view_id, inherited in sorted(views)
+        )
@@ -0,0 +1,69 @@
+from django.core.management.base import BaseCommand, CommandError
+
+from core.choices import JobStatusChoices
+from core.models import Job
+
+from netbox_dns.jobs import DNSsyncJob
+
+
+class Command(BaseCommand):
+    help = "Resume interrupted DNSsync background jobs"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "job_ids",
+            nargs="*",
+            type=int,
+            help="IDs of the jobs to resume, including jobs still marked as running "
+            "(default: all errored and failed jobs)",
+        )
+
+    def handle(self, *model_names, **options):
+        jobs = Job.objects.filter(name=DNSsyncJob.name).order_by("pk")
+
+        if job_ids := options.get("job_ids"):
+            jobs = jobs.filter(pk__in=job_ids)
+            if missing_ids := set(job_ids) - set(jobs.values_list("pk", flat=True)):
+                raise CommandError(
+                    f"DNSsync jobs not found: {', '.join(str(pk) for pk in sorted(missing_ids))}"
+                )
+        else:
+            jobs = jobs.filter(
+                status__in=(
+                    JobStatusChoices.STATUS_ERRORED,
+                    JobStatusChoices.STATUS_FAILED,
+                )
+            )
+
+        for job in jobs:
+            data = job.data or {}
+
+            if "cursor" not in data:
+                self.stderr.write(
+                    f"Job {job.pk}: No progress data, the job cannot be resumed"
+                )
+                continue
+
+            if "resumed_by" in data:
+                if options.get("verbosity") >= 2:
+                    self.stdout.write(
+                        f"Job {job.pk}: Already resumed as job {data['resumed_by']}"
+                    )
+                continue
+
+            if data["processed"] >= data["total"]:
+                if options.get("verbosity") >= 2:
+                    self.stdout.write(f"Job {job.pk}: Nothing left to resume")
+                continue
+
+            try:
+                new_job = DNSsyncJob.resume(job)
+            except ValueError as exc:
+                self.stderr.write(f"Job {job.pk}: {exc}")
+                continue
+
+            if options.get("verbosity") >= 1:
+                self.stdout.write(
+                    f"Job {job.pk}: Resumed as job {new_job.pk} at "
+                    f"{data['processed']} of {data['total']} IP addresses"
+                )
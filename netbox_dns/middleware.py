@@ -0,0 +1,104 @@
+from django.contrib import messages
+from django.core.exceptions import MiddlewareNotUsed, ValidationError
+from django.http import JsonResponse
+
+from netbox.plugins.utils import get_plugin_config
+from netbox.views.generic import BulkEditView, BulkImportView
+from core.signals import clear_events
+from ipam.models import IPAddress
+
+from netbox_dns.utilities import dnssync_batch
+
+__all__ = ("DNSsyncBatchMiddleware",)
+
+
+def _get_model(view_class):
+    return getattr(getattr(view_class, "queryset", None), "model", None)
+
+
+def _discard_messages(request, count):
+    """
+    Discard the messages queued after the first `count` messages, which were
+    queued by a view whose changes have been rolled back.
+    """
+    storage = messages.get_messages(request)
+
+    for message in list(storage)[:count]:
+        messages.add_message(
+            request, message.level, message.message, extra_tags=message.extra_tags
+        )
+
+
+class DNSsyncBatchMiddleware:
+    """
+    Run bulk imports and bulk edits of IP addresses in the GUI and bulk
+    operations on IP addresses in the REST API in a DNSsync batch, so the
+    address records are synchronized once for all IP addresses when the
+    operation is complete.
+
+    Batching is enabled with the `dnssync_batch_bulk_operations` setting.
+    """
+
+    def __init__(self, get_response):
+        if get_plugin_config("netbox_dns", "dnssync_disabled"):
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+
+    def __call__(self, request):
+        return self.get_response(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        if request.method not in ("POST", "PUT", "PATCH"):
+            return None
+
+        if not get_plugin_config("netbox_dns", "dnssync_batch_bulk_operations"):
+            return None
+
+        if (view_class := getattr(view_func, "view_class", None)) is not None:
+            api = False
+        elif (view_class := getattr(view_func, "cls", None)) is not None:
+            api = True
+        else:
+            return None
+
+        if _get_model(view_class) is not IPAddress:
+            return None
+
+        if api:
+            # +
+            # Bulk operations in the REST API are requests with a list of
+            # objects in the body.
+            # -
+            if request.content_type != "application/json" or not (
+                request.body.lstrip().startswith(b"[")
+            ):
+                return None
+        elif not issubclass(view_class, (BulkImportView, BulkEditView)):
+            return None
+
+        message_count = len(messages.get_messages(request))
+
+        try:
+            with dnssync_batch():
+                return view_func(request, *view_args, **view_kwargs)
+        except ValidationError as exc:
+            # +
+            # The changes made by the view have been rolled back, so the
+            # events and messages it queued are discarded.
+            # -
+            clear_events.send(sender=self.__class__)
+
+            if api:
+                return JsonResponse({"dns_name": exc.messages}, status=400)
+
+            # +
+            # The IP addresses are validated individually before they are
+            # saved, so this only happens if the records of several IP
+            # addresses in the batch conflict with each other. Running the
+            # view again without a batch makes it report the error for the
+            # object causing it, in the same way as without batching.
+            # -
+            _discard_messages(request, message_count)
+
+            return view_func(request, *view_args, **view_kwargs)
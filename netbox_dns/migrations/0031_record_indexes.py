@@ -0,0 +1,45 @@
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        (
+            "netbox_dns",
+            "0030_dnsseckeytemplate_comments_dnsseckeytemplate_owner_and_more",
+        ),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="record",
+            index=models.Index(
+                fields=["zone", "name", "type"], name="netbox_dns_record_zone_name"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="record",
+            index=models.Index(
+                models.F("zone"),
+                django.db.models.functions.text.Lower("name"),
+                models.F("type"),
+                name="netbox_dns_record_zone_name_ci",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="record",
+            index=models.Index(
+                fields=["type", "ip_address"], name="netbox_dns_record_type_ip"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="record",
+            index=django.contrib.postgres.indexes.GistIndex(
+                fields=["ip_address"],
+                name="netbox_dns_record_ip_gist",
+                opclasses=["inet_ops"],
+            ),
+        ),
+    ]
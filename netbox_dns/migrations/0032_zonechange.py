@@ -0,0 +1,51 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("netbox_dns", "0031_record_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="zone",
+            name="journal_retention",
+            field=models.PositiveIntegerField(blank=True, null=True),
+        ),
+        migrations.CreateModel(
+            name="ZoneChange",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False
+                    ),
+                ),
+                ("serial", models.BigIntegerField(null=True)),
+                ("previous_serial", models.BigIntegerField(null=True)),
+                ("action", models.CharField(max_length=10)),
+                ("name", models.CharField(blank=True, max_length=255)),
+                ("ttl", models.PositiveIntegerField(null=True)),
+                ("type", models.CharField(blank=True, max_length=10)),
+                ("value", models.CharField(blank=True, max_length=65535)),
+                (
+                    "zone",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="netbox_dns.zone",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("zone", "serial", "pk"),
+                "indexes": [
+                    models.Index(
+                        fields=["zone", "serial"], name="netbox_dns_zonechange_serial"
+                    )
+                ],
+            },
+        ),
+    ]
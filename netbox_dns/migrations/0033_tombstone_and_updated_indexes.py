@@ -0,0 +1,56 @@
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("contenttypes", "0002_remove_content_type_name"),
+        ("netbox_dns", "0032_zonechange"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="record",
+            index=models.Index(
+                fields=["last_updated", "id"], name="netbox_dns_record_updated"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="zone",
+            index=models.Index(
+                fields=["last_updated", "id"], name="netbox_dns_zone_updated"
+            ),
+        ),
+        migrations.CreateModel(
+            name="Tombstone",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False
+                    ),
+                ),
+                ("object_id", models.BigIntegerField()),
+                ("zone_id", models.BigIntegerField(null=True)),
+                ("deleted", models.DateTimeField()),
+                (
+                    "object_type",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="contenttypes.contenttype",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("deleted", "pk"),
+                "indexes": [
+                    models.Index(
+                        fields=["object_type", "deleted", "id"],
+                        name="netbox_dns_tombstone_deleted",
+                    )
+                ],
+            },
+        ),
+    ]
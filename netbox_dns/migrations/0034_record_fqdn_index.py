@@ -0,0 +1,15 @@
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("netbox_dns", "0033_tombstone_and_updated_indexes"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="record",
+            index=models.Index(fields=["fqdn"], name="netbox_dns_record_fqdn"),
+        ),
+    ]
@@ -0,0 +1,118 @@
+from collections import defaultdict
+
+from netaddr import IPNetwork
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def _network_key(network, prefixlen):
+    return network.value >> (network.max_prefixlen - prefixlen)
+
+
+def populate_effective_views(apps, schema_editor):
+    """
+    Compute the effective views of all prefixes with the same longest prefix
+    match as `netbox_dns.utilities.compute_effective_views()`, which is not
+    used here so the migration does not depend on the current code.
+    """
+    Prefix = apps.get_model("ipam", "Prefix")
+    View = apps.get_model("netbox_dns", "View")
+    EffectiveView = apps.get_model("netbox_dns", "EffectiveView")
+
+    view_ids = defaultdict(set)
+    levels = defaultdict(lambda: defaultdict(dict))
+
+    for prefix_pk, vrf_id, prefix, view_id in View.prefixes.through.objects.values_list(
+        "prefix_id", "prefix__vrf_id", "prefix__prefix", "view_id"
+    ).iterator():
+        network = IPNetwork(prefix)
+        view_ids[prefix_pk].add(view_id)
+
+        level = levels[(vrf_id, network.version)][network.prefixlen]
+        key = _network_key(network, network.prefixlen)
+        if level.get(key, 0) < prefix_pk:
+            level[key] = prefix_pk
+
+    lengths = {
+        family: sorted(prefixlens.keys(), reverse=True)
+        for family, prefixlens in levels.items()
+    }
+
+    def get_effective_views(prefix_pk, vrf_id, prefix):
+        if prefix_pk in view_ids:
+            return view_ids[prefix_pk], False
+
+        network = IPNetwork(prefix)
+        family = (vrf_id, network.version)
+
+        for prefixlen in lengths.get(family, ()):
+            if prefixlen >= network.prefixlen:
+                continue
+
+            parent_pk = levels[family][prefixlen].get(_network_key(network, prefixlen))
+            if parent_pk is not None:
+                return view_ids[parent_pk], True
+
+        return set(), False
+
+    effective_views = []
+    for prefix_pk, vrf_id, prefix in Prefix.objects.values_list(
+        "pk", "vrf_id", "prefix"
+    ).iterator():
+        prefix_view_ids, inherited = get_effective_views(prefix_pk, vrf_id, prefix)
+        effective_views.extend(
+            EffectiveView(prefix_id=prefix_pk, view_id=view_id, inherited=inherited)
+            for view_id in prefix_view_ids
+        )
+
+    EffectiveView.objects.bulk_create(effective_views, batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("ipam", "0081_remove_service_device_virtual_machine_add_parent_gfk_index"),
+        ("netbox_dns", "0034_record_fqdn_index"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="EffectiveView",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True, primary_key=True, serialize=False
+                    ),
+                ),
+                ("inherited", models.BooleanField(default=False)),
+                (
+                    "prefix",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="ipam.prefix",
+                    ),
+                ),
+                (
+                    "view",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="+",
+                        to="netbox_dns.view",
+                    ),
+                ),
+            ],
+            options={
+                "ordering": ("prefix", "view"),
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("prefix", "view"),
+                        name="netbox_dns_effectiveview_unique",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(populate_effective_views, migrations.RunPython.noop),
+    ]
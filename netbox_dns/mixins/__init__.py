@@ -1 +1,3 @@
 from .object_modification import *
+from .deferred_serials import *
+from .changes_feed import *
@@ -0,0 +1,100 @@
+import time
+
+from django.contrib.contenttypes.models import ContentType
+from django.utils.translation import gettext as _
+from rest_framework import serializers, status
+from rest_framework.decorators import action
+from rest_framework.response import Response
+
+from netbox.plugins.utils import get_plugin_config
+
+from netbox_dns.utilities import (
+    FeedCursorError,
+    FeedCursorExpired,
+    get_changes,
+)
+
+__all__ = ("ChangesFeedMixin",)
+
+FEED_POLL_INTERVAL = 1
+FEED_DEFAULT_LIMIT = 1000
+FEED_MAX_TIMEOUT = 10
+
+
+class ChangesFeedMixin:
+    """
+    Mixin for API viewsets providing a feed of the objects changed and deleted
+    since an opaque cursor returned by the previous call.
+
+    If no changes are available, the request blocks for up to `timeout`
+    seconds until changes occur. The timeout is limited to a few seconds, as
+    a waiting request occupies a worker.
+    """
+
+    def get_feed_tombstones(self):
+        from netbox_dns.models import Tombstone
+
+        return Tombstone.objects.filter(
+            object_type=ContentType.objects.get_for_model(self.queryset.model)
+        )
+
+    def _get_int_param(self, request, name, default, minimum, maximum):
+        try:
+            value = int(request.query_params.get(name, default))
+        except ValueError:
+            raise serializers.ValidationError(
+                _("The '{name}' query parameter must be an integer").format(name=name)
+            )
+
+        return max(minimum, min(value, maximum))
+
+    @action(detail=False, methods=["get"], url_path="changes")
+    def changes(self, request):
+        limit = self._get_int_param(
+            request, "limit", FEED_DEFAULT_LIMIT, 1, FEED_DEFAULT_LIMIT
+        )
+        timeout = self._get_int_param(
+            request,
+            "timeout",
+            0,
+            0,
+            min(
+                get_plugin_config("netbox_dns", "changes_feed_max_timeout"),
+                FEED_MAX_TIMEOUT,
+            ),
+        )
+        cursor = request.query_params.get("cursor")
+
+        queryset = self.filter_queryset(self.get_queryset())
+        tombstones = self.get_feed_tombstones()
+        deadline = time.monotonic() + timeout
+
+        while True:
+            try:
+                changes = get_changes(queryset, tombstones, cursor, limit=limit)
+            except FeedCursorExpired as exc:
+                return Response({"detail": str(exc)}, status=status.HTTP_410_GONE)
+            except FeedCursorError as exc:
+                raise serializers.ValidationError(str(exc))
+
+            remaining = deadline - time.monotonic()
+            if changes["changed"] or changes["deleted"] or remaining <= 0:
+                break
+
+            time.sleep(min(FEED_POLL_INTERVAL, remaining))
+
+        return Response(
+            {
+                "cursor": changes["cursor"],
+                "more": changes["more"],
+                "changed": self.get_serializer(changes["changed"], many=True).data,
+                "deleted": [
+                    {
+                        "id": tombstone.object_id,
+                        "zone": tombstone.zone_id,
+                        "deleted": tombstone.deleted,
+                    }
+                    for tombstone in changes["deleted"]
+                ],
+            }
+        )
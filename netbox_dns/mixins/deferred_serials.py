@@ -0,0 +1,17 @@
+from netbox_dns.utilities import deferred_serials
+
+__all__ = ("DeferredSerialsMixin",)
+
+
+class DeferredSerialsMixin:
+    """
+    Mixin for views and API viewsets coalescing the SOA serial updates for all
+    zones changed by a request into one update per zone.
+    """
+
+    def dispatch(self, request, *args, **kwargs):
+        if request.method in ("GET", "HEAD", "OPTIONS"):
+            return super().dispatch(request, *args, **kwargs)
+
+        with deferred_serials():
+            return super().dispatch(request, *args, **kwargs)
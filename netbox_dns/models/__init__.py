@@ -8,3 +8,6 @@ from .zone_template import *
 from .record_template import *
 from .dnssec_key_template import *
 from .dnssec_policy import *
+from .zone_change import *
+from .tombstone import *
+from .effective_view import *
@@ -0,0 +1,51 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+__all__ = ("EffectiveView",)
+
+
+class EffectiveView(models.Model):
+    """
+    Effective DNS view of an IPAM prefix.
+
+    A prefix has the views assigned to it directly or, if there are none,
+    inherits the views of the closest parent prefix in the same VRF that has
+    views assigned. The table is maintained by the DNSsync signal handlers and
+    can be rebuilt with the `rebuild_effective_views` management command.
+    """
+
+    class Meta:
+        verbose_name = _("Effective View")
+        verbose_name_plural = _("Effective Views")
+
+        ordering = (
+            "prefix",
+            "view",
+        )
+
+        constraints = [
+            models.UniqueConstraint(
+                fields=["prefix", "view"],
+                name="netbox_dns_effectiveview_unique",
+            ),
+        ]
+
+    prefix = models.ForeignKey(
+        verbose_name=_("Prefix"),
+        to="ipam.Prefix",
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    view = models.ForeignKey(
+        verbose_name=_("View"),
+        to="View",
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    inherited = models.BooleanField(
+        verbose_name=_("Inherited"),
+        default=False,
+    )
+
+    def __str__(self):
+        return f"{self.prefix_id} {self.view_id}"
@@ -14,6 +14,7 @@ from netbox.plugins.utils import get_plugin_config
 from netbox_dns.utilities import (
     name_to_unicode,
     normalize_name,
+    reset_zone_changes,
     NameFormatError,
 )
 from netbox_dns.choices import RecordTypeChoices
@@ -130,6 +131,8 @@ class NameServer(ObjectModificationMixin, ContactsMixin, PrimaryModel):
                     Q(type=RecordTypeChoices.NS),
                 ).delete()
 
+            reset_zone_changes(self.zones.values_list("pk", flat=True))
+
             super().delete(*args, **kwargs)
 
 
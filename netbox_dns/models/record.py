@@ -5,9 +5,11 @@ import dns
 from dns import name as dns_name
 from dns import rdata
 
+from django.contrib.postgres.indexes import GistIndex
 from django.core.exceptions import ValidationError
 from django.db import models
 from django.db.models import Q, ExpressionWrapper, BooleanField, Min
+from django.db.models.functions import Lower
 from django.conf import settings
 from django.utils.translation import gettext_lazy as _
 from django.core.validators import MaxValueValidator
@@ -19,7 +21,13 @@ from netbox.plugins.utils import get_plugin_config
 from utilities.querysets import RestrictedQuerySet
 
 from netbox_dns.fields import AddressField
-from netbox_dns.utilities import arpa_to_prefix, name_to_unicode, check_filter
+from netbox_dns.utilities import (
+    arpa_to_prefix,
+    name_to_unicode,
+    ip_address_filter_cache,
+    journal_record_change,
+    commit_zone_changes,
+)
 from netbox_dns.validators import validate_generic_name, validate_record_value
 from netbox_dns.mixins import ObjectModificationMixin
 from netbox_dns.choices import (
@@ -36,6 +44,22 @@ __all__ = (
 ZONE_ACTIVE_STATUS_LIST = get_plugin_config("netbox_dns", "zone_active_status")
 RECORD_ACTIVE_STATUS_LIST = get_plugin_config("netbox_dns", "record_active_status")
 
+# +
+# Checks run by Record.save() for saves restricted to the listed fields, see
+# Record.clean_update_fields()
+# -
+UPDATE_FIELD_CHECKS = {
+    "fqdn": set(),
+    "ip_address": set(),
+    "ptr_record": set(),
+    "rfc2317_cname_record": set(),
+    "ipam_ip_address": set(),
+    "last_updated": set(),
+    "ttl": {"fields"},
+    "disable_ptr": {"fields", "conflicting_records"},
+    "status": {"fields", "unique_record", "conflicting_records"},
+}
+
 
 def min_ttl(*ttl_list):
     return min((ttl for ttl in ttl_list if ttl is not None), default=None)
@@ -50,9 +74,7 @@ def record_data_from_ip_address(ip_address, zone):
         # -
         return None
 
-    if zone.view.ip_address_filter is not None and not check_filter(
-        ip_address, zone.view.ip_address_filter
-    ):
+    if not ip_address_filter_cache.check(ip_address, zone.view):
         return None
 
     data = {
@@ -121,6 +143,36 @@ class Record(ObjectModificationMixin, ContactsMixin, PrimaryModel):
             "status",
         )
 
+        indexes = [
+            models.Index(
+                fields=["zone", "name", "type"],
+                name="netbox_dns_record_zone_name",
+            ),
+            models.Index(
+                "zone",
+                Lower("name"),
+                "type",
+                name="netbox_dns_record_zone_name_ci",
+            ),
+            models.Index(
+                fields=["type", "ip_address"],
+                name="netbox_dns_record_type_ip",
+            ),
+            GistIndex(
+                fields=["ip_address"],
+                name="netbox_dns_record_ip_gist",
+                opclasses=["inet_ops"],
+            ),
+            models.Index(
+                fields=["last_updated", "id"],
+                name="netbox_dns_record_updated",
+            ),
+            models.Index(
+                fields=["fqdn"],
+                name="netbox_dns_record_fqdn",
+            ),
+        ]
+
     objects = RecordManager()
     raw_objects = RestrictedQuerySet.as_manager()
 
@@ -408,6 +460,25 @@ class Record(ObjectModificationMixin, ContactsMixin, PrimaryModel):
             ):
                 return
 
+            # +
+            # If only the TTL differs and the PTR record is used exclusively by
+            # the address record, only the TTL needs to be updated.
+            # -
+            if (
+                ptr_record.zone == ptr_zone
+                and ptr_record.name == ptr_name
+                and ptr_record.value == ptr_value
+                and ptr_record.address_records.count() == 1
+            ):
+                ptr_record.snapshot()
+                ptr_record.ttl = self.ttl
+                ptr_record.save(
+                    update_fields=["ttl", "last_updated"],
+                    update_rfc2317_cname=update_rfc2317_cname,
+                    save_zone_serial=save_zone_serial,
+                )
+                return
+
             # +
             # If the existing PTR record no longer matches the address record,
             # check whether there is an existing PTR record that does. In that
@@ -697,8 +768,8 @@ class Record(ObjectModificationMixin, ContactsMixin, PrimaryModel):
         if new_zone is None:
             new_zone = self.zone
 
-        records = new_zone.records.filter(
-            name__iexact=self.name,
+        records = new_zone.records.alias(name_ci=Lower("name")).filter(
+            name_ci=self.name.lower(),
             type=self.type,
             value=self.value,
             status__in=RECORD_ACTIVE_STATUS_LIST,
@@ -890,6 +961,13 @@ class Record(ObjectModificationMixin, ContactsMixin, PrimaryModel):
         if not self.is_active:
             return
 
+        self.check_conflicting_records()
+
+        super().clean(*args, **kwargs)
+
+    clean.alters_data = True
+
+    def check_conflicting_records(self):
         records = self.zone.records.filter(name=self.name, active=True).exclude(
             pk=self.pk
         )
@@ -969,9 +1047,80 @@ class Record(ObjectModificationMixin, ContactsMixin, PrimaryModel):
                     }
                 )
 
-        super().clean(*args, **kwargs)
+    def get_journal_rr(self, saved=False):
+        """
+        Return the name, TTL, type and value of the record as it is published
+        in the zone, or None if the record is not published. If `saved` is
+        True, the values last saved to the database are used.
+        """
+        fields = ("status", "name", "ttl", "type", "value")
+        if saved:
+            status, name, ttl, rr_type, value = map(self.get_saved_value, fields)
+        else:
+            status, name, ttl, rr_type, value = (
+                getattr(self, field) for field in fields
+            )
 
-    clean.alters_data = True
+        if (
+            status not in RECORD_ACTIVE_STATUS_LIST
+            or rr_type == RecordTypeChoices.SOA
+            or rr_type in RecordTypeChoices.CUSTOM_TYPES
+        ):
+            return None
+
+        return (name, ttl, rr_type, value)
+
+    def clean_update_fields(self, update_fields):
+        """
+        Validate the record for a save restricted to `update_fields`.
+
+        Only the checks that can be affected by the fields being updated are
+        run. If any field not listed below is updated, the record is fully
+        validated using `full_clean()`.
+
+        ====================  ================================================
+        Field                 Checks
+        ====================  ================================================
+        fqdn                  none (derived from name and zone)
+        ip_address            none (derived from type and value or name)
+        ptr_record            none (maintained by NetBox DNS)
+        rfc2317_cname_record  none (maintained by NetBox DNS)
+        ipam_ip_address       none (maintained by IPAM DNSsync)
+        last_updated          none
+        ttl                   field validation
+        disable_ptr           field validation, conflicting records
+        status                field validation, unique records, conflicting
+                              records
+        ====================  ================================================
+        """
+        update_fields = set(update_fields)
+
+        if update_fields - set(UPDATE_FIELD_CHECKS):
+            self.full_clean()
+            return
+
+        checks = set().union(*(UPDATE_FIELD_CHECKS[field] for field in update_fields))
+
+        if "fields" in checks:
+            super().clean_fields(
+                exclude=[
+                    field.name
+                    for field in self._meta.fields
+                    if field.name not in update_fields
+                ]
+            )
+
+        if "unique_record" in checks:
+            self.check_unique_record()
+
+        if "conflicting_records" in checks:
+            if not self.is_address_record:
+                self.disable_ptr = False
+
+            if self.is_active:
+                self.check_conflicting_records()
+
+    clean_update_fields.alters_data = True
 
     def save(
         self,
@@ -981,7 +1130,10 @@ class Record(ObjectModificationMixin, ContactsMixin, PrimaryModel):
         update_rrset_ttl=True,
         **kwargs,
     ):
-        self.full_clean()
+        if kwargs.get("update_fields") is not None and not self._state.adding:
+            self.clean_update_fields(kwargs["update_fields"])
+        else:
+            self.full_clean()
 
         if not self._state.adding and update_rrset_ttl:
             self.update_rrset_ttl()
@@ -1011,8 +1163,32 @@ class Record(ObjectModificationMixin, ContactsMixin, PrimaryModel):
 
         changed_fields = self.changed_fields
         if changed_fields is None or changed_fields:
+            if changed_fields is None:
+                saved_zone_id = saved_rr = saved_value = None
+            else:
+                saved_zone_id = self.__dict__.get("_saved_zone_id")
+                saved_rr = self.get_journal_rr(saved=True)
+                saved_value = self.get_saved_value("value")
+
             super().save(*args, **kwargs)
 
+            if self.type == RecordTypeChoices.SOA:
+                if saved_value is not None and (
+                    saved_serial := int(saved_value.split()[2])
+                ) != (serial := int(self.value.split()[2])):
+                    commit_zone_changes(self.zone, saved_serial, serial)
+            else:
+                journal_record_change(
+                    self.zone,
+                    saved_rr,
+                    self.get_journal_rr(),
+                    old_zone=(
+                        self.zone.__class__.objects.get(pk=saved_zone_id)
+                        if saved_zone_id not in (None, self.zone_id)
+                        else None
+                    ),
+                )
+
             self.refresh_ptr_record(
                 self.cleanup_ptr_record,
                 update_rfc2317_cname=update_rfc2317_cname,
@@ -1027,9 +1203,12 @@ class Record(ObjectModificationMixin, ContactsMixin, PrimaryModel):
             self.remove_from_rfc2317_cname_record(save_zone_serial=save_zone_serial)
 
         ptr_record = self.ptr_record
+        saved_rr = self.get_journal_rr(saved=True)
 
         super().delete(*args, **kwargs)
 
+        journal_record_change(self.zone, saved_rr, None)
+
         self.refresh_ptr_record(
             ptr_record,
             update_rfc2317_cname=True,
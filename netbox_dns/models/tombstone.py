@@ -0,0 +1,48 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+__all__ = ("Tombstone",)
+
+
+class Tombstone(models.Model):
+    """
+    Marker for a deleted zone or record, used to report deletions in the
+    changes feed of the REST API. Tombstones are removed after the retention
+    period of the changes feed has passed.
+    """
+
+    class Meta:
+        verbose_name = _("Tombstone")
+        verbose_name_plural = _("Tombstones")
+
+        ordering = (
+            "deleted",
+            "pk",
+        )
+
+        indexes = [
+            models.Index(
+                fields=["object_type", "deleted", "id"],
+                name="netbox_dns_tombstone_deleted",
+            ),
+        ]
+
+    object_type = models.ForeignKey(
+        verbose_name=_("Object Type"),
+        to="contenttypes.ContentType",
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    object_id = models.BigIntegerField(
+        verbose_name=_("Object ID"),
+    )
+    zone_id = models.BigIntegerField(
+        verbose_name=_("Zone ID"),
+        null=True,
+    )
+    deleted = models.DateTimeField(
+        verbose_name=_("Deleted"),
+    )
+
+    def __str__(self):
+        return f"{self.object_type.model} {self.object_id}"
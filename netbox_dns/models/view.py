@@ -15,6 +15,12 @@ from netbox_dns.utilities import (
     update_dns_records,
     delete_dns_records,
     get_query_from_filter,
+    prefix_view_tree,
+    ip_address_filter_cache,
+    update_effective_views,
+    get_dnssync_job_pks,
+    enqueue_dnssync_job,
+    check_dnssync_job_lock,
 )
 
 __all__ = (
@@ -77,6 +83,8 @@ class View(ObjectModificationMixin, ContactsMixin, PrimaryModel):
         if (changed_fields := self.changed_fields) is None:
             return
 
+        check_dnssync_job_lock(self)
+
         if (
             "default_view" in changed_fields
             and not self.default_view
@@ -93,10 +101,19 @@ class View(ObjectModificationMixin, ContactsMixin, PrimaryModel):
         if "ip_address_filter" in changed_fields and self.get_saved_value(
             "ip_address_filter"
         ):
+            ip_addresses = get_ip_addresses_by_view(self).filter(
+                get_query_from_filter(self.ip_address_filter)
+            )
+
+            # +
+            # If the records are updated by a background job, errors are
+            # reported by the job instead.
+            # -
+            if get_dnssync_job_pks(ip_addresses) is not None:
+                ip_addresses = ip_addresses.none()
+
             try:
-                for ip_address in get_ip_addresses_by_view(self).filter(
-                    get_query_from_filter(self.ip_address_filter)
-                ):
+                for ip_address in ip_addresses:
                     check_dns_records(ip_address, view=self)
             except ValidationError as exc:
                 raise ValidationError(
@@ -116,6 +133,9 @@ class View(ObjectModificationMixin, ContactsMixin, PrimaryModel):
 
         super().save(*args, **kwargs)
 
+        if changed_fields is None or "ip_address_filter" in changed_fields:
+            ip_address_filter_cache.invalidate()
+
         if (changed_fields is None and self.default_view) or (
             changed_fields is not None
             and self.default_view
@@ -129,6 +149,9 @@ class View(ObjectModificationMixin, ContactsMixin, PrimaryModel):
         if changed_fields is not None and "ip_address_filter" in changed_fields:
             ip_addresses = get_ip_addresses_by_view(self)
 
+            if enqueue_dnssync_job(ip_addresses, instance=self):
+                return
+
             for ip_address in ip_addresses.exclude(
                 get_query_from_filter(self.ip_address_filter)
             ):
@@ -146,8 +169,16 @@ class View(ObjectModificationMixin, ContactsMixin, PrimaryModel):
 
             raise ValidationError(_("The default view cannot be deleted"))
 
+        check_dnssync_job_lock(self)
+
+        prefixes = list(self.prefixes.all())
+
         super().delete(*args, **kwargs)
 
+        prefix_view_tree.invalidate()
+        update_effective_views(prefixes)
+        ip_address_filter_cache.invalidate()
+
 
 @register_search
 class ViewIndex(SearchIndex):
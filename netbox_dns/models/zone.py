@@ -11,21 +11,38 @@ from django.core.validators import (
 )
 from django.core.exceptions import ObjectDoesNotExist, ValidationError
 from django.db import models, transaction
-from django.db.models import Q, Max, ExpressionWrapper, BooleanField, UniqueConstraint
-from django.db.models.functions import Length, Lower
+from django.db.models import (
+    Q,
+    F,
+    Max,
+    Case,
+    When,
+    Value,
+    OuterRef,
+    Subquery,
+    ExpressionWrapper,
+    BooleanField,
+    CharField,
+    UniqueConstraint,
+)
+from django.db.models.functions import Concat, Length, Lower
 from django.db.models.signals import m2m_changed
 from django.dispatch import receiver
 from django.conf import settings
 from django.contrib.postgres.fields import ArrayField
 from django.utils.translation import gettext_lazy as _
 
+from netbox.context import current_request
 from netbox.models import PrimaryModel
 from netbox.models.features import ContactsMixin
 from netbox.search import SearchIndex, register_search
+from netbox.search.backends import search_backend
 from netbox.plugins.utils import get_plugin_config
 from utilities.querysets import RestrictedQuerySet
 from ipam.models import IPAddress
 from ipam.choices import IPAddressFamilyChoices
+from extras.choices import JournalEntryKindChoices
+from extras.models import JournalEntry
 
 from netbox_dns.choices import (
     RecordClassChoices,
@@ -43,6 +60,15 @@ from netbox_dns.utilities import (
     normalize_name,
     get_parent_zone_names,
     regex_from_list,
+    zone_name_trie,
+    defer_serial_update,
+    schedule_serial_update,
+    update_serials,
+    update_ptr_records,
+    reset_zone_changes,
+    get_dnssync_job_pks,
+    enqueue_dnssync_job,
+    check_dnssync_job_lock,
     NameFormatError,
 )
 from netbox_dns.validators import (
@@ -80,6 +106,12 @@ class ZoneManager(models.Manager.from_queryset(RestrictedQuerySet)):
             )
         )
 
+    def bulk_create(self, objs, *args, **kwargs):
+        zones = super().bulk_create(objs, *args, **kwargs)
+        zone_name_trie.invalidate()
+
+        return zones
+
 
 class Zone(ObjectModificationMixin, ContactsMixin, PrimaryModel):
     class Meta:
@@ -102,6 +134,13 @@ class Zone(ObjectModificationMixin, ContactsMixin, PrimaryModel):
             ),
         ]
 
+        indexes = [
+            models.Index(
+                fields=["last_updated", "id"],
+                name="netbox_dns_zone_updated",
+            ),
+        ]
+
     clone_fields = (
         "view",
         "name",
@@ -136,6 +175,7 @@ class Zone(ObjectModificationMixin, ContactsMixin, PrimaryModel):
         "tenant",
         "comments",
         "owner",
+        "journal_retention",
     }
 
     objects = ZoneManager()
@@ -250,6 +290,14 @@ class Zone(ObjectModificationMixin, ContactsMixin, PrimaryModel):
         help_text=_("Automatically generate the SOA serial number"),
         default=True,
     )
+    journal_retention = models.PositiveIntegerField(
+        verbose_name=_("Journal Retention"),
+        help_text=_(
+            "Number of serials for which incremental changes are kept. If empty, the global default is used"
+        ),
+        blank=True,
+        null=True,
+    )
     dnssec_policy = models.ForeignKey(
         verbose_name=_("DNSSEC Policy"),
         to="DNSSECPolicy",
@@ -467,17 +515,24 @@ class Zone(ObjectModificationMixin, ContactsMixin, PrimaryModel):
     @property
     def parent_zone(self):
         try:
-            return self.view.zones.get(
-                name__iexact=get_parent_zone_names(self.name)[-1]
+            parent_zone_pk = zone_name_trie.get_zone_pk(
+                self.view_id, get_parent_zone_names(self.name)[-1]
             )
-        except (Zone.DoesNotExist, IndexError):
+        except IndexError:
             return None
 
+        if parent_zone_pk is None:
+            return None
+
+        return self.view.zones.filter(pk=parent_zone_pk).first()
+
     @property
     def ancestor_zones(self):
         return (
             self.view.zones.annotate(name_length=Length("name"))
-            .filter(name__iregex=regex_from_list(get_parent_zone_names(self.name)))
+            .filter(
+                pk__in=zone_name_trie.get_ancestor_zone_pks(self.view_id, self.name)
+            )
             .order_by("name_length")
         )
 
@@ -692,7 +747,11 @@ class Zone(ObjectModificationMixin, ContactsMixin, PrimaryModel):
         return soa_serial
 
     def update_serial(self, save_zone_serial=True):
-        if not self.soa_serial_auto:
+        if (
+            not self.soa_serial_auto
+            or defer_serial_update(self)
+            or schedule_serial_update(self)
+        ):
             return
 
         self.last_updated = datetime.now()
@@ -718,6 +777,80 @@ class Zone(ObjectModificationMixin, ContactsMixin, PrimaryModel):
     def network_from_name(self):
         return arpa_to_prefix(self.name)
 
+    def update_record_fqdns(self, old_name):
+        """
+        Rewrite the FQDNs of the records in the zone after the zone has been
+        renamed, and the values of the PTR records pointing to its address
+        records, using one UPDATE statement each.
+
+        Record names are stored relative to the zone, so the new FQDN only
+        depends on the record name and the new zone name. Records managed by
+        IPAM DNSsync are not rewritten since they are updated from their IP
+        addresses. Instead of a change log entry for each record, a single
+        journal entry summarizing the rewrite is added to the zone.
+        """
+        zone_fqdn = dns_name.from_text(self.name, origin=dns_name.root).to_text()
+        suffix = zone_fqdn if zone_fqdn == "." else f".{zone_fqdn}"
+
+        last_updated = datetime.now()
+
+        records = self.records.filter(ipam_ip_address__isnull=True)
+        record_count = records.update(
+            fqdn=Case(
+                When(name="@", then=Value(zone_fqdn)),
+                default=Concat(F("name"), Value(suffix)),
+                output_field=CharField(),
+            ),
+            last_updated=last_updated,
+        )
+
+        ptr_records = Record.objects.filter(
+            pk__in=records.filter(
+                type__in=(RecordTypeChoices.A, RecordTypeChoices.AAAA),
+                ptr_record__isnull=False,
+            ).values("ptr_record")
+        )
+        ptr_zone_pks = set(ptr_records.values_list("zone", flat=True).distinct())
+        ptr_record_count = ptr_records.update(
+            value=Subquery(
+                Record.raw_objects.filter(ptr_record=OuterRef("pk"), zone=self).values(
+                    "fqdn"
+                )[:1]
+            ),
+            last_updated=last_updated,
+        )
+
+        search_backend.cache(records.iterator(chunk_size=2000))
+        search_backend.cache(ptr_records.iterator(chunk_size=2000))
+
+        reset_zone_changes(ptr_zone_pks - {self.pk})
+
+        if record_count:
+            request = current_request.get()
+            JournalEntry.objects.create(
+                assigned_object=self,
+                created_by=(
+                    request.user
+                    if request is not None and request.user.is_authenticated
+                    else None
+                ),
+                kind=JournalEntryKindChoices.KIND_INFO,
+                comments=_(
+                    "Zone renamed from {old_name} to {name}: updated the FQDNs of"
+                    " {record_count} records and the values of {ptr_record_count}"
+                    " PTR records."
+                ).format(
+                    old_name=old_name,
+                    name=self.name,
+                    record_count=record_count,
+                    ptr_record_count=ptr_record_count,
+                ),
+            )
+
+        return ptr_zone_pks - {self.pk}
+
+    update_record_fqdns.alters_data = True
+
     def update_rfc2317_parent_zone(self):
         if not self.is_rfc2317_zone:
             return
@@ -736,37 +869,44 @@ class Zone(ObjectModificationMixin, ContactsMixin, PrimaryModel):
                 self.rfc2317_parent_zone = rfc2317_parent_zone
                 self.save(update_fields=["rfc2317_parent_zone"])
 
-        ptr_records = self.records.filter(type=RecordTypeChoices.PTR).prefetch_related(
-            "zone", "rfc2317_cname_record"
+        ptr_records = self.records.filter(type=RecordTypeChoices.PTR).select_related(
+            "rfc2317_cname_record"
         )
-        ptr_zones = {ptr_record.zone for ptr_record in ptr_records}
+        cname_zone_pks = {
+            ptr_record.rfc2317_cname_record.zone_id
+            for ptr_record in ptr_records
+            if ptr_record.rfc2317_cname_record is not None
+        }
 
         if self.rfc2317_parent_managed:
+            cname_ptr_records = []
             for ptr_record in ptr_records:
-                ptr_record.save(save_zone_serial=False)
+                cname_record_pk = ptr_record.rfc2317_cname_record_id
+                ptr_record.zone = self
+                ptr_record.update_rfc2317_cname_record(save_zone_serial=False)
+
+                if ptr_record.rfc2317_cname_record_id != cname_record_pk:
+                    cname_ptr_records.append(ptr_record)
 
-            self.rfc2317_parent_zone.save_soa_serial()
-            self.rfc2317_parent_zone.update_soa_record()
+            if cname_ptr_records:
+                Record.objects.bulk_update(
+                    cname_ptr_records, fields=("rfc2317_cname_record",)
+                )
+                self.update_serial(save_zone_serial=False)
+
+            cname_zone_pks.add(self.rfc2317_parent_zone.pk)
         else:
-            cname_records = {
+            for cname_record in {
                 ptr_record.rfc2317_cname_record
                 for ptr_record in ptr_records
                 if ptr_record.rfc2317_cname_record is not None
-            }
-            cname_zones = {cname_record.zone for cname_record in cname_records}
-
-            for ptr_record in ptr_records:
-                ptr_record.save(update_rfc2317_cname=False, save_zone_serial=False)
-            for cname_record in cname_records:
+            }:
                 cname_record.delete(save_zone_serial=False)
 
-            for cname_zone in cname_zones:
-                cname_zone.save_soa_serial()
-                cname_zone.update_soa_record()
+        update_serials(cname_zone_pks, exclude_pk=self.pk)
 
-        for ptr_zone in ptr_zones:
-            ptr_zone.save_soa_serial()
-            ptr_zone.update_soa_record()
+        self.save_soa_serial()
+        self.update_soa_record()
 
     def clean_fields(self, exclude=None):
         defaults = settings.PLUGINS_CONFIG.get("netbox_dns")
@@ -808,6 +948,8 @@ class Zone(ObjectModificationMixin, ContactsMixin, PrimaryModel):
     clean_fields.alters_data = True
 
     def clean(self, *args, **kwargs):
+        check_dnssync_job_lock(self)
+
         if not self.dnssec_policy:
             self.parental_agents = self._meta.get_field("parental_agents").get_default()
 
@@ -900,9 +1042,18 @@ class Zone(ObjectModificationMixin, ContactsMixin, PrimaryModel):
                         ipam_ip_address__isnull=False
                     )
                 )
-                ip_addresses |= get_ip_addresses_by_zone(self)
-
-                for ip_address in ip_addresses.distinct():
+                ip_addresses = (
+                    ip_addresses | get_ip_addresses_by_zone(self)
+                ).distinct()
+
+                # +
+                # If the records are updated by a background job, errors are
+                # reported by the job instead.
+                # -
+                if get_dnssync_job_pks(ip_addresses) is not None:
+                    ip_addresses = ip_addresses.none()
+
+                for ip_address in ip_addresses:
                     try:
                         check_dns_records(ip_address, zone=self)
                     except ValidationError as exc:
@@ -965,6 +1116,7 @@ class Zone(ObjectModificationMixin, ContactsMixin, PrimaryModel):
         self.full_clean()
 
         changed_fields = self.changed_fields
+        old_name = self.get_saved_value("name")
 
         if self.soa_serial_auto and (
             changed_fields is None or changed_fields - self.soa_clean_fields
@@ -973,6 +1125,18 @@ class Zone(ObjectModificationMixin, ContactsMixin, PrimaryModel):
 
         super().save(*args, **kwargs)
 
+        if (
+            changed_fields is not None
+            and {"name", "status", "default_ttl", "journal_retention"} & changed_fields
+        ):
+            reset_zone_changes([self.pk])
+
+        if changed_fields is None or {"name", "view", "status"} & changed_fields:
+            zone_name_trie.update_zone(self)
+
+        if changed_fields is not None and "name" in changed_fields:
+            update_serials(self.update_record_fqdns(old_name))
+
         if (
             changed_fields is None or {"name", "view", "status"} & changed_fields
         ) and self.is_reverse_zone:
@@ -997,13 +1161,7 @@ class Zone(ObjectModificationMixin, ContactsMixin, PrimaryModel):
                 disable_ptr=False,
             )
 
-            for address_record in address_records:
-                address_record.save(
-                    update_fields=["ptr_record"], save_zone_serial=False
-                )
-
-            for zone in zones:
-                zone.save_soa_serial()
+            update_serials(update_ptr_records(address_records), exclude_pk=self.pk)
 
             if self.arpa_network.version == 4:
                 rfc2317_child_zones = Zone.objects.filter(
@@ -1029,33 +1187,26 @@ class Zone(ObjectModificationMixin, ContactsMixin, PrimaryModel):
                 disable_ptr=False,
             )
 
-            for address_record in address_records:
-                address_record.save(
-                    update_fields=["ptr_record"],
-                    update_rfc2317_cname=False,
-                    save_zone_serial=False,
-                )
-
-            for zone in zones:
-                zone.save_soa_serial()
+            update_serials(
+                update_ptr_records(address_records, update_rfc2317_cname=False),
+                exclude_pk=self.pk,
+            )
 
             self.update_rfc2317_parent_zone()
 
-        elif changed_fields is not None and {"name", "view", "status"} & changed_fields:
-            for address_record in self.records.filter(
-                type__in=(RecordTypeChoices.A, RecordTypeChoices.AAAA),
-                ipam_ip_address__isnull=True,
-            ):
-                address_record.save(update_fields=["ptr_record"])
-
-        if changed_fields is not None and "name" in changed_fields:
-            for _record in self.records.filter(ipam_ip_address__isnull=True):
-                _record.save(
-                    update_fields=["fqdn"],
-                    save_zone_serial=False,
-                    update_rrset_ttl=False,
-                    update_rfc2317_cname=False,
+        elif changed_fields is not None and {"view", "status"} & changed_fields:
+            address_records = list(
+                self.records.filter(
+                    type__in=(RecordTypeChoices.A, RecordTypeChoices.AAAA),
+                    ipam_ip_address__isnull=True,
+                ).select_related(
+                    "ptr_record", "ptr_record__zone", "ptr_record__rfc2317_cname_record"
                 )
+            )
+            for address_record in address_records:
+                address_record.zone = self
+
+            update_serials(update_ptr_records(address_records), exclude_pk=self.pk)
 
         if changed_fields is None or {"name", "view"} & changed_fields:
             ip_addresses = IPAddress.objects.filter(
@@ -1063,21 +1214,37 @@ class Zone(ObjectModificationMixin, ContactsMixin, PrimaryModel):
                     ipam_ip_address__isnull=False
                 )
             )
-            ip_addresses |= get_ip_addresses_by_zone(self)
+            ip_addresses = (ip_addresses | get_ip_addresses_by_zone(self)).distinct()
 
-            for ip_address in ip_addresses.distinct():
-                update_dns_records(ip_address)
+            if not enqueue_dnssync_job(ip_addresses, instance=self):
+                for ip_address in ip_addresses:
+                    update_dns_records(ip_address)
 
         self.save_soa_serial()
         self.update_soa_record()
 
     def delete(self, *args, **kwargs):
+        check_dnssync_job_lock(self)
+
+        zone_pk = self.pk
+
         with transaction.atomic():
-            address_records = self.records.filter(
-                ptr_record__isnull=False
-            ).prefetch_related("ptr_record")
-            for address_record in address_records:
-                address_record.ptr_record.delete()
+            address_ptr_records = Record.objects.filter(
+                pk__in=self.records.filter(ptr_record__isnull=False).values(
+                    "ptr_record"
+                )
+            ).select_related("rfc2317_cname_record")
+
+            ptr_zone_pks = set()
+            for ptr_record in address_ptr_records:
+                ptr_zone_pks.add(ptr_record.zone_id)
+                if ptr_record.rfc2317_cname_record is not None:
+                    ptr_zone_pks.add(ptr_record.rfc2317_cname_record.zone_id)
+                    ptr_record.remove_from_rfc2317_cname_record(save_zone_serial=False)
+
+            address_ptr_records.delete()
+            reset_zone_changes(ptr_zone_pks - {self.pk})
+            update_serials(ptr_zone_pks, exclude_pk=self.pk)
 
             ptr_records = self.records.filter(address_records__isnull=False)
             update_records = list(
@@ -1115,19 +1282,14 @@ class Zone(ObjectModificationMixin, ContactsMixin, PrimaryModel):
 
             super().delete(*args, **kwargs)
 
-        address_records = Record.objects.filter(pk__in=update_records).prefetch_related(
-            "zone"
-        )
+            zone_name_trie.remove_zone(zone_pk)
 
-        for address_record in address_records:
-            address_record.save(save_zone_serial=False)
-        for address_zone in {address_record.zone for address_record in address_records}:
-            address_zone.save_soa_serial()
-            address_zone.update_soa_record()
+        update_serials(update_ptr_records(Record.objects.filter(pk__in=update_records)))
 
         ip_addresses = IPAddress.objects.filter(pk__in=ipam_ip_addresses)
-        for ip_address in ip_addresses:
-            update_dns_records(ip_address)
+        if not enqueue_dnssync_job(ip_addresses):
+            for ip_address in ip_addresses:
+                update_dns_records(ip_address)
 
         rfc2317_child_zones = Zone.objects.filter(pk__in=rfc2317_child_zones)
         if rfc2317_child_zones:
@@ -0,0 +1,76 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+from netbox_dns.choices import ZoneChangeActionChoices
+
+__all__ = ("ZoneChange",)
+
+
+class ZoneChange(models.Model):
+    """
+    Journal entry for a resource record that was added to or deleted from a
+    zone.
+
+    Entries are created without a serial when a record is saved or deleted,
+    and are assigned the new SOA serial of the zone when it is published in
+    the SOA record. All entries with the same serial form the difference
+    between `previous_serial` and `serial` in the sense of RFC 1995.
+    """
+
+    class Meta:
+        verbose_name = _("Zone Change")
+        verbose_name_plural = _("Zone Changes")
+
+        ordering = (
+            "zone",
+            "serial",
+            "pk",
+        )
+
+        indexes = [
+            models.Index(
+                fields=["zone", "serial"], name="netbox_dns_zonechange_serial"
+            ),
+        ]
+
+    zone = models.ForeignKey(
+        verbose_name=_("Zone"),
+        to="Zone",
+        on_delete=models.CASCADE,
+        related_name="+",
+    )
+    serial = models.BigIntegerField(
+        verbose_name=_("Serial"),
+        null=True,
+    )
+    previous_serial = models.BigIntegerField(
+        verbose_name=_("Previous Serial"),
+        null=True,
+    )
+    action = models.CharField(
+        verbose_name=_("Action"),
+        choices=ZoneChangeActionChoices,
+        max_length=10,
+    )
+    name = models.CharField(
+        verbose_name=_("Name"),
+        max_length=255,
+        blank=True,
+    )
+    ttl = models.PositiveIntegerField(
+        verbose_name=_("TTL"),
+        null=True,
+    )
+    type = models.CharField(
+        verbose_name=_("Type"),
+        max_length=10,
+        blank=True,
+    )
+    value = models.CharField(
+        verbose_name=_("Value"),
+        max_length=65535,
+        blank=True,
+    )
+
+    def __str__(self):
+        return f"{self.action} {self.name} {self.ttl} {self.type} {self.value}"
@@ -18,6 +18,13 @@ from netbox_dns.utilities import (
     delete_dns_records,
     get_views_by_prefix,
     get_ip_addresses_by_prefix,
+    get_dnssync_batch,
+    prefix_view_tree,
+    rebuild_effective_views,
+    update_effective_views,
+    get_dnssync_job_pks,
+    enqueue_dnssync_job,
+    check_dnssync_job_lock,
 )
 
 DNSSYNC_CUSTOM_FIELDS = {
@@ -120,6 +127,10 @@ def ipam_dnssync_ipaddress_pre_save(instance, **kwargs):
 
 @receiver(post_save, sender=IPAddress)
 def ipam_dnssync_ipaddress_post_save(instance, **kwargs):
+    if (batch := get_dnssync_batch()) is not None:
+        batch.add(instance)
+        return
+
     update_dns_records(instance)
 
 
@@ -135,6 +146,10 @@ def ipam_dnssync_prefix_pre_save(instance, **kwargs):
     if instance._state.adding or not instance.netbox_dns_views.exists():
         return
 
+    check_dnssync_job_lock(instance)
+
+    prefix_view_tree.invalidate()
+
     saved_prefix = Prefix.objects.prefetch_related("netbox_dns_views").get(
         pk=instance.pk
     )
@@ -156,8 +171,21 @@ def ipam_dnssync_prefix_pre_save(instance, **kwargs):
         )
 
 
+@receiver(post_save, sender=Prefix)
+def ipam_dnssync_prefix_post_save(instance, **kwargs):
+    # +
+    # Prefixes with views assigned cannot be moved, so only the effective views
+    # of the prefix itself can change.
+    # -
+    update_effective_views([instance], include_children=False)
+
+
 @receiver(pre_delete, sender=Prefix)
 def ipam_dnssync_prefix_pre_delete(instance, **kwargs):
+    check_dnssync_job_lock(instance)
+
+    prefix_view_tree.invalidate()
+
     parent = instance.get_parents().last()
     request = current_request.get()
 
@@ -198,13 +226,31 @@ def ipam_dnssync_prefix_pre_delete(instance, **kwargs):
             view.snapshot()
             view.prefixes.remove(instance)
 
-    for ip_address in get_ip_addresses_by_prefix(instance):
-        update_dns_records(ip_address)
+    update_effective_views([instance])
+
+    ip_addresses = get_ip_addresses_by_prefix(instance)
+    if not enqueue_dnssync_job(ip_addresses):
+        for ip_address in ip_addresses:
+            update_dns_records(ip_address)
 
 
 @receiver(m2m_changed, sender=Prefix.netbox_dns_views.through)
 def ipam_dnssync_view_prefix_changed(**kwargs):
     action = kwargs.get("action")
+    instance = kwargs.get("instance")
+
+    if action.startswith("pre_"):
+        check_dnssync_job_lock(instance)
+
+    if action.startswith("post_"):
+        prefix_view_tree.invalidate()
+
+        if kwargs.get("reverse"):
+            update_effective_views([instance])
+        elif action == "post_clear":
+            rebuild_effective_views()
+        else:
+            update_effective_views(Prefix.objects.filter(pk__in=kwargs.get("pk_set")))
 
     check_view = action != "post_remove"
 
@@ -212,5 +258,18 @@ def ipam_dnssync_view_prefix_changed(**kwargs):
     for prefix in Prefix.objects.filter(pk__in=kwargs.get("pk_set")):
         ip_addresses |= get_ip_addresses_by_prefix(prefix, check_view=check_view)
 
-    for ip_address in ip_addresses.distinct():
+    ip_addresses = ip_addresses.distinct()
+
+    # +
+    # The IP addresses affected after the change are a superset of those
+    # affected before it, so if the work is offloaded to a background job, the
+    # job enqueued for the post_* action covers the pre_* action as well.
+    # -
+    if action.startswith("pre_"):
+        if get_dnssync_job_pks(ip_addresses) is not None:
+            return
+    elif enqueue_dnssync_job(ip_addresses, instance=instance):
+        return
+
+    for ip_address in ip_addresses:
         update_dns_records(ip_address)
@@ -0,0 +1,32 @@
+from django.contrib.contenttypes.models import ContentType
+from django.db.models.signals import post_delete
+from django.dispatch import receiver
+from django.utils import timezone
+
+from netbox_dns.models import Record, Tombstone, Zone
+
+
+@receiver(post_delete, sender=Zone)
+def zone_post_delete_tombstone(instance, **kwargs):
+    Tombstone.objects.create(
+        object_type=ContentType.objects.get_for_model(Zone),
+        object_id=instance.pk,
+        zone_id=instance.pk,
+        deleted=timezone.now(),
+    )
+
+
+@receiver(post_delete, sender=Record)
+def record_post_delete_tombstone(instance, origin=None, **kwargs):
+    # +
+    # The records of a deleted zone are covered by the tombstone of the zone
+    # -
+    if isinstance(origin, Zone):
+        return
+
+    Tombstone.objects.create(
+        object_type=ContentType.objects.get_for_model(Record),
+        object_id=instance.pk,
+        zone_id=instance.zone_id,
+        deleted=timezone.now(),
+    )
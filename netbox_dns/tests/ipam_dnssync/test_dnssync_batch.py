@@ -0,0 +1,237 @@
+from unittest import mock
+
+from netaddr import IPNetwork
+
+from django.conf import settings
+from django.test import TestCase
+from django.urls import reverse
+from django.core import management
+from django.core.exceptions import ValidationError
+from rest_framework import status
+
+from utilities.testing import APITestCase
+
+from ipam.models import IPAddress, Prefix
+
+from netbox_dns.models import View, Zone, NameServer, Record
+from netbox_dns.choices import RecordTypeChoices
+from netbox_dns.utilities import dnssync_batch, get_dnssync_batch
+
+
+class DNSsyncBatchTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        management.call_command("setup_dnssync", verbosity=0)
+
+        cls.view = View.get_default_view()
+
+        cls.zone = Zone.objects.create(
+            name="zone1.example.com",
+            soa_mname=NameServer.objects.create(name="ns1.example.com"),
+            soa_rname="hostmaster.example.com",
+        )
+
+        cls.prefix = Prefix.objects.create(prefix="10.0.0.0/24")
+        cls.view.prefixes.add(cls.prefix)
+
+    def test_batch_create_ip_addresses(self):
+        with dnssync_batch() as batch:
+            ip_addresses = [
+                IPAddress.objects.create(
+                    address=IPNetwork(f"10.0.0.{index}/24"),
+                    dns_name=f"name{index}.zone1.example.com",
+                )
+                for index in range(1, 11)
+            ]
+
+            self.assertIs(get_dnssync_batch(), batch)
+            self.assertEqual(
+                batch.ip_address_pks, {ip_address.pk for ip_address in ip_addresses}
+            )
+            self.assertFalse(Record.objects.filter(managed=True).exists())
+
+        self.assertIsNone(get_dnssync_batch())
+
+        for ip_address in ip_addresses:
+            record = Record.objects.get(ipam_ip_address=ip_address)
+            self.assertEqual(record.zone, self.zone)
+            self.assertEqual(record.type, RecordTypeChoices.A)
+            self.assertEqual(record.fqdn.rstrip("."), ip_address.dns_name)
+            self.assertEqual(record.value, str(ip_address.address.ip))
+
+    def test_batch_update_ip_addresses(self):
+        ip_address = IPAddress.objects.create(
+            address=IPNetwork("10.0.0.1/24"), dns_name="name1.zone1.example.com"
+        )
+
+        with dnssync_batch():
+            ip_address.dns_name = "name2.zone1.example.com"
+            ip_address.save()
+
+        record = Record.objects.get(ipam_ip_address=ip_address)
+        self.assertEqual(record.name, "name2")
+
+    def test_batch_nested(self):
+        with dnssync_batch() as batch:
+            with dnssync_batch() as nested_batch:
+                IPAddress.objects.create(
+                    address=IPNetwork("10.0.0.1/24"),
+                    dns_name="name1.zone1.example.com",
+                )
+
+            self.assertIs(nested_batch, batch)
+            self.assertFalse(Record.objects.filter(managed=True).exists())
+
+        self.assertTrue(Record.objects.filter(managed=True).exists())
+
+    def test_batch_shared_zones(self):
+        with dnssync_batch() as batch:
+            self.assertEqual(batch.get_zones([self.zone.pk]), [self.zone])
+            self.assertIs(
+                batch.get_zones([self.zone.pk])[0], batch.get_zones([self.zone.pk])[0]
+            )
+
+    def test_batch_error_rollback(self):
+        Record.objects.create(
+            zone=self.zone,
+            name="name1",
+            type=RecordTypeChoices.CNAME,
+            value="name2.zone1.example.com.",
+        )
+
+        with self.assertRaises(ValidationError):
+            with dnssync_batch():
+                IPAddress.objects.create(
+                    address=IPNetwork("10.0.0.1/24"),
+                    dns_name="name1.zone1.example.com",
+                )
+
+        self.assertFalse(
+            IPAddress.objects.filter(dns_name="name1.zone1.example.com").exists()
+        )
+        self.assertFalse(Record.objects.filter(managed=True).exists())
+
+    def test_batch_pre_save_check(self):
+        Record.objects.create(
+            zone=self.zone,
+            name="name1",
+            type=RecordTypeChoices.CNAME,
+            value="name2.zone1.example.com.",
+        )
+
+        with dnssync_batch() as batch:
+            with self.assertRaises(ValidationError):
+                IPAddress.objects.create(
+                    address=IPNetwork("10.0.0.1/24"),
+                    dns_name="name1.zone1.example.com",
+                )
+
+            self.assertEqual(batch.ip_address_pks, set())
+
+        self.assertFalse(
+            IPAddress.objects.filter(dns_name="name1.zone1.example.com").exists()
+        )
+
+
+class DNSsyncBatchAPITestCase(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        management.call_command("setup_dnssync", verbosity=0)
+
+        cls.view = View.get_default_view()
+
+        cls.zone = Zone.objects.create(
+            name="zone1.example.com",
+            soa_mname=NameServer.objects.create(name="ns1.example.com"),
+            soa_rname="hostmaster.example.com",
+        )
+
+        cls.prefix = Prefix.objects.create(prefix="10.0.0.0/24")
+        cls.view.prefixes.add(cls.prefix)
+
+    def setUp(self):
+        super().setUp()
+
+        patcher = mock.patch.dict(
+            settings.PLUGINS_CONFIG["netbox_dns"],
+            {"dnssync_batch_bulk_operations": True},
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_bulk_create_ipaddresses(self):
+        self.add_permissions("ipam.add_ipaddress")
+
+        url = reverse("ipam-api:ipaddress-list")
+
+        data = [
+            {
+                "address": f"10.0.0.{index}/24",
+                "dns_name": f"name{index}.zone1.example.com",
+            }
+            for index in range(1, 6)
+        ]
+
+        response = self.client.post(url, data, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_201_CREATED)
+
+        for index in range(1, 6):
+            record = Record.objects.get(
+                ipam_ip_address__dns_name=f"name{index}.zone1.example.com"
+            )
+            self.assertEqual(record.zone, self.zone)
+            self.assertEqual(record.value, f"10.0.0.{index}")
+
+    def test_bulk_update_ipaddresses(self):
+        ip_addresses = [
+            IPAddress.objects.create(
+                address=IPNetwork(f"10.0.0.{index}/24"),
+                dns_name=f"name{index}.zone1.example.com",
+            )
+            for index in range(1, 6)
+        ]
+
+        self.add_permissions("ipam.change_ipaddress")
+
+        url = reverse("ipam-api:ipaddress-list")
+
+        data = [
+            {
+                "id": ip_address.pk,
+                "dns_name": f"new-name{index}.zone1.example.com",
+            }
+            for index, ip_address in enumerate(ip_addresses)
+        ]
+
+        response = self.client.patch(url, data, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+
+        for index, ip_address in enumerate(ip_addresses):
+            record = Record.objects.get(ipam_ip_address=ip_address)
+            self.assertEqual(record.name, f"new-name{index}")
+
+    def test_bulk_create_conflict(self):
+        Record.objects.create(
+            zone=self.zone,
+            name="name1",
+            type=RecordTypeChoices.CNAME,
+            value="name2.zone1.example.com.",
+        )
+
+        self.add_permissions("ipam.add_ipaddress")
+
+        url = reverse("ipam-api:ipaddress-list")
+
+        data = [
+            {
+                "address": f"10.0.0.{index}/24",
+                "dns_name": f"name{index}.zone1.example.com",
+            }
+            for index in range(1, 3)
+        ]
+
+        response = self.client.post(url, data, format="json", **self.header)
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+
+        self.assertFalse(IPAddress.objects.exists())
+        self.assertFalse(Record.objects.filter(managed=True).exists())
@@ -0,0 +1,230 @@
+import uuid
+from unittest import mock
+
+from netaddr import IPNetwork
+
+from django.conf import settings
+from django.contrib.auth.models import AnonymousUser
+from django.test import RequestFactory, TestCase
+from django.core import management
+from django.core.exceptions import ValidationError
+
+from core.choices import JobStatusChoices
+from core.models import Job, ObjectType
+from netbox.context import current_request
+from ipam.models import IPAddress, Prefix
+
+from netbox_dns.models import View, Zone, NameServer, Record
+from netbox_dns.choices import RecordTypeChoices
+from netbox_dns.jobs import DNSsyncJob
+from netbox_dns.utilities import enqueue_dnssync_job
+
+
+class DNSsyncJobTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        management.call_command("setup_dnssync", verbosity=0)
+
+        cls.view = View.get_default_view()
+
+        cls.zone = Zone.objects.create(
+            name="zone1.example.com",
+            soa_mname=NameServer.objects.create(name="ns1.example.com"),
+            soa_rname="hostmaster.example.com",
+        )
+
+        cls.prefix = Prefix.objects.create(prefix="10.0.0.0/24")
+        cls.view.prefixes.add(cls.prefix)
+
+        IPAddress.objects.bulk_create(
+            IPAddress(
+                address=IPNetwork(f"10.0.0.{index}/24"),
+                dns_name=f"name{index}.zone1.example.com",
+            )
+            for index in range(1, 11)
+        )
+        cls.ip_address_pks = sorted(IPAddress.objects.values_list("pk", flat=True))
+
+    def create_job(self, instance, status, data=None):
+        return Job.objects.create(
+            name=DNSsyncJob.name,
+            object_type=ObjectType.objects.get_for_model(instance),
+            object_id=instance.pk,
+            status=status,
+            data=data,
+            job_id=uuid.uuid4(),
+        )
+
+    def test_job(self):
+        self.assertFalse(Record.objects.filter(managed=True).exists())
+
+        job = DNSsyncJob.enqueue(
+            instance=self.view, immediate=True, ip_address_pks=self.ip_address_pks
+        )
+        job.refresh_from_db()
+
+        self.assertEqual(job.status, JobStatusChoices.STATUS_COMPLETED)
+        self.assertEqual(job.data["processed"], 10)
+        self.assertEqual(job.data["progress"], 100)
+        self.assertEqual(job.data["created"], 10)
+        self.assertEqual(job.data["errors"], [])
+        self.assertEqual(job.data["cursor"], self.ip_address_pks[-1])
+        self.assertNotIn("ip_address_pks", job.data)
+
+        for ip_address in IPAddress.objects.all():
+            record = Record.objects.get(ipam_ip_address=ip_address)
+            self.assertEqual(record.zone, self.zone)
+            self.assertEqual(record.value, str(ip_address.address.ip))
+
+    def test_job_chunks(self):
+        DNSsyncJob.chunk_size = 3
+        self.addCleanup(setattr, DNSsyncJob, "chunk_size", 1000)
+
+        job = DNSsyncJob.enqueue(
+            instance=self.view, immediate=True, ip_address_pks=self.ip_address_pks
+        )
+        job.refresh_from_db()
+
+        self.assertEqual(job.data["processed"], 10)
+        self.assertEqual(
+            Record.objects.filter(managed=True, type=RecordTypeChoices.A).count(), 10
+        )
+
+    def test_resume(self):
+        job = self.create_job(
+            self.view,
+            JobStatusChoices.STATUS_RUNNING,
+            data={
+                "total": 10,
+                "processed": 4,
+                "cursor": self.ip_address_pks[3],
+                "created": 4,
+                "updated": 0,
+                "deleted": 0,
+                "error_count": 0,
+                "errors": [],
+            },
+        )
+
+        with mock.patch.object(
+            DNSsyncJob, "get_ip_address_pks", return_value=self.ip_address_pks
+        ):
+            new_job = DNSsyncJob.resume(job, immediate=True)
+
+        job.refresh_from_db()
+        new_job.refresh_from_db()
+
+        self.assertEqual(job.status, JobStatusChoices.STATUS_FAILED)
+        self.assertEqual(job.data["resumed_by"], new_job.pk)
+        self.assertEqual(new_job.status, JobStatusChoices.STATUS_COMPLETED)
+        self.assertEqual(new_job.data["resumed_from"], job.pk)
+        self.assertEqual(new_job.data["processed"], 10)
+        self.assertEqual(new_job.data["created"], 10)
+
+        self.assertEqual(
+            set(
+                Record.objects.filter(
+                    managed=True, type=RecordTypeChoices.A
+                ).values_list("ipam_ip_address", flat=True)
+            ),
+            set(self.ip_address_pks[4:]),
+        )
+
+        with self.assertRaises(ValueError):
+            DNSsyncJob.resume(job)
+
+    def test_resume_expired(self):
+        job = self.create_job(
+            self.view,
+            JobStatusChoices.STATUS_FAILED,
+            data={"total": 10, "processed": 4, "cursor": self.ip_address_pks[3]},
+        )
+
+        with mock.patch.object(DNSsyncJob, "get_ip_address_pks", return_value=None):
+            with self.assertRaises(ValueError):
+                DNSsyncJob.resume(job)
+
+    def test_error_limit(self):
+        DNSsyncJob.max_errors = 2
+        self.addCleanup(setattr, DNSsyncJob, "max_errors", 100)
+
+        for index in range(1, 4):
+            Record.objects.create(
+                zone=self.zone,
+                name=f"name{index}",
+                type=RecordTypeChoices.CNAME,
+                value="target.zone1.example.com.",
+            )
+
+        job = DNSsyncJob.enqueue(
+            instance=self.view, immediate=True, ip_address_pks=self.ip_address_pks
+        )
+        job.refresh_from_db()
+
+        self.assertEqual(job.data["error_count"], 3)
+        self.assertEqual(len(job.data["errors"]), 2)
+
+    def test_enqueue_without_transaction(self):
+        request = RequestFactory().post("/")
+        request.user = AnonymousUser()
+        token = current_request.set(request)
+        self.addCleanup(current_request.reset, token)
+
+        # +
+        # Outside of a transaction, on_commit callbacks run immediately.
+        # -
+        with (
+            mock.patch.dict(
+                settings.PLUGINS_CONFIG["netbox_dns"], {"dnssync_job_threshold": 1}
+            ),
+            mock.patch(
+                "netbox_dns.utilities.dnssync_jobs.transaction.on_commit",
+                side_effect=lambda func, *args, **kwargs: func(),
+            ),
+            mock.patch.object(DNSsyncJob, "enqueue") as enqueue,
+        ):
+            self.assertTrue(
+                enqueue_dnssync_job(IPAddress.objects.all(), instance=self.view)
+            )
+
+        enqueue.assert_called_once()
+        self.assertEqual(
+            enqueue.call_args.kwargs["ip_address_pks"], self.ip_address_pks
+        )
+        self.assertFalse(hasattr(request, "_netbox_dns_dnssync_jobs"))
+
+    def test_view_lock(self):
+        job = self.create_job(self.view, JobStatusChoices.STATUS_RUNNING)
+
+        self.view.description = "Locked"
+        with self.assertRaises(ValidationError):
+            self.view.save()
+
+        job.terminate()
+
+        self.view.save()
+
+    def test_zone_lock(self):
+        self.create_job(self.zone, JobStatusChoices.STATUS_PENDING)
+
+        self.zone.description = "Locked"
+        with self.assertRaises(ValidationError):
+            self.zone.save()
+
+        with self.assertRaises(ValidationError):
+            self.zone.delete()
+
+    def test_prefix_lock(self):
+        self.create_job(self.prefix, JobStatusChoices.STATUS_RUNNING)
+
+        with self.assertRaises(ValidationError):
+            self.prefix.netbox_dns_views.clear()
+
+        with self.assertRaises(ValidationError):
+            self.prefix.delete()
+
+    def test_completed_job_no_lock(self):
+        self.create_job(self.zone, JobStatusChoices.STATUS_COMPLETED)
+
+        self.zone.description = "Not locked"
+        self.zone.save()
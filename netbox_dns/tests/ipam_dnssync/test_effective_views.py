@@ -0,0 +1,144 @@
+from django.test import TestCase
+from django.core import management
+from django.core.management.base import CommandError
+
+from ipam.models import Prefix, VRF
+
+from netbox_dns.models import View, EffectiveView
+from netbox_dns.utilities import (
+    get_views_by_prefix,
+    rebuild_effective_views,
+    verify_effective_views,
+)
+
+
+class DNSsyncEffectiveViewsTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.views = (
+            View(name="view1"),
+            View(name="view2"),
+            View(name="view3"),
+        )
+        View.objects.bulk_create(cls.views)
+
+        cls.vrf = VRF.objects.create(name="vrf1")
+
+        cls.prefixes = (
+            Prefix(prefix="10.0.0.0/8"),
+            Prefix(prefix="10.1.0.0/16"),
+            Prefix(prefix="10.1.1.0/24"),
+            Prefix(prefix="10.1.1.128/25"),
+            Prefix(prefix="10.2.0.0/16"),
+            Prefix(prefix="10.1.0.0/16", vrf=cls.vrf),
+            Prefix(prefix="2001:db8::/32"),
+            Prefix(prefix="2001:db8::/48"),
+        )
+        Prefix.objects.bulk_create(cls.prefixes)
+
+        cls.views[0].prefixes.add(cls.prefixes[0], cls.prefixes[2], cls.prefixes[6])
+        cls.views[1].prefixes.add(cls.prefixes[1], cls.prefixes[2])
+
+        rebuild_effective_views()
+
+    def get_effective_views(self, prefix):
+        return {
+            (view_id, inherited)
+            for view_id, inherited in EffectiveView.objects.filter(
+                prefix=prefix
+            ).values_list("view_id", "inherited")
+        }
+
+    def test_effective_views(self):
+        view1, view2, view3 = (view.pk for view in self.views)
+
+        for prefix, effective_views in (
+            (self.prefixes[0], {(view1, False)}),
+            (self.prefixes[1], {(view2, False)}),
+            (self.prefixes[2], {(view1, False), (view2, False)}),
+            (self.prefixes[3], {(view1, True), (view2, True)}),
+            (self.prefixes[4], {(view1, True)}),
+            (self.prefixes[5], set()),
+            (self.prefixes[6], {(view1, False)}),
+            (self.prefixes[7], {(view1, True)}),
+        ):
+            with self.subTest(prefix=prefix):
+                self.assertEqual(self.get_effective_views(prefix), effective_views)
+
+        self.assertEqual(verify_effective_views(), [])
+
+    def test_get_views_by_prefix(self):
+        self.assertEqual(
+            set(get_views_by_prefix(self.prefixes[3])),
+            {self.views[0], self.views[1]},
+        )
+        self.assertFalse(get_views_by_prefix(self.prefixes[5]))
+
+    def test_add_view(self):
+        self.views[2].prefixes.add(self.prefixes[1])
+
+        self.assertEqual(
+            self.get_effective_views(self.prefixes[1]),
+            {(self.views[1].pk, False), (self.views[2].pk, False)},
+        )
+        self.assertEqual(verify_effective_views(), [])
+
+    def test_remove_view(self):
+        self.views[1].prefixes.remove(self.prefixes[1])
+
+        self.assertEqual(
+            self.get_effective_views(self.prefixes[1]), {(self.views[0].pk, True)}
+        )
+        self.assertEqual(verify_effective_views(), [])
+
+    def test_assign_views_to_prefix(self):
+        self.prefixes[5].netbox_dns_views.set([self.views[2]])
+
+        self.assertEqual(
+            self.get_effective_views(self.prefixes[5]), {(self.views[2].pk, False)}
+        )
+        self.assertEqual(verify_effective_views(), [])
+
+    def test_create_prefix(self):
+        prefix = Prefix.objects.create(prefix="10.2.1.0/24")
+
+        self.assertEqual(self.get_effective_views(prefix), {(self.views[0].pk, True)})
+        self.assertEqual(verify_effective_views(), [])
+
+    def test_delete_prefix(self):
+        self.prefixes[1].delete()
+
+        self.assertEqual(
+            self.get_effective_views(self.prefixes[3]),
+            {(self.views[0].pk, True), (self.views[1].pk, True)},
+        )
+        self.assertEqual(verify_effective_views(), [])
+
+    def test_delete_view(self):
+        self.views[1].delete()
+
+        self.assertEqual(
+            self.get_effective_views(self.prefixes[1]), {(self.views[0].pk, True)}
+        )
+        self.assertEqual(
+            self.get_effective_views(self.prefixes[3]), {(self.views[0].pk, True)}
+        )
+        self.assertEqual(verify_effective_views(), [])
+
+    def test_rebuild(self):
+        EffectiveView.objects.filter(prefix=self.prefixes[3]).delete()
+        EffectiveView.objects.create(prefix=self.prefixes[5], view=self.views[2])
+
+        self.assertEqual(len(verify_effective_views()), 2)
+
+        self.assertEqual(rebuild_effective_views(), {"created": 2, "deleted": 1})
+        self.assertEqual(verify_effective_views(), [])
+
+    def test_rebuild_command(self):
+        EffectiveView.objects.filter(prefix=self.prefixes[3]).delete()
+
+        with self.assertRaises(CommandError):
+            management.call_command("rebuild_effective_views", verify=True, verbosity=0)
+
+        management.call_command("rebuild_effective_views", verbosity=0)
+        management.call_command("rebuild_effective_views", verify=True, verbosity=0)
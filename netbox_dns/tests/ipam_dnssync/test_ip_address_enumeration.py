@@ -0,0 +1,171 @@
+from netaddr import IPNetwork
+
+from django.test import TestCase
+from django.db.models import Q
+
+from ipam.models import IPAddress, Prefix, VRF
+
+from netbox_dns.models import View
+from netbox_dns.utilities import (
+    get_ip_addresses_by_prefix,
+    get_ip_addresses_by_view,
+    prefix_view_tree,
+)
+
+
+def legacy_get_ip_addresses_by_view(view):
+    queryset = IPAddress.objects.none()
+    for prefix in Prefix.objects.filter(netbox_dns_views__in=[view]):
+        sub_queryset = IPAddress.objects.filter(
+            vrf=prefix.vrf, address__net_host_contained=prefix.prefix
+        )
+        for exclude_child in prefix.get_children().exclude(
+            Q(netbox_dns_views__isnull=True) | Q(netbox_dns_views__in=[view])
+        ):
+            sub_queryset = sub_queryset.exclude(
+                vrf=exclude_child.vrf,
+                address__net_host_contained=exclude_child.prefix,
+            )
+        queryset |= sub_queryset
+
+    return queryset
+
+
+def legacy_get_ip_addresses_by_prefix(prefix):
+    queryset = IPAddress.objects.filter(
+        vrf=prefix.vrf, address__net_host_contained=prefix.prefix
+    )
+
+    for exclude_child in (
+        prefix.get_children().filter(netbox_dns_views__isnull=False).distinct()
+    ):
+        queryset = queryset.exclude(
+            vrf=exclude_child.vrf,
+            address__net_host_contained=exclude_child.prefix,
+        )
+
+    return queryset
+
+
+class DNSsyncIPAddressEnumerationTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.views = (
+            View(name="view1"),
+            View(name="view2"),
+            View(name="view3"),
+        )
+        View.objects.bulk_create(cls.views)
+
+        cls.vrf = VRF.objects.create(name="vrf1")
+
+        cls.prefixes = (
+            Prefix(prefix="10.0.0.0/8"),
+            Prefix(prefix="10.0.0.0/16"),
+            Prefix(prefix="10.0.0.0/24"),
+            Prefix(prefix="10.0.0.0/28"),
+            Prefix(prefix="10.1.0.0/16"),
+            Prefix(prefix="10.0.0.0/16", vrf=cls.vrf),
+            Prefix(prefix="10.0.0.0/24", vrf=cls.vrf),
+            Prefix(prefix="2001:db8::/32"),
+            Prefix(prefix="2001:db8::/48"),
+        )
+        Prefix.objects.bulk_create(cls.prefixes)
+
+        cls.views[0].prefixes.add(cls.prefixes[0], cls.prefixes[3], cls.prefixes[7])
+        cls.views[1].prefixes.add(cls.prefixes[2], cls.prefixes[5], cls.prefixes[8])
+        cls.views[2].prefixes.add(cls.prefixes[2], cls.prefixes[6])
+
+        IPAddress.objects.bulk_create(
+            IPAddress(address=IPNetwork(address), vrf=vrf)
+            for address, vrf in (
+                ("10.0.0.1/28", None),
+                ("10.0.0.17/24", None),
+                ("10.0.1.1/16", None),
+                ("10.1.0.1/16", None),
+                ("10.2.0.1/8", None),
+                ("11.0.0.1/8", None),
+                ("10.0.0.1/24", cls.vrf),
+                ("10.0.1.1/16", cls.vrf),
+                ("10.1.0.1/8", cls.vrf),
+                ("2001:db8::1/64", None),
+                ("2001:db8:1::1/64", None),
+            )
+        )
+
+    def get_addresses(self, queryset):
+        return {str(ip_address.address) for ip_address in queryset}
+
+    def test_ip_addresses_by_view(self):
+        for view in self.views:
+            with self.subTest(view=view):
+                self.assertEqual(
+                    self.get_addresses(get_ip_addresses_by_view(view)),
+                    self.get_addresses(legacy_get_ip_addresses_by_view(view)),
+                )
+
+    def test_ip_addresses_by_view_longest_prefix_match(self):
+        for view in self.views:
+            with self.subTest(view=view):
+                self.assertEqual(
+                    set(get_ip_addresses_by_view(view)),
+                    {
+                        ip_address
+                        for ip_address in IPAddress.objects.all()
+                        if view.pk
+                        in prefix_view_tree.get_view_ids(
+                            ip_address.vrf_id, ip_address.address.ip
+                        )
+                    },
+                )
+
+    def test_ip_addresses_by_view_addresses(self):
+        self.assertEqual(
+            self.get_addresses(get_ip_addresses_by_view(self.views[0])),
+            {
+                "10.0.0.1/28",
+                "10.0.1.1/16",
+                "10.1.0.1/16",
+                "10.2.0.1/8",
+                "2001:db8:1::1/64",
+            },
+        )
+
+    def test_ip_addresses_by_view_effective_views(self):
+        query = str(get_ip_addresses_by_view(self.views[0]).query)
+
+        self.assertIn("netbox_dns_effectiveview", query)
+        self.assertIn("EXISTS", query)
+        self.assertEqual(query.count("MASKLEN"), 1)
+
+    def test_ip_addresses_by_view_duplicate_prefixes(self):
+        prefixes = (
+            Prefix(prefix="10.3.0.0/16"),
+            Prefix(prefix="10.3.0.0/16"),
+        )
+        Prefix.objects.bulk_create(prefixes)
+        self.views[1].prefixes.add(prefixes[0])
+        self.views[2].prefixes.add(prefixes[1])
+        ip_address = IPAddress.objects.create(address=IPNetwork("10.3.0.1/16"))
+
+        self.assertEqual(
+            set(prefix_view_tree.get_view_ids(None, ip_address.address.ip)),
+            {self.views[2].pk},
+        )
+        self.assertNotIn(ip_address, get_ip_addresses_by_view(self.views[1]))
+        self.assertIn(ip_address, get_ip_addresses_by_view(self.views[2]))
+
+    def test_ip_addresses_by_prefix(self):
+        for prefix in self.prefixes:
+            with self.subTest(prefix=prefix):
+                self.assertEqual(
+                    self.get_addresses(
+                        get_ip_addresses_by_prefix(prefix, check_view=False)
+                    ),
+                    self.get_addresses(legacy_get_ip_addresses_by_prefix(prefix)),
+                )
+
+    def test_ip_addresses_by_prefix_no_view(self):
+        self.assertFalse(
+            get_ip_addresses_by_prefix(Prefix.objects.create(prefix="11.0.0.0/8"))
+        )
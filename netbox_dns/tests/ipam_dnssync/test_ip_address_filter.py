@@ -0,0 +1,204 @@
+from netaddr import IPNetwork
+
+from django.test import TestCase
+
+from ipam.models import IPAddress, VRF
+from ipam.choices import IPAddressStatusChoices, IPAddressRoleChoices
+from extras.models import Tag
+
+from netbox_dns.models import View
+from netbox_dns.utilities import (
+    UnsupportedFilterError,
+    check_filter,
+    compile_ip_address_filter,
+    get_query_from_filter,
+    ip_address_filter_cache,
+)
+
+
+class DNSsyncIPAddressFilterTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.vrf = VRF.objects.create(name="vrf1")
+
+        cls.tags = (
+            Tag.objects.create(name="Tag 1", slug="tag-1"),
+            Tag.objects.create(name="Tag 2", slug="tag-2"),
+        )
+
+        cls.ip_addresses = (
+            IPAddress.objects.create(
+                address=IPNetwork("10.0.0.1/24"),
+                dns_name="name1.zone1.example.com",
+                custom_field_data={"dns": True, "site": "Site1", "rank": 1},
+            ),
+            IPAddress.objects.create(
+                address=IPNetwork("10.0.0.2/24"),
+                dns_name="NAME2.zone1.example.com",
+                status=IPAddressStatusChoices.STATUS_RESERVED,
+                custom_field_data={"dns": False, "site": "site2", "rank": None},
+            ),
+            IPAddress.objects.create(
+                address=IPNetwork("10.0.0.3/24"),
+                dns_name="name3.zone2.example.com",
+                vrf=cls.vrf,
+                role=IPAddressRoleChoices.ROLE_VIP,
+                description="Load Balancer",
+                custom_field_data={"dns": 1, "nested": {"key": ["a", "b"]}},
+            ),
+            IPAddress.objects.create(
+                address=IPNetwork("2001:db8::1/64"),
+                dns_name="",
+                status=IPAddressStatusChoices.STATUS_DEPRECATED,
+                custom_field_data={},
+            ),
+        )
+
+        cls.ip_addresses[0].tags.add(cls.tags[0])
+        cls.ip_addresses[2].tags.add(cls.tags[0], cls.tags[1])
+
+    filters = (
+        {},
+        [],
+        {"dns_name": "name1.zone1.example.com"},
+        {"dns_name__exact": "name1.zone1.example.com"},
+        {"dns_name__iexact": "name2.ZONE1.example.com"},
+        {"dns_name__startswith": "name"},
+        {"dns_name__istartswith": "name2."},
+        {"dns_name__endswith": ".zone2.example.com"},
+        {"dns_name__iendswith": ".ZONE1.EXAMPLE.COM"},
+        {"dns_name__contains": "zone1"},
+        {"dns_name__icontains": "NAME"},
+        {"dns_name__in": ["name1.zone1.example.com", "name3.zone2.example.com"]},
+        {"dns_name__in": []},
+        {"dns_name": ""},
+        {"status": IPAddressStatusChoices.STATUS_ACTIVE},
+        {
+            "status__in": [
+                IPAddressStatusChoices.STATUS_RESERVED,
+                IPAddressStatusChoices.STATUS_DEPRECATED,
+            ]
+        },
+        {"role": IPAddressRoleChoices.ROLE_VIP},
+        {"role__isnull": True},
+        {"description__icontains": "balancer"},
+        {"vrf": None},
+        {"vrf__isnull": False},
+        {"tenant__isnull": True},
+        {
+            "dns_name__startswith": "name",
+            "status": IPAddressStatusChoices.STATUS_ACTIVE,
+        },
+        [
+            {"status": IPAddressStatusChoices.STATUS_RESERVED},
+            {"dns_name__endswith": ".zone2.example.com"},
+        ],
+        [{"status": IPAddressStatusChoices.STATUS_RESERVED}, {}],
+        {"custom_field_data__dns": True},
+        {"custom_field_data__dns": 1},
+        {"custom_field_data__dns": False},
+        {"custom_field_data__dns__in": [True, "Site1"]},
+        {"custom_field_data__site": "Site1"},
+        {"custom_field_data__site__iexact": "SITE1"},
+        {"custom_field_data__site__startswith": "site"},
+        {"custom_field_data__site__istartswith": "site"},
+        {"custom_field_data__site__icontains": "TE2"},
+        {"custom_field_data__rank": None},
+        {"custom_field_data__rank__isnull": True},
+        {"custom_field_data__rank__isnull": False},
+        {"custom_field_data__nested__key__0": "a"},
+        {"custom_field_data__nested__key": ["a", "b"]},
+        {"custom_field_data__nested": {"key": ["a", "b"]}},
+        {"custom_field_data__missing": "value"},
+        {"custom_field_data__dns__startswith": "t"},
+    )
+
+    tag_filters = (
+        {"tags__name": "Tag 1"},
+        {"tags__slug": "tag-2"},
+        {"tags__slug__in": ["tag-2", "tag-3"]},
+        {"tags__name": "Tag 1", "tags__slug": "tag-2"},
+        {"tags__isnull": True},
+        {"tags__isnull": False},
+        {"tags__name__istartswith": "tag", "dns_name__contains": "zone2"},
+    )
+
+    unsupported_filters = (
+        {"dns_name__regex": r"^name\d\."},
+        {"address__net_host": "10.0.0.1"},
+        {"vrf__name": "vrf1"},
+        {"custom_field_data__rank__gte": 1},
+        {"custom_field_data__nested__contains": {"key": ["a"]}},
+        {"custom_field_data__site__contains": "Site"},
+        {"status__isnull": "yes"},
+    )
+
+    def assertConformance(self, ip_address_filter, check_query=True):
+        predicate = compile_ip_address_filter(ip_address_filter)
+        query = get_query_from_filter(ip_address_filter)
+
+        for ip_address in IPAddress.objects.all():
+            with self.subTest(ip_address_filter=ip_address_filter, ip=ip_address):
+                expected = IPAddress.objects.filter(query, pk=ip_address.pk).exists()
+
+                self.assertEqual(predicate(ip_address), expected)
+                if check_query:
+                    self.assertEqual(
+                        check_filter(ip_address, ip_address_filter), expected
+                    )
+
+    def test_conformance(self):
+        for ip_address_filter in self.filters:
+            self.assertConformance(ip_address_filter)
+
+    def test_conformance_tags(self):
+        for ip_address_filter in self.tag_filters:
+            self.assertConformance(ip_address_filter, check_query=False)
+
+    def test_unsupported_filters(self):
+        for ip_address_filter in self.unsupported_filters:
+            with self.subTest(ip_address_filter=ip_address_filter):
+                with self.assertRaises(UnsupportedFilterError):
+                    compile_ip_address_filter(ip_address_filter)
+
+    def test_unsupported_value(self):
+        ip_address = self.ip_addresses[0]
+        ip_address.custom_field_data["site"] = 1.5
+
+        predicate = compile_ip_address_filter(
+            {"custom_field_data__site__startswith": "1"}
+        )
+        with self.assertRaises(UnsupportedFilterError):
+            predicate(ip_address)
+
+    def test_cache_fallback(self):
+        view = View.objects.create(
+            name="view1", ip_address_filter={"dns_name__regex": r"^name1\."}
+        )
+
+        self.assertIsNone(ip_address_filter_cache.get_predicate(view))
+        self.assertTrue(ip_address_filter_cache.check(self.ip_addresses[0], view))
+        self.assertFalse(ip_address_filter_cache.check(self.ip_addresses[1], view))
+
+    def test_cache_invalidation(self):
+        view = View.objects.create(
+            name="view1", ip_address_filter={"dns_name__startswith": "name1."}
+        )
+
+        self.assertTrue(ip_address_filter_cache.check(self.ip_addresses[0], view))
+        self.assertFalse(ip_address_filter_cache.check(self.ip_addresses[1], view))
+
+        view.ip_address_filter = {"dns_name__istartswith": "name2."}
+        self.assertFalse(ip_address_filter_cache.check(self.ip_addresses[0], view))
+        self.assertTrue(ip_address_filter_cache.check(self.ip_addresses[1], view))
+
+        view.save()
+        rebuilds = ip_address_filter_cache.rebuilds
+        self.assertEqual(
+            ip_address_filter_cache.data[view.pk][0],
+            {"dns_name__istartswith": "name2."},
+        )
+        self.assertEqual(ip_address_filter_cache.rebuilds, rebuilds + 1)
+
+        view.ip_address_filter = None
+        self.assertTrue(ip_address_filter_cache.check(self.ip_addresses[0], view))
@@ -0,0 +1,150 @@
+from unittest import mock
+
+from netaddr import IPAddress, IPNetwork
+
+from django.test import TestCase
+from django.db import transaction
+
+from ipam.models import Prefix, VRF
+
+from netbox_dns.models import View
+from netbox_dns.utilities import prefix_view_tree, ProcessCache
+
+
+class DNSsyncPrefixViewTreeTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.views = [
+            View(name="view1"),
+            View(name="view2"),
+            View(name="view3"),
+        ]
+        View.objects.bulk_create(cls.views)
+
+        cls.vrf = VRF.objects.create(name="vrf1")
+
+        cls.prefixes = (
+            Prefix(prefix="10.0.0.0/8"),
+            Prefix(prefix="10.0.0.0/16"),
+            Prefix(prefix="10.0.0.0/24"),
+            Prefix(prefix="10.0.0.0/16", vrf=cls.vrf),
+            Prefix(prefix="2001:db8::/32"),
+        )
+        Prefix.objects.bulk_create(cls.prefixes)
+
+        cls.views[0].prefixes.add(cls.prefixes[0], cls.prefixes[4])
+        cls.views[1].prefixes.add(cls.prefixes[2])
+        cls.views[2].prefixes.add(cls.prefixes[2], cls.prefixes[3])
+
+    def test_longest_prefix_match(self):
+        self.assertEqual(
+            set(prefix_view_tree.get_view_ids(None, IPAddress("10.0.0.1"))),
+            {self.views[1].pk, self.views[2].pk},
+        )
+        self.assertEqual(
+            set(prefix_view_tree.get_view_ids(None, IPAddress("10.0.1.1"))),
+            {self.views[0].pk},
+        )
+        self.assertEqual(
+            set(prefix_view_tree.get_view_ids(None, IPAddress("2001:db8::1"))),
+            {self.views[0].pk},
+        )
+        self.assertEqual(prefix_view_tree.get_view_ids(None, IPAddress("11.0.0.1")), ())
+
+    def test_longest_prefix_match_vrf(self):
+        self.assertEqual(
+            set(prefix_view_tree.get_view_ids(self.vrf.pk, IPAddress("10.0.0.1"))),
+            {self.views[2].pk},
+        )
+        self.assertEqual(
+            prefix_view_tree.get_view_ids(self.vrf.pk, IPAddress("10.1.0.1")), ()
+        )
+
+    def test_network_match(self):
+        self.assertEqual(
+            set(prefix_view_tree.get_view_ids(None, IPNetwork("10.0.0.0/24"))),
+            {self.views[1].pk, self.views[2].pk},
+        )
+        self.assertEqual(
+            set(prefix_view_tree.get_view_ids(None, IPNetwork("10.0.0.0/16"))),
+            {self.views[0].pk},
+        )
+        self.assertEqual(
+            set(prefix_view_tree.get_view_ids(None, IPNetwork("10.0.0.0/25"))),
+            {self.views[1].pk, self.views[2].pk},
+        )
+
+    def test_invalidate_view_prefix_add(self):
+        self.assertEqual(
+            set(prefix_view_tree.get_view_ids(None, IPAddress("10.0.1.1"))),
+            {self.views[0].pk},
+        )
+
+        self.views[1].prefixes.add(self.prefixes[1])
+
+        self.assertEqual(
+            set(prefix_view_tree.get_view_ids(None, IPAddress("10.0.1.1"))),
+            {self.views[1].pk},
+        )
+
+    def test_invalidate_view_prefix_remove(self):
+        self.assertEqual(
+            set(prefix_view_tree.get_view_ids(None, IPAddress("10.0.0.1"))),
+            {self.views[1].pk, self.views[2].pk},
+        )
+
+        self.views[1].prefixes.remove(self.prefixes[2])
+        self.views[2].prefixes.remove(self.prefixes[2])
+
+        self.assertEqual(
+            set(prefix_view_tree.get_view_ids(None, IPAddress("10.0.0.1"))),
+            {self.views[0].pk},
+        )
+
+    def test_invalidate_prefix_delete(self):
+        self.prefixes[2].delete()
+
+        self.assertEqual(
+            set(prefix_view_tree.get_view_ids(None, IPAddress("10.0.0.1"))),
+            {self.views[0].pk},
+        )
+
+    def test_hit_miss_counters(self):
+        stats = prefix_view_tree.stats
+
+        prefix_view_tree.get_view_ids(None, IPAddress("10.0.0.1"))
+        prefix_view_tree.get_view_ids(None, IPAddress("10.0.1.1"))
+        prefix_view_tree.get_view_ids(None, IPAddress("192.0.2.1"))
+
+        self.assertEqual(prefix_view_tree.stats["hits"], stats["hits"] + 2)
+        self.assertEqual(prefix_view_tree.stats["misses"], stats["misses"] + 1)
+
+    def test_version_checked_once(self):
+        ProcessCache.expire_versions()
+
+        with mock.patch(
+            "netbox_dns.utilities.process_cache.cache.get", return_value=None
+        ) as cache_get:
+            for address in ("10.0.0.1", "10.0.1.1", "10.1.0.1", "192.0.2.1"):
+                prefix_view_tree.get_view_ids(None, IPAddress(address))
+
+        self.assertEqual(cache_get.call_count, 1)
+
+    def test_rollback(self):
+        prefix_view_tree.get_view_ids(None, IPAddress("10.0.0.1"))
+
+        try:
+            with transaction.atomic():
+                self.views[1].prefixes.remove(self.prefixes[2])
+                self.assertEqual(
+                    set(prefix_view_tree.get_view_ids(None, IPAddress("10.0.0.1"))),
+                    {self.views[2].pk},
+                )
+                raise RuntimeError
+        except RuntimeError:
+            pass
+
+        self.assertEqual(
+            set(prefix_view_tree.get_view_ids(None, IPAddress("10.0.0.1"))),
+            {self.views[1].pk, self.views[2].pk},
+        )
@@ -0,0 +1,284 @@
+import socketserver
+import struct
+import threading
+from io import StringIO
+
+import dns.message
+import dns.rcode
+import dns.rrset
+import dns.zone
+from dns import name as dns_name
+from dns import rdatatype
+
+from django.test import TestCase, TransactionTestCase
+from django.core import management
+
+from netbox_dns.models import NameServer, View, Zone
+from netbox_dns.choices import RecordTypeChoices
+
+ZONE_NAME = "zone1.example.com."
+SOA_VALUE = "ns1.example.com. hostmaster.example.com. {serial} 172800 7200 2592000 3600"
+
+
+def zone_text(serial, records):
+    return (
+        f"$TTL 86400\n@ 3600 IN SOA {SOA_VALUE.format(serial=serial)}\n"
+        "@ IN NS ns1.example.com.\n@ IN NS ns2.example.com.\n" + records
+    )
+
+
+def soa_rrset(serial):
+    return dns.rrset.from_text(
+        ZONE_NAME, 3600, "IN", "SOA", SOA_VALUE.format(serial=serial)
+    )
+
+
+def record_rrsets(records):
+    return [
+        dns.rrset.from_text(
+            dns_name.from_text(name, dns_name.from_text(ZONE_NAME)),
+            ttl,
+            "IN",
+            record_type,
+            value,
+        )
+        for name, ttl, record_type, value in records
+    ]
+
+
+class XFRHandler(socketserver.BaseRequestHandler):
+    def recv(self, length):
+        data = b""
+        while len(data) < length:
+            data += self.request.recv(length - len(data))
+
+        return data
+
+    def handle(self):
+        (length,) = struct.unpack("!H", self.recv(2))
+        query = dns.message.from_wire(self.recv(length))
+        rdtype = query.question[0].rdtype
+
+        origin = query.question[0].name
+        if origin.to_text() not in self.server.origins:
+            response = dns.message.make_response(query)
+            response.set_rcode(dns.rcode.REFUSED)
+            wire = response.to_wire()
+            self.request.sendall(struct.pack("!H", len(wire)) + wire)
+            return
+
+        zone = dns.zone.from_text(
+            self.server.zone_text, origin=origin, relativize=False
+        )
+        soa = zone.find_rrset(origin, rdatatype.SOA)
+        serial = soa[0].serial
+
+        response = dns.message.make_response(query)
+        if rdtype == rdatatype.IXFR and query.authority[0][0].serial == serial:
+            response.answer = [soa]
+        elif rdtype == rdatatype.IXFR and (
+            changes := self.server.ixfr.get(query.authority[0][0].serial)
+        ):
+            response.answer = [soa]
+            for old_serial, deleted, new_serial, added in changes:
+                response.answer += [soa_rrset(old_serial), *record_rrsets(deleted)]
+                response.answer += [soa_rrset(new_serial), *record_rrsets(added)]
+            response.answer.append(soa)
+        else:
+            response.answer = [soa]
+            for name, rdataset in zone.iterate_rdatasets():
+                if rdataset.rdtype != rdatatype.SOA:
+                    response.answer.append(
+                        dns.rrset.from_rdata_list(name, rdataset.ttl, list(rdataset))
+                    )
+            response.answer.append(soa)
+
+        wire = response.to_wire()
+        self.request.sendall(struct.pack("!H", len(wire)) + wire)
+
+
+class XFRServerMixin:
+    def setUp(self):
+        super().setUp()
+
+        self.server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), XFRHandler)
+        self.server.daemon_threads = True
+        self.server.zone_text = zone_text(
+            1,
+            "name1 IN A 10.0.0.1\n"
+            "name2 300 IN A 10.0.0.2\n"
+            "name3 IN CNAME name1\n"
+            "sub IN NS ns1.sub\n",
+        )
+        self.server.ixfr = {}
+        self.server.origins = {ZONE_NAME}
+
+        self.thread = threading.Thread(target=self.server.serve_forever)
+        self.thread.start()
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+        self.thread.join()
+
+        super().tearDown()
+
+    def axfr_import(self, *zones, **options):
+        stdout = StringIO()
+        management.call_command(
+            "axfr_import",
+            *zones,
+            server="127.0.0.1",
+            port=self.server.server_address[1],
+            stdout=stdout,
+            stderr=StringIO(),
+            **options,
+        )
+
+        return stdout.getvalue()
+
+    def get_records(self, zone):
+        return set(
+            zone.records.filter(managed=False).values_list(
+                "name", "type", "value", "ttl"
+            )
+        )
+
+
+class NetBoxDNSManagementAXFRImportTestCase(XFRServerMixin, TestCase):
+    def test_import(self):
+        self.axfr_import("zone1.example.com")
+
+        zone = Zone.objects.get(name="zone1.example.com")
+        self.assertEqual(zone.view, View.get_default_view())
+        self.assertEqual(zone.soa_serial, 1)
+        self.assertFalse(zone.soa_serial_auto)
+        self.assertEqual(zone.soa_mname.name, "ns1.example.com")
+        self.assertEqual(
+            {nameserver.name for nameserver in zone.nameservers.all()},
+            {"ns1.example.com", "ns2.example.com"},
+        )
+        self.assertEqual(
+            self.get_records(zone),
+            {
+                ("name1", RecordTypeChoices.A, "10.0.0.1", None),
+                ("name2", RecordTypeChoices.A, "10.0.0.2", 300),
+                ("name3", RecordTypeChoices.CNAME, "name1", None),
+                ("sub", RecordTypeChoices.NS, "ns1.sub", None),
+            },
+        )
+
+    def test_refresh_unchanged(self):
+        self.axfr_import("zone1.example.com")
+
+        output = self.axfr_import("zone1.example.com")
+
+        self.assertIn("unchanged", output)
+
+    def test_refresh_axfr(self):
+        self.axfr_import("zone1.example.com")
+
+        self.server.zone_text = zone_text(
+            2,
+            "name1 IN A 10.0.0.1\n"
+            "name2 3600 IN A 10.0.0.2\n"
+            "name4 IN A 10.0.0.4\n"
+            "sub IN NS ns1.sub\n",
+        )
+        self.axfr_import("zone1.example.com")
+
+        zone = Zone.objects.get(name="zone1.example.com")
+        self.assertEqual(zone.soa_serial, 2)
+        self.assertEqual(
+            self.get_records(zone),
+            {
+                ("name1", RecordTypeChoices.A, "10.0.0.1", None),
+                ("name2", RecordTypeChoices.A, "10.0.0.2", 3600),
+                ("name4", RecordTypeChoices.A, "10.0.0.4", None),
+                ("sub", RecordTypeChoices.NS, "ns1.sub", None),
+            },
+        )
+
+    def test_refresh_ixfr(self):
+        self.axfr_import("zone1.example.com")
+
+        self.server.zone_text = zone_text(3, "")
+        self.server.ixfr = {
+            1: [
+                (
+                    1,
+                    [("name3", 86400, "CNAME", "name1")],
+                    2,
+                    [("name4", 86400, "A", "10.0.0.4")],
+                ),
+                (
+                    2,
+                    [("@", 86400, "NS", "ns2.example.com.")],
+                    3,
+                    [("name5", 600, "A", "10.0.0.5")],
+                ),
+            ]
+        }
+        output = self.axfr_import("zone1.example.com")
+        self.assertIn("IXFR", output)
+
+        zone = Zone.objects.get(name="zone1.example.com")
+        self.assertEqual(zone.soa_serial, 3)
+        self.assertEqual(
+            {nameserver.name for nameserver in zone.nameservers.all()},
+            {"ns1.example.com"},
+        )
+        self.assertEqual(
+            self.get_records(zone),
+            {
+                ("name1", RecordTypeChoices.A, "10.0.0.1", None),
+                ("name2", RecordTypeChoices.A, "10.0.0.2", 300),
+                ("name4", RecordTypeChoices.A, "10.0.0.4", None),
+                ("name5", RecordTypeChoices.A, "10.0.0.5", 600),
+                ("sub", RecordTypeChoices.NS, "ns1.sub", None),
+            },
+        )
+
+    def test_transfer_failed(self):
+        self.axfr_import("zone2.example.com")
+
+        self.assertFalse(Zone.objects.filter(name="zone2.example.com").exists())
+
+
+class NetBoxDNSManagementAXFRImportConcurrencyTestCase(
+    XFRServerMixin, TransactionTestCase
+):
+    serialized_rollback = True
+
+    def test_import_concurrency(self):
+        zone_names = [f"zone{index}.example.com" for index in range(1, 9)]
+        self.server.origins = {f"{zone_name}." for zone_name in zone_names}
+
+        output = self.axfr_import(*zone_names, concurrency=4)
+
+        self.assertEqual(output.count(" imported "), len(zone_names))
+        self.assertEqual(
+            set(Zone.objects.values_list("name", flat=True)), set(zone_names)
+        )
+        self.assertEqual(
+            set(NameServer.objects.values_list("name", flat=True)),
+            {"ns1.example.com", "ns2.example.com"},
+        )
+
+        self.server.zone_text = zone_text(
+            2,
+            "name1 IN A 10.0.0.1\n" "@ IN NS NS3.example.com.\n",
+        )
+        output = self.axfr_import(*zone_names, concurrency=4)
+
+        self.assertEqual(output.count("refreshed (AXFR)"), len(zone_names))
+        self.assertEqual(
+            {
+                name.lower()
+                for name in NameServer.objects.values_list("name", flat=True)
+            },
+            {"ns1.example.com", "ns2.example.com", "ns3.example.com"},
+        )
+        for zone in Zone.objects.all():
+            self.assertEqual(zone.soa_serial, 2)
+            self.assertEqual(len(zone.nameservers.all()), 3)
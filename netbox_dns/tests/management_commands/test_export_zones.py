@@ -0,0 +1,104 @@
+import json
+import tempfile
+from pathlib import Path
+
+from django.test import TestCase
+from django.core import management
+
+from netbox_dns.models import NameServer, Record, Zone
+from netbox_dns.choices import RecordTypeChoices, ZoneStatusChoices
+
+
+class NetBoxDNSManagementExportZonesTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.zone_data = {
+            "soa_mname": NameServer.objects.create(name="ns1.example.com"),
+            "soa_rname": "hostmaster.example.com",
+        }
+
+        cls.zones = (
+            Zone(name="zone1.example.com", **cls.zone_data),
+            Zone(name="zone2.example.com", **cls.zone_data),
+            Zone(
+                name="zone3.example.com",
+                status=ZoneStatusChoices.STATUS_DEPRECATED,
+                **cls.zone_data,
+            ),
+        )
+        for zone in cls.zones:
+            zone.save()
+
+        Record.objects.create(
+            zone=cls.zones[0],
+            name="name1",
+            type=RecordTypeChoices.A,
+            value="10.0.0.1",
+        )
+
+    def setUp(self):
+        self.export_dir = tempfile.TemporaryDirectory()
+        self.export_path = Path(self.export_dir.name)
+
+    def tearDown(self):
+        self.export_dir.cleanup()
+
+    def export_zones(self, **options):
+        management.call_command(
+            "export_zones", str(self.export_path), verbosity=0, **options
+        )
+
+    def get_zone_file(self, zone):
+        return self.export_path / zone.view.name / f"{zone.name}.db"
+
+    def test_export_zones(self):
+        self.export_zones()
+
+        self.assertTrue(self.get_zone_file(self.zones[0]).exists())
+        self.assertTrue(self.get_zone_file(self.zones[1]).exists())
+        self.assertFalse(self.get_zone_file(self.zones[2]).exists())
+
+        self.assertIn("name1", self.get_zone_file(self.zones[0]).read_text())
+
+        manifest = json.loads(
+            (self.export_path / ".netbox-dns-export.json").read_text()
+        )
+        self.assertEqual(
+            manifest["zones"][str(self.zones[0].pk)]["soa_serial"],
+            Zone.objects.get(pk=self.zones[0].pk).soa_serial,
+        )
+
+    def test_export_unchanged_zones(self):
+        self.export_zones()
+
+        zone_file = self.get_zone_file(self.zones[0])
+        zone_file.write_text("unchanged")
+
+        self.export_zones()
+        self.assertEqual(zone_file.read_text(), "unchanged")
+
+        self.export_zones(force=True)
+        self.assertNotEqual(zone_file.read_text(), "unchanged")
+
+    def test_export_changed_zones(self):
+        self.export_zones()
+
+        zone_file = self.get_zone_file(self.zones[0])
+        zone_file.write_text("changed")
+
+        zone = Zone.objects.get(pk=self.zones[0].pk)
+        Zone.objects.filter(pk=zone.pk).update(soa_serial=zone.soa_serial + 1)
+
+        self.export_zones()
+        self.assertNotEqual(zone_file.read_text(), "changed")
+
+    def test_export_removed_zones(self):
+        self.export_zones()
+
+        zone_file = self.get_zone_file(self.zones[1])
+        self.assertTrue(zone_file.exists())
+
+        self.zones[1].delete()
+
+        self.export_zones()
+        self.assertFalse(zone_file.exists())
@@ -0,0 +1,176 @@
+import tempfile
+from io import StringIO
+from pathlib import Path
+
+from django.test import TestCase, TransactionTestCase
+from django.core import management
+
+from netbox_dns.models import NameServer, Record, View, Zone
+from netbox_dns.choices import RecordTypeChoices
+
+ZONE_FILE = """
+$TTL 86400
+@       3600 IN SOA  ns1.example.com. hostmaster.example.com. (
+                     2024010101 172800 7200 2592000 3600 )
+        IN NS        ns1.example.com.
+        IN NS        ns2.example.com.
+name1   IN A         10.0.0.1
+name2   300 IN A     10.0.0.2
+name3   IN CNAME     name1
+sub     IN NS        ns1.sub
+ns1.sub IN A         10.0.0.53
+txt     IN TXT       "text"
+"""
+
+
+class NetBoxDNSManagementImportZonefileTestCase(TestCase):
+    def setUp(self):
+        self.import_dir = tempfile.TemporaryDirectory()
+        self.import_path = Path(self.import_dir.name)
+
+    def tearDown(self):
+        self.import_dir.cleanup()
+
+    def write_zone_file(self, zone_name, content=ZONE_FILE):
+        file_path = self.import_path / f"{zone_name}.db"
+        file_path.write_text(content, encoding="utf-8")
+
+        return file_path
+
+    def test_import_zone_file(self):
+        file_path = self.write_zone_file("zone1.example.com")
+
+        management.call_command(
+            "import_zonefile", str(file_path), origin="zone1.example.com", verbosity=0
+        )
+
+        zone = Zone.objects.get(name="zone1.example.com")
+        self.assertEqual(zone.view, View.get_default_view())
+        self.assertEqual(zone.soa_mname.name, "ns1.example.com")
+        self.assertEqual(zone.soa_rname, "hostmaster.example.com")
+        self.assertEqual(zone.soa_serial, 2024010101)
+        self.assertFalse(zone.soa_serial_auto)
+        self.assertEqual(zone.soa_ttl, 3600)
+        self.assertEqual(zone.soa_refresh, 172800)
+        self.assertEqual(
+            {nameserver.name for nameserver in zone.nameservers.all()},
+            {"ns1.example.com", "ns2.example.com"},
+        )
+
+        self.assertEqual(
+            set(
+                zone.records.filter(managed=False).values_list(
+                    "name", "type", "value", "ttl"
+                )
+            ),
+            {
+                ("name1", RecordTypeChoices.A, "10.0.0.1", None),
+                ("name2", RecordTypeChoices.A, "10.0.0.2", 300),
+                ("name3", RecordTypeChoices.CNAME, "name1", None),
+                ("sub", RecordTypeChoices.NS, "ns1.sub", None),
+                ("ns1.sub", RecordTypeChoices.A, "10.0.0.53", None),
+                ("txt", RecordTypeChoices.TXT, '"text"', None),
+            },
+        )
+
+    def test_import_directory(self):
+        for index in range(1, 4):
+            self.write_zone_file(f"zone{index}.example.com")
+        view = View.objects.create(name="view1")
+
+        management.call_command(
+            "import_zonefile", str(self.import_path), view="view1", verbosity=0
+        )
+
+        self.assertEqual(
+            set(view.zones.values_list("name", flat=True)),
+            {"zone1.example.com", "zone2.example.com", "zone3.example.com"},
+        )
+
+    def test_import_errors(self):
+        file_path = self.write_zone_file(
+            "zone1.example.com", ZONE_FILE + "na_me4 IN A 10.0.0.4\n"
+        )
+
+        management.call_command(
+            "import_zonefile",
+            str(file_path),
+            origin="zone1.example.com",
+            stderr=StringIO(),
+            verbosity=0,
+        )
+        self.assertFalse(Zone.objects.filter(name="zone1.example.com").exists())
+
+        management.call_command(
+            "import_zonefile",
+            str(file_path),
+            origin="zone1.example.com",
+            ignore_errors=True,
+            stderr=StringIO(),
+            verbosity=0,
+        )
+        zone = Zone.objects.get(name="zone1.example.com")
+        self.assertTrue(Record.objects.filter(zone=zone, name="name1").exists())
+        self.assertFalse(Record.objects.filter(zone=zone, name="na_me4").exists())
+
+    def test_existing_zone(self):
+        Zone.objects.create(
+            name="zone1.example.com",
+            soa_mname=NameServer.objects.create(name="ns1.example.com"),
+            soa_rname="hostmaster.example.com",
+        )
+        file_path = self.write_zone_file("zone1.example.com")
+
+        management.call_command(
+            "import_zonefile",
+            str(file_path),
+            origin="zone1.example.com",
+            stderr=StringIO(),
+            verbosity=0,
+        )
+
+        self.assertEqual(Zone.objects.filter(name="zone1.example.com").count(), 1)
+
+
+class NetBoxDNSManagementImportZonefileJobsTestCase(TransactionTestCase):
+    serialized_rollback = True
+
+    def setUp(self):
+        self.import_dir = tempfile.TemporaryDirectory()
+        self.import_path = Path(self.import_dir.name)
+
+    def tearDown(self):
+        self.import_dir.cleanup()
+
+    def test_import_jobs(self):
+        NameServer.objects.create(name="ns1.example.com")
+
+        for index in range(1, 9):
+            content = ZONE_FILE
+            if index % 2:
+                content = content.replace("ns1.example.com.", "NS1.EXAMPLE.COM.")
+                content = content.replace("ns2.example.com.", "NS2.example.com.")
+
+            (self.import_path / f"zone{index}.example.com.db").write_text(
+                content, encoding="utf-8"
+            )
+
+        stderr = StringIO()
+        management.call_command(
+            "import_zonefile", str(self.import_path), jobs=4, stderr=stderr, verbosity=0
+        )
+
+        self.assertEqual(stderr.getvalue(), "")
+        self.assertEqual(
+            set(Zone.objects.values_list("name", flat=True)),
+            {f"zone{index}.example.com" for index in range(1, 9)},
+        )
+        self.assertEqual(NameServer.objects.count(), 2)
+        self.assertEqual(
+            {
+                nameserver.name.lower()
+                for zone in Zone.objects.all()
+                for nameserver in (zone.soa_mname, *zone.nameservers.all())
+            },
+            {"ns1.example.com", "ns2.example.com"},
+        )
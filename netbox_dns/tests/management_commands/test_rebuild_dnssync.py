@@ -196,3 +196,110 @@ class NetBoxDNSManagementRebuildDNSsyncTestCase(TestCase):
                     type=RecordTypeChoices.PTR, value=f"{ip_address.dns_name}."
                 ).exists()
             )
+
+    def test_rebuild_dnssync_partitioned(self):
+        nameserver = NameServer.objects.create(name="ns1.example.com")
+        zone = Zone.objects.create(
+            name="zone1.example.com",
+            soa_mname=nameserver,
+            soa_rname="hostmaster.example.com",
+        )
+        Zone.objects.create(
+            name="0.0.10.in-addr.arpa",
+            soa_mname=nameserver,
+            soa_rname="hostmaster.example.com",
+        )
+        Zone.objects.create(
+            name="0.0.0.0.0.0.0.0.8.b.d.0.1.0.0.2.ip6.arpa",
+            soa_mname=nameserver,
+            soa_rname="hostmaster.example.com",
+        )
+
+        prefixes = (
+            Prefix.objects.create(prefix="10.0.0.0/24"),
+            Prefix.objects.create(prefix="2001:db8::/32"),
+        )
+        zone.view.prefixes.add(*prefixes)
+
+        ip_addresses = (
+            IPAddress(
+                address=IPNetwork("10.0.0.1/24"), dns_name="name1.zone1.example.com"
+            ),
+            IPAddress(
+                address=IPNetwork("10.0.0.2/24"), dns_name="name2.zone1.example.com"
+            ),
+            IPAddress(
+                address=IPNetwork("2001:db8::3/64"), dns_name="name3.zone1.example.com"
+            ),
+            IPAddress(
+                address=IPNetwork("2001:db8::4/64"), dns_name="name4.zone1.example.com"
+            ),
+            IPAddress(
+                address=IPNetwork("192.0.2.1/24"), dns_name="name5.zone1.example.com"
+            ),
+        )
+        for ip_address in ip_addresses:
+            ip_address.save()
+
+        Record.objects.filter(ipam_ip_address__isnull=False).update(name="invalid.name")
+        Record.objects.filter(type=RecordTypeChoices.PTR).delete()
+
+        for partition in ("none", "vrf", "prefix"):
+            with self.subTest(partition=partition):
+                management.call_command(
+                    "rebuild_dnssync", partition=partition, chunk_size=2, verbosity=0
+                )
+
+                for ip_address in ip_addresses[:4]:
+                    self.assertTrue(
+                        Record.objects.filter(
+                            fqdn=f"{ip_address.dns_name}.",
+                            value=ip_address.address.ip,
+                            ipam_ip_address=ip_address,
+                        ).exists()
+                    )
+                    self.assertTrue(
+                        Record.objects.filter(
+                            type=RecordTypeChoices.PTR,
+                            value=f"{ip_address.dns_name}.",
+                        ).exists()
+                    )
+
+                self.assertFalse(
+                    Record.objects.filter(ipam_ip_address=ip_addresses[4]).exists()
+                )
+                self.assertFalse(Record.objects.filter(name="invalid.name").exists())
+                self.assertEqual(
+                    Record.objects.filter(ipam_ip_address__isnull=False).count(), 4
+                )
+                self.assertEqual(
+                    Record.objects.filter(type=RecordTypeChoices.PTR).count(), 4
+                )
+
+    def test_rebuild_dnssync_remove_stale_records(self):
+        nameserver = NameServer.objects.create(name="ns1.example.com")
+        zone = Zone.objects.create(
+            name="zone1.example.com",
+            soa_mname=nameserver,
+            soa_rname="hostmaster.example.com",
+        )
+        Zone.objects.create(
+            name="0.0.10.in-addr.arpa",
+            soa_mname=nameserver,
+            soa_rname="hostmaster.example.com",
+        )
+
+        prefix = Prefix.objects.create(prefix="10.0.0.0/24")
+        zone.view.prefixes.add(prefix)
+
+        ip_address = IPAddress.objects.create(
+            address=IPNetwork("10.0.0.1/24"), dns_name="name1.zone1.example.com"
+        )
+        self.assertTrue(Record.objects.filter(ipam_ip_address=ip_address).exists())
+
+        IPAddress.objects.filter(pk=ip_address.pk).update(dns_name="")
+
+        management.call_command("rebuild_dnssync", verbosity=0)
+
+        self.assertFalse(Record.objects.filter(ipam_ip_address=ip_address).exists())
+        self.assertFalse(Record.objects.filter(type=RecordTypeChoices.PTR).exists())
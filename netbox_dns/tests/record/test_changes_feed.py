@@ -0,0 +1,226 @@
+from datetime import timedelta
+from unittest import mock
+
+from django.conf import settings
+from django.utils import timezone
+from django.urls import reverse
+from rest_framework import status
+
+from netbox_dns.tests.custom import APITestCase
+from netbox_dns.models import NameServer, Record, Tombstone, Zone
+from netbox_dns.choices import RecordTypeChoices
+from netbox_dns.jobs import TombstoneCleanupJob
+
+
+class ChangesFeedTestCase(APITestCase):
+    model = Record
+
+    @classmethod
+    def setUpTestData(cls):
+        nameserver = NameServer.objects.create(name="ns1.example.com")
+        cls.zones = (
+            Zone.objects.create(
+                name="zone1.example.com",
+                soa_mname=nameserver,
+                soa_rname="hostmaster.example.com",
+            ),
+            Zone.objects.create(
+                name="zone2.example.com",
+                soa_mname=nameserver,
+                soa_rname="hostmaster.example.com",
+            ),
+        )
+
+    def setUp(self):
+        super().setUp()
+
+        patcher = mock.patch.dict(
+            settings.PLUGINS_CONFIG["netbox_dns"], {"changes_feed_safety_lag": 0}
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def get_changes(self, model="record", **params):
+        return self.client.get(
+            reverse(f"plugins-api:netbox_dns-api:{model}-changes"),
+            params,
+            **self.header,
+        )
+
+    def create_record(self, name, zone=None):
+        return Record.objects.create(
+            zone=zone or self.zones[0],
+            name=name,
+            type=RecordTypeChoices.A,
+            value="10.0.0.1",
+        )
+
+    def test_changed_records(self):
+        self.add_permissions("netbox_dns.view_record")
+
+        response = self.get_changes()
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        cursor = response.data["cursor"]
+
+        response = self.get_changes(cursor=cursor)
+        self.assertEqual(response.data["changed"], [])
+        self.assertEqual(response.data["deleted"], [])
+        cursor = response.data["cursor"]
+
+        record1 = self.create_record("name1")
+        record2 = self.create_record("name2")
+
+        response = self.get_changes(cursor=cursor, type=RecordTypeChoices.A)
+        self.assertEqual(
+            [record["id"] for record in response.data["changed"]],
+            [record1.pk, record2.pk],
+        )
+        self.assertFalse(response.data["more"])
+        cursor = response.data["cursor"]
+
+        record1.ttl = 3600
+        record1.save()
+
+        response = self.get_changes(cursor=cursor, type=RecordTypeChoices.A)
+        self.assertEqual(
+            [record["id"] for record in response.data["changed"]], [record1.pk]
+        )
+
+    def test_limit(self):
+        self.add_permissions("netbox_dns.view_record")
+
+        response = self.get_changes()
+        cursor = response.data["cursor"]
+
+        records = [self.create_record(f"name{index}") for index in range(3)]
+
+        response = self.get_changes(cursor=cursor, type=RecordTypeChoices.A, limit=2)
+        self.assertEqual(
+            [record["id"] for record in response.data["changed"]],
+            [record.pk for record in records[:2]],
+        )
+        self.assertTrue(response.data["more"])
+
+        response = self.get_changes(
+            cursor=response.data["cursor"], type=RecordTypeChoices.A, limit=2
+        )
+        self.assertEqual(
+            [record["id"] for record in response.data["changed"]], [records[2].pk]
+        )
+
+    def test_deleted_records(self):
+        self.add_permissions("netbox_dns.view_record")
+
+        record1 = self.create_record("name1")
+        record2 = self.create_record("name2", zone=self.zones[1])
+        response = self.get_changes()
+        cursor = response.data["cursor"]
+
+        record1_pk = record1.pk
+        record2_pk = record2.pk
+        record1.delete()
+        record2.delete()
+
+        response = self.get_changes(cursor=cursor)
+        self.assertEqual(
+            [(record["id"], record["zone"]) for record in response.data["deleted"]],
+            [(record1_pk, self.zones[0].pk), (record2_pk, self.zones[1].pk)],
+        )
+
+        response = self.get_changes(cursor=cursor, zone_id=self.zones[1].pk)
+        self.assertEqual(
+            [record["id"] for record in response.data["deleted"]], [record2_pk]
+        )
+
+    def test_deleted_zone(self):
+        self.add_permissions("netbox_dns.view_zone")
+
+        zone = Zone.objects.create(
+            name="zone3.example.com",
+            soa_mname=NameServer.objects.get(name="ns1.example.com"),
+            soa_rname="hostmaster.example.com",
+        )
+        self.create_record("name1", zone=zone)
+        zone_pk = zone.pk
+
+        response = self.get_changes(model="zone")
+        self.assertIn(zone_pk, [zone["id"] for zone in response.data["changed"]])
+        cursor = response.data["cursor"]
+
+        zone.delete()
+
+        response = self.get_changes(model="zone", cursor=cursor)
+        self.assertEqual([zone["id"] for zone in response.data["deleted"]], [zone_pk])
+        self.assertFalse(
+            Tombstone.objects.filter(zone_id=zone_pk)
+            .exclude(object_id=zone_pk)
+            .exists()
+        )
+
+    def test_long_poll(self):
+        self.add_permissions("netbox_dns.view_record")
+
+        response = self.get_changes()
+        cursor = response.data["cursor"]
+
+        with mock.patch("netbox_dns.mixins.changes_feed.time.sleep") as sleep:
+            sleep.side_effect = lambda seconds: self.create_record("name1")
+            response = self.get_changes(
+                cursor=cursor, type=RecordTypeChoices.A, timeout=10
+            )
+
+        sleep.assert_called_once()
+        self.assertEqual(len(response.data["changed"]), 1)
+
+    def test_invalid_cursor(self):
+        self.add_permissions("netbox_dns.view_record")
+
+        response = self.get_changes(cursor="invalid")
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+
+    def test_expired_cursor(self):
+        self.add_permissions("netbox_dns.view_record")
+
+        response = self.get_changes()
+        cursor = response.data["cursor"]
+
+        with mock.patch.dict(
+            settings.PLUGINS_CONFIG["netbox_dns"], {"changes_feed_retention": -1}
+        ):
+            response = self.get_changes(cursor=cursor)
+
+        self.assertHttpStatus(response, status.HTTP_410_GONE)
+
+    def test_safety_lag(self):
+        self.add_permissions("netbox_dns.view_record")
+
+        response = self.get_changes()
+        cursor = response.data["cursor"]
+
+        record = self.create_record("name1")
+
+        with mock.patch.dict(
+            settings.PLUGINS_CONFIG["netbox_dns"], {"changes_feed_safety_lag": 60}
+        ):
+            response = self.get_changes(cursor=cursor, type=RecordTypeChoices.A)
+        self.assertEqual(response.data["changed"], [])
+
+        response = self.get_changes(
+            cursor=response.data["cursor"], type=RecordTypeChoices.A
+        )
+        self.assertEqual(
+            [record["id"] for record in response.data["changed"]], [record.pk]
+        )
+
+    def test_tombstone_cleanup(self):
+        self.add_permissions("netbox_dns.view_record")
+
+        record = self.create_record("name1")
+        record.delete()
+        Tombstone.objects.update(deleted=timezone.now() - timedelta(days=31))
+
+        self.get_changes()
+        self.assertTrue(Tombstone.objects.exists())
+
+        TombstoneCleanupJob.enqueue(immediate=True)
+        self.assertFalse(Tombstone.objects.exists())
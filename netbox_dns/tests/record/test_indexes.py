@@ -0,0 +1,85 @@
+import re
+
+from django.db import connection
+from django.db.models.functions import Lower
+from django.test import TestCase
+
+from netbox_dns.models import NameServer, Zone, Record
+from netbox_dns.choices import RecordTypeChoices
+
+
+class RecordIndexTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        nameserver = NameServer.objects.create(name="ns1.example.com")
+
+        cls.zone = Zone.objects.create(
+            name="zone1.example.com",
+            soa_mname=nameserver,
+            soa_rname="hostmaster.example.com",
+        )
+
+        Record.objects.bulk_create(
+            Record(
+                zone=cls.zone,
+                name=f"name{index}",
+                fqdn=f"name{index}.zone1.example.com.",
+                type=RecordTypeChoices.A,
+                value=f"10.{index // 65536}.{index // 256 % 256}.{index % 256}",
+                ip_address=f"10.{index // 65536}.{index // 256 % 256}.{index % 256}",
+            )
+            for index in range(2000)
+        )
+
+        with connection.cursor() as cursor:
+            cursor.execute("ANALYZE netbox_dns_record")
+
+    def setUp(self):
+        # +
+        # The test dataset is far too small for the planner to prefer an index
+        # scan on its own, so sequential scans are discouraged to verify that
+        # the lookups can use an index at all.
+        # -
+        with connection.cursor() as cursor:
+            cursor.execute("SET LOCAL enable_seqscan = off")
+
+    def assertIndexUsed(self, queryset, index_name):
+        plan = queryset.explain()
+
+        self.assertRegex(plan, rf"\b{re.escape(index_name)}\b")
+        self.assertNotIn("Seq Scan", plan)
+
+    def test_zone_name_type_lookup(self):
+        self.assertIndexUsed(
+            Record.objects.filter(
+                zone=self.zone,
+                name="name42",
+                type=RecordTypeChoices.A,
+            ),
+            "netbox_dns_record_zone_name",
+        )
+
+    def test_zone_name_ci_type_lookup(self):
+        self.assertIndexUsed(
+            Record.objects.alias(name_ci=Lower("name")).filter(
+                zone=self.zone,
+                name_ci="name42",
+                type=RecordTypeChoices.A,
+            ),
+            "netbox_dns_record_zone_name_ci",
+        )
+
+    def test_type_ip_address_lookup(self):
+        self.assertIndexUsed(
+            Record.objects.filter(
+                type=RecordTypeChoices.A,
+                ip_address="10.0.0.42",
+            ),
+            "netbox_dns_record_type_ip",
+        )
+
+    def test_ip_address_contained_lookup(self):
+        self.assertIndexUsed(
+            Record.objects.filter(ip_address__contained="10.0.1.0/24"),
+            "netbox_dns_record_ip_gist",
+        )
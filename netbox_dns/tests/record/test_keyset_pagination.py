@@ -0,0 +1,167 @@
+import os
+import time
+from unittest import skipUnless
+
+from django.urls import reverse
+from rest_framework import status
+
+from netbox_dns.tests.custom import APITestCase
+from netbox_dns.models import NameServer, Record, Zone
+from netbox_dns.choices import RecordTypeChoices
+from netbox_dns.api.pagination import KeysetPagination
+
+
+class KeysetPaginationTestCase(APITestCase):
+    model = Record
+
+    @classmethod
+    def setUpTestData(cls):
+        nameserver = NameServer.objects.create(name="ns1.example.com")
+        cls.zones = [
+            Zone.objects.create(
+                name=f"zone{index}.example.com",
+                soa_mname=nameserver,
+                soa_rname="hostmaster.example.com",
+            )
+            for index in range(1, 4)
+        ]
+
+        cls.records = [
+            Record.objects.create(
+                zone=cls.zones[0],
+                name=f"name{index}",
+                type=RecordTypeChoices.A,
+                value=f"10.0.0.{index}",
+            )
+            for index in range(1, 6)
+        ]
+
+    def get_page(self, model="record", url=None, **params):
+        response = self.client.get(
+            url or reverse(f"plugins-api:netbox_dns-api:{model}-list"),
+            params,
+            **self.header,
+        )
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+
+        return response
+
+    def test_record_pages(self):
+        self.add_permissions("netbox_dns.view_record")
+
+        response = self.get_page(cursor="", type=RecordTypeChoices.A, limit=2)
+        self.assertNotIn("count", response.data)
+        self.assertIsNone(response.data["previous"])
+
+        pks = [record["id"] for record in response.data["results"]]
+        while response.data["next"] is not None:
+            response = self.get_page(url=response.data["next"])
+            pks += [record["id"] for record in response.data["results"]]
+
+        self.assertEqual(pks, [record.pk for record in self.records])
+
+    def test_zone_pages(self):
+        self.add_permissions("netbox_dns.view_zone")
+
+        response = self.get_page(model="zone", cursor="", limit=2)
+        self.assertEqual(
+            [zone["id"] for zone in response.data["results"]],
+            [zone.pk for zone in self.zones[:2]],
+        )
+
+        response = self.get_page(url=response.data["next"])
+        self.assertEqual(
+            [zone["id"] for zone in response.data["results"]], [self.zones[2].pk]
+        )
+        self.assertIsNone(response.data["next"])
+
+    def test_offset_pagination(self):
+        self.add_permissions("netbox_dns.view_record")
+
+        response = self.get_page(type=RecordTypeChoices.A, limit=2, offset=2)
+
+        self.assertEqual(response.data["count"], 5)
+        self.assertEqual(len(response.data["results"]), 2)
+
+    def test_invalid_cursor(self):
+        self.add_permissions("netbox_dns.view_record")
+
+        response = self.client.get(
+            reverse("plugins-api:netbox_dns-api:record-list"),
+            {"cursor": "invalid"},
+            **self.header,
+        )
+
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+
+
+@skipUnless(
+    os.environ.get("NETBOX_DNS_BENCHMARK"),
+    "Set NETBOX_DNS_BENCHMARK=<number of records> to run the pagination benchmark",
+)
+class KeysetPaginationBenchmark(APITestCase):
+    """
+    Compare the latency of deep pages with offset and keyset pagination.
+
+    NETBOX_DNS_BENCHMARK=200000 ./manage.py test \\
+        netbox_dns.tests.record.test_keyset_pagination.KeysetPaginationBenchmark
+    """
+
+    model = Record
+    page_size = 100
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.zone = Zone.objects.create(
+            name="zone1.example.com",
+            soa_mname=NameServer.objects.create(name="ns1.example.com"),
+            soa_rname="hostmaster.example.com",
+        )
+
+        cls.record_count = int(os.environ.get("NETBOX_DNS_BENCHMARK"))
+        Record.objects.bulk_create(
+            (
+                Record(
+                    zone=cls.zone,
+                    name=f"name{index}",
+                    fqdn=f"name{index}.zone1.example.com.",
+                    type=RecordTypeChoices.TXT,
+                    value=f'"{index}"',
+                )
+                for index in range(cls.record_count)
+            ),
+            batch_size=5000,
+        )
+
+    def time_request(self, **params):
+        start = time.perf_counter()
+        response = self.client.get(
+            reverse("plugins-api:netbox_dns-api:record-list"),
+            {"type": RecordTypeChoices.TXT, "limit": self.page_size, **params},
+            **self.header,
+        )
+        elapsed = time.perf_counter() - start
+
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(len(response.data["results"]), self.page_size)
+
+        return elapsed
+
+    def test_deep_pages(self):
+        self.add_permissions("netbox_dns.view_record")
+
+        pks = list(
+            Record.objects.filter(type=RecordTypeChoices.TXT)
+            .order_by("pk")
+            .values_list("pk", flat=True)
+        )
+
+        print(f"\n{'Offset':>10} {'Offset pagination':>20} {'Keyset pagination':>20}")
+        for fraction in (0, 0.25, 0.5, 0.75, 0.99):
+            offset = int((self.record_count - self.page_size) * fraction)
+            cursor = KeysetPagination.encode_cursor(pks[offset - 1]) if offset else ""
+
+            offset_time = self.time_request(offset=offset)
+            keyset_time = self.time_request(cursor=cursor)
+
+            print(f"{offset:>10} {offset_time:>19.3f}s {keyset_time:>19.3f}s")
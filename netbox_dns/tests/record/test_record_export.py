@@ -0,0 +1,102 @@
+import json
+
+from django.urls import reverse
+from rest_framework import status
+
+from netbox_dns.tests.custom import APITestCase
+from netbox_dns.models import NameServer, Record, View, Zone
+from netbox_dns.choices import RecordTypeChoices
+
+
+class RecordExportTestCase(APITestCase):
+    model = Record
+
+    @classmethod
+    def setUpTestData(cls):
+        nameserver = NameServer.objects.create(name="ns1.example.com")
+        cls.views = (
+            View.objects.create(name="view1"),
+            View.objects.create(name="view2"),
+        )
+        cls.zones = [
+            Zone.objects.create(
+                name="zone1.example.com",
+                view=view,
+                soa_mname=nameserver,
+                soa_rname="hostmaster.example.com",
+            )
+            for view in cls.views
+        ]
+
+        cls.records = [
+            Record.objects.create(
+                zone=zone,
+                name=f"name{index}",
+                type=RecordTypeChoices.A,
+                value=f"10.0.0.{index}",
+            )
+            for zone in cls.zones
+            for index in range(1, 4)
+        ]
+
+    def export(self, **params):
+        response = self.client.get(
+            reverse("plugins-api:netbox_dns-api:record-export"),
+            params,
+            **self.header,
+        )
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+
+        return [
+            json.loads(line)
+            for line in b"".join(response.streaming_content).decode().splitlines()
+        ]
+
+    def test_export(self):
+        self.add_permissions("netbox_dns.view_record")
+
+        records = self.export(type=RecordTypeChoices.A)
+
+        self.assertEqual(
+            [record["id"] for record in records],
+            [record.pk for record in self.records],
+        )
+        self.assertEqual(
+            records[0],
+            records[0]
+            | {
+                "view": self.views[0].pk,
+                "zone": self.zones[0].pk,
+                "name": "name1",
+                "fqdn": "name1.zone1.example.com.",
+                "type": RecordTypeChoices.A,
+                "value": "10.0.0.1",
+                "ttl": None,
+                "tenant": None,
+            },
+        )
+
+    def test_export_view(self):
+        self.add_permissions("netbox_dns.view_record")
+
+        records = self.export(type=RecordTypeChoices.A, view_id=self.views[1].pk)
+
+        self.assertEqual(
+            [record["id"] for record in records],
+            [record.pk for record in self.records[3:]],
+        )
+
+    def test_export_after(self):
+        self.add_permissions("netbox_dns.view_record")
+
+        records = self.export(type=RecordTypeChoices.A, after=self.records[4].pk)
+
+        self.assertEqual([record["id"] for record in records], [self.records[5].pk])
+
+    def test_export_permission_denied(self):
+        response = self.client.get(
+            reverse("plugins-api:netbox_dns-api:record-export"), **self.header
+        )
+
+        self.assertHttpStatus(response, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,104 @@
+from django.urls import reverse
+from rest_framework import status
+
+from netbox_dns.tests.custom import APITestCase
+from netbox_dns.models import NameServer, Record, View, Zone
+from netbox_dns.choices import RecordTypeChoices
+
+
+class RecordLookupTestCase(APITestCase):
+    model = Record
+
+    @classmethod
+    def setUpTestData(cls):
+        nameserver = NameServer.objects.create(name="ns1.example.com")
+        cls.views = (
+            View.objects.create(name="view1"),
+            View.objects.create(name="view2"),
+        )
+        cls.zones = [
+            Zone.objects.create(
+                name="zone1.example.com",
+                view=view,
+                soa_mname=nameserver,
+                soa_rname="hostmaster.example.com",
+            )
+            for view in cls.views
+        ]
+
+        cls.records = [
+            Record.objects.create(
+                zone=zone,
+                name=name,
+                type=record_type,
+                value=value,
+            )
+            for zone in cls.zones
+            for name, record_type, value in (
+                ("name1", RecordTypeChoices.A, "10.0.0.1"),
+                ("name1", RecordTypeChoices.AAAA, "fe80:dead:beef::1"),
+                ("name2", RecordTypeChoices.A, "10.0.0.2"),
+            )
+        ]
+
+    def lookup(self, data):
+        return self.client.post(
+            reverse("plugins-api:netbox_dns-api:record-lookup"),
+            data,
+            format="json",
+            **self.header,
+        )
+
+    def test_lookup(self):
+        self.add_permissions("netbox_dns.view_record")
+
+        response = self.lookup(
+            {
+                "fqdns": ["name1.zone1.example.com", "name3.zone1.example.com."],
+                "ip_addresses": ["10.0.0.2", "fe80:DEAD:beef:0::1"],
+            }
+        )
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+
+        fqdns = response.data["fqdns"]
+        self.assertEqual(
+            [record["id"] for record in fqdns["name1.zone1.example.com."]],
+            [record.pk for record in self.records if record.name == "name1"],
+        )
+        self.assertEqual(fqdns["name3.zone1.example.com."], [])
+
+        ip_addresses = response.data["ip_addresses"]
+        self.assertEqual(
+            [record["id"] for record in ip_addresses["10.0.0.2"]],
+            [self.records[2].pk, self.records[5].pk],
+        )
+        self.assertEqual(
+            {
+                (record["view"], record["zone"], record["type"])
+                for record in ip_addresses["fe80:dead:beef::1"]
+            },
+            {(zone.view.pk, zone.pk, RecordTypeChoices.AAAA) for zone in self.zones},
+        )
+
+    def test_lookup_view(self):
+        self.add_permissions("netbox_dns.view_record")
+
+        response = self.lookup({"ip_addresses": ["10.0.0.1"], "view": self.views[1].pk})
+
+        self.assertEqual(
+            [record["id"] for record in response.data["ip_addresses"]["10.0.0.1"]],
+            [self.records[3].pk],
+        )
+        self.assertEqual(response.data["fqdns"], {})
+
+    def test_lookup_invalid(self):
+        self.add_permissions("netbox_dns.view_record")
+
+        response = self.lookup({"ip_addresses": ["10.0.0.256"]})
+
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+
+    def test_lookup_permission_denied(self):
+        response = self.lookup({"fqdns": ["name1.zone1.example.com"]})
+
+        self.assertHttpStatus(response, status.HTTP_403_FORBIDDEN)
@@ -0,0 +1,313 @@
+from unittest import mock
+
+from django.conf import settings
+from django.urls import reverse
+from rest_framework import status
+
+from core.choices import ObjectChangeActionChoices
+from core.models import ObjectChange, ObjectType
+from users.models import ObjectPermission
+
+from netbox_dns.tests.custom import APITestCase
+from netbox_dns.models import NameServer, Record, Zone
+from netbox_dns.choices import RecordTypeChoices, RecordStatusChoices
+
+
+class RecordUpsertTestCase(APITestCase):
+    model = Record
+
+    @classmethod
+    def setUpTestData(cls):
+        nameserver = NameServer.objects.create(name="ns1.example.com")
+        cls.zone = Zone.objects.create(
+            name="zone1.example.com",
+            soa_mname=nameserver,
+            soa_rname="hostmaster.example.com",
+        )
+        cls.reverse_zone = Zone.objects.create(
+            name="0.0.10.in-addr.arpa",
+            soa_mname=nameserver,
+            soa_rname="hostmaster.example.com",
+        )
+        cls.record = Record.objects.create(
+            zone=cls.zone,
+            name="name1",
+            type=RecordTypeChoices.A,
+            value="10.0.0.1",
+        )
+
+    def upsert(self, data, add_permissions=True):
+        if add_permissions:
+            self.add_permissions("netbox_dns.add_record", "netbox_dns.change_record")
+
+        return self.client.post(
+            reverse("plugins-api:netbox_dns-api:record-upsert"),
+            data,
+            format="json",
+            **self.header,
+        )
+
+    def test_upsert(self):
+        soa_serial = self.zone.soa_serial
+
+        response = self.upsert(
+            [
+                {
+                    "zone": self.zone.pk,
+                    "name": "name1",
+                    "type": RecordTypeChoices.A,
+                    "value": "10.0.0.1",
+                    "ttl": 3600,
+                },
+                {
+                    "zone": self.zone.pk,
+                    "name": "name2",
+                    "type": RecordTypeChoices.A,
+                    "value": "10.0.0.2",
+                },
+                {
+                    "zone": self.zone.pk,
+                    "name": "name3.zone1.example.com.",
+                    "type": RecordTypeChoices.TXT,
+                    "value": "text",
+                    "status": RecordStatusChoices.STATUS_INACTIVE,
+                },
+            ]
+        )
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+
+        results = response.data["results"]
+        self.assertEqual(
+            [result["status"] for result in results], ["updated", "created", "created"]
+        )
+        self.assertEqual(results[0]["id"], self.record.pk)
+
+        self.record.refresh_from_db()
+        self.assertEqual(self.record.ttl, 3600)
+
+        record2 = Record.objects.get(pk=results[1]["id"])
+        self.assertEqual(record2.fqdn, "name2.zone1.example.com.")
+        self.assertEqual(record2.ptr_record.zone, self.reverse_zone)
+        self.assertEqual(record2.ptr_record.value, "name2.zone1.example.com.")
+
+        record3 = Record.objects.get(pk=results[2]["id"])
+        self.assertEqual(record3.name, "name3")
+        self.assertEqual(record3.status, RecordStatusChoices.STATUS_INACTIVE)
+
+        self.zone.refresh_from_db()
+        self.assertGreaterEqual(self.zone.soa_serial, soa_serial)
+
+    def test_change_log(self):
+        last_updated = self.record.last_updated
+
+        response = self.upsert(
+            [
+                {
+                    "zone": self.zone.pk,
+                    "name": "name1",
+                    "type": RecordTypeChoices.A,
+                    "value": "10.0.0.1",
+                    "ttl": 3600,
+                },
+                {
+                    "zone": self.zone.pk,
+                    "name": "name2",
+                    "type": RecordTypeChoices.TXT,
+                    "value": "text",
+                },
+            ]
+        )
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        results = response.data["results"]
+
+        self.record.refresh_from_db()
+        self.assertGreater(self.record.last_updated, last_updated)
+
+        object_changes = ObjectChange.objects.filter(
+            changed_object_type=ObjectType.objects.get_for_model(Record),
+            changed_object_id__in=[result["id"] for result in results],
+        )
+        update = object_changes.get(changed_object_id=self.record.pk)
+        self.assertEqual(update.action, ObjectChangeActionChoices.ACTION_UPDATE)
+        self.assertEqual(update.user, self.user)
+        self.assertIsNone(update.prechange_data["ttl"])
+        self.assertEqual(update.postchange_data["ttl"], 3600)
+
+        create = object_changes.get(changed_object_id=results[1]["id"])
+        self.assertEqual(create.action, ObjectChangeActionChoices.ACTION_CREATE)
+        self.assertEqual(create.user_name, self.user.username)
+        self.assertEqual(create.request_id, update.request_id)
+        self.assertEqual(create.postchange_data["value"], "text")
+
+    def test_unchanged(self):
+        response = self.upsert(
+            [
+                {
+                    "zone": self.zone.pk,
+                    "name": "name1",
+                    "type": RecordTypeChoices.A,
+                    "value": "10.0.0.1",
+                },
+            ]
+        )
+
+        self.assertEqual(
+            response.data["results"], [{"status": "unchanged", "id": self.record.pk}]
+        )
+
+    def test_errors(self):
+        response = self.upsert(
+            [
+                {
+                    "zone": self.zone.pk,
+                    "name": "name1",
+                    "type": RecordTypeChoices.CNAME,
+                    "value": "name2",
+                },
+                {
+                    "zone": self.zone.pk,
+                    "name": "name4",
+                    "type": RecordTypeChoices.A,
+                    "value": "invalid",
+                },
+                {
+                    "zone": 0,
+                    "name": "name5",
+                    "type": RecordTypeChoices.A,
+                    "value": "10.0.0.5",
+                },
+                {
+                    "zone": self.zone.pk,
+                    "name": "name6",
+                    "type": RecordTypeChoices.A,
+                    "value": "10.0.0.6",
+                },
+                {
+                    "zone": self.zone.pk,
+                    "name": "name6",
+                    "type": RecordTypeChoices.A,
+                    "value": "10.0.0.6",
+                },
+            ]
+        )
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+
+        results = response.data["results"]
+        self.assertEqual(
+            [result["status"] for result in results],
+            ["error", "error", "error", "created", "error"],
+        )
+        self.assertIn("type", results[0]["errors"])
+        self.assertIn("value", results[1]["errors"])
+        self.assertIn("zone", results[2]["errors"])
+        self.assertFalse(Record.objects.filter(name__in=("name4", "name5")).exists())
+
+    def test_managed_record(self):
+        response = self.upsert(
+            [
+                {
+                    "zone": self.reverse_zone.pk,
+                    "name": "1",
+                    "type": RecordTypeChoices.PTR,
+                    "value": "name1.zone1.example.com.",
+                    "ttl": 3600,
+                },
+            ]
+        )
+
+        self.assertEqual(response.data["results"][0]["status"], "error")
+
+    def test_permission_denied(self):
+        self.add_permissions("netbox_dns.add_record")
+
+        response = self.client.post(
+            reverse("plugins-api:netbox_dns-api:record-upsert"),
+            [],
+            format="json",
+            **self.header,
+        )
+
+        self.assertHttpStatus(response, status.HTTP_403_FORBIDDEN)
+
+    def add_constrained_permission(self, actions, constraints):
+        permission = ObjectPermission.objects.create(
+            name=f"Record {' '.join(actions)}",
+            actions=actions,
+            constraints=constraints,
+        )
+        permission.object_types.add(ObjectType.objects.get_for_model(Record))
+        permission.users.add(self.user)
+
+    def test_duplicate_existing_records(self):
+        with mock.patch.dict(
+            settings.PLUGINS_CONFIG["netbox_dns"], {"enforce_unique_records": False}
+        ):
+            Record.objects.create(
+                zone=self.zone,
+                name="name1",
+                type=RecordTypeChoices.A,
+                value="10.0.0.1",
+            )
+
+        response = self.upsert(
+            [
+                {
+                    "zone": self.zone.pk,
+                    "name": "name1",
+                    "type": RecordTypeChoices.A,
+                    "value": "10.0.0.1",
+                    "ttl": 3600,
+                },
+            ]
+        )
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+
+        self.assertEqual(response.data["results"][0]["status"], "error")
+        self.assertFalse(Record.objects.filter(name="name1", ttl=3600).exists())
+
+    def test_change_constraint_denied(self):
+        self.add_constrained_permission(["add"], None)
+        self.add_constrained_permission(["change"], {"name": "other"})
+
+        response = self.upsert(
+            [
+                {
+                    "zone": self.zone.pk,
+                    "name": "name1",
+                    "type": RecordTypeChoices.A,
+                    "value": "10.0.0.1",
+                    "ttl": 3600,
+                },
+                {
+                    "zone": self.zone.pk,
+                    "name": "name2",
+                    "type": RecordTypeChoices.A,
+                    "value": "10.0.0.2",
+                },
+            ],
+            add_permissions=False,
+        )
+        self.assertHttpStatus(response, status.HTTP_403_FORBIDDEN)
+
+        self.record.refresh_from_db()
+        self.assertIsNone(self.record.ttl)
+        self.assertFalse(Record.objects.filter(name="name2").exists())
+
+    def test_add_constraint_denied(self):
+        self.add_constrained_permission(["add"], {"name": "other"})
+        self.add_constrained_permission(["change"], None)
+
+        response = self.upsert(
+            [
+                {
+                    "zone": self.zone.pk,
+                    "name": "name2",
+                    "type": RecordTypeChoices.A,
+                    "value": "10.0.0.2",
+                },
+            ],
+            add_permissions=False,
+        )
+        self.assertHttpStatus(response, status.HTTP_403_FORBIDDEN)
+
+        self.assertFalse(Record.objects.filter(name="name2").exists())
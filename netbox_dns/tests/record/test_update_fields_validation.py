@@ -0,0 +1,180 @@
+from unittest.mock import patch
+
+from django.core.exceptions import ValidationError
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from netbox_dns.models import NameServer, Record, Zone
+from netbox_dns.choices import RecordTypeChoices, RecordStatusChoices
+
+
+def full_clean(record, update_fields):
+    record.full_clean()
+
+
+class RecordUpdateFieldsValidationTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.zone_data = {
+            "soa_mname": NameServer.objects.create(name="ns1.example.com"),
+            "soa_rname": "hostmaster.example.com",
+        }
+
+        cls.zone = Zone.objects.create(name="zone1.example.com", **cls.zone_data)
+        cls.reverse_zone = Zone.objects.create(
+            name="0.0.10.in-addr.arpa", **cls.zone_data
+        )
+
+    def count_queries(self, function, *args, **kwargs):
+        with CaptureQueriesContext(connection) as context:
+            function(*args, **kwargs)
+
+        return len(context.captured_queries)
+
+    def test_update_ttl(self):
+        record = Record.objects.create(
+            zone=self.zone,
+            name="name1",
+            type=RecordTypeChoices.TXT,
+            value="name1",
+        )
+
+        with patch.object(
+            Record, "validate_value", autospec=True, side_effect=Record.validate_value
+        ) as validate_value:
+            record.ttl = 3600
+            record.save(update_fields=["ttl"])
+
+        self.assertEqual(validate_value.call_count, 0)
+        self.assertEqual(Record.objects.get(pk=record.pk).ttl, 3600)
+
+    def test_update_ttl_invalid(self):
+        record = Record.objects.create(
+            zone=self.zone,
+            name="name1",
+            type=RecordTypeChoices.TXT,
+            value="name1",
+        )
+
+        record.ttl = 2147483648
+        with self.assertRaises(ValidationError):
+            record.save(update_fields=["ttl"])
+
+    def test_update_status_conflict(self):
+        Record.objects.create(
+            zone=self.zone,
+            name="name1",
+            type=RecordTypeChoices.TXT,
+            value="name1",
+        )
+        record = Record.objects.create(
+            zone=self.zone,
+            name="name1",
+            type=RecordTypeChoices.CNAME,
+            value="name2",
+            status=RecordStatusChoices.STATUS_INACTIVE,
+        )
+
+        record.status = RecordStatusChoices.STATUS_ACTIVE
+        with self.assertRaises(ValidationError):
+            record.save(update_fields=["status"])
+
+    def test_update_other_fields(self):
+        record = Record.objects.create(
+            zone=self.zone,
+            name="name1",
+            type=RecordTypeChoices.TXT,
+            value="name1",
+        )
+
+        with patch.object(
+            Record, "validate_value", autospec=True, side_effect=Record.validate_value
+        ) as validate_value:
+            record.value = "name2"
+            record.save(update_fields=["value"])
+
+        self.assertEqual(validate_value.call_count, 1)
+
+    def test_ptr_cascade_queries(self):
+        record = Record.objects.create(
+            zone=self.zone,
+            name="name1",
+            type=RecordTypeChoices.A,
+            value="10.0.0.1",
+        )
+
+        def update_ttl(ttl):
+            record.ttl = ttl
+            record.save()
+
+        with patch.object(
+            Record, "clean_update_fields", autospec=True, side_effect=full_clean
+        ):
+            full_clean_queries = self.count_queries(update_ttl, 3600)
+
+        update_fields_queries = self.count_queries(update_ttl, 7200)
+
+        self.assertLess(update_fields_queries, full_clean_queries)
+        self.assertEqual(Record.objects.get(pk=record.ptr_record.pk).ttl, 7200)
+
+    def test_ptr_ttl_snapshot(self):
+        record = Record.objects.create(
+            zone=self.zone,
+            name="name1",
+            type=RecordTypeChoices.A,
+            value="10.0.0.1",
+            ttl=3600,
+        )
+
+        record.ttl = 7200
+        record.save()
+
+        self.assertEqual(record.ptr_record._prechange_snapshot["ttl"], 3600)
+        self.assertEqual(Record.objects.get(pk=record.ptr_record.pk).ttl, 7200)
+
+    def test_rrset_ttl_cascade_queries(self):
+        records = [
+            Record.objects.create(
+                zone=self.zone,
+                name="name1",
+                type=RecordTypeChoices.TXT,
+                value=f"value{index}",
+            )
+            for index in range(10)
+        ]
+
+        def update_ttl(ttl):
+            records[0].ttl = ttl
+            records[0].save()
+
+        with patch.object(
+            Record, "clean_update_fields", autospec=True, side_effect=full_clean
+        ):
+            full_clean_queries = self.count_queries(update_ttl, 3600)
+
+        update_fields_queries = self.count_queries(update_ttl, 7200)
+
+        self.assertLess(update_fields_queries, full_clean_queries)
+        self.assertFalse(
+            Record.objects.filter(name="name1", type=RecordTypeChoices.TXT)
+            .exclude(ttl=7200)
+            .exists()
+        )
+
+    def test_zone_rename_cascade(self):
+        for index in range(10):
+            Record.objects.create(
+                zone=self.zone,
+                name=f"name{index}",
+                type=RecordTypeChoices.A,
+                value=f"10.0.0.{index + 1}",
+            )
+
+        with patch.object(
+            Record, "validate_name", autospec=True, side_effect=Record.validate_name
+        ) as validate_name:
+            self.zone.name = "zone2.example.com"
+            self.zone.save()
+
+        self.assertEqual(validate_name.call_count, 0)
@@ -0,0 +1,155 @@
+from django.test import TestCase
+
+from netbox_dns.models import NameServer, Record, Zone
+from netbox_dns.choices import RecordTypeChoices
+from netbox_dns.utilities import update_ptr_records
+
+
+class UpdatePTRRecordsTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.zone_data = {
+            "soa_mname": NameServer.objects.create(name="ns1.example.com"),
+            "soa_rname": "hostmaster.example.com",
+        }
+
+        cls.zones = (
+            Zone(name="zone1.example.com", **cls.zone_data),
+            Zone(name="0.10.in-addr.arpa", **cls.zone_data),
+            Zone(name="1.0.10.in-addr.arpa", **cls.zone_data),
+            Zone(name="0.0.0.f.e.e.b.d.a.e.d.0.8.e.f.ip6.arpa", **cls.zone_data),
+        )
+        for zone in cls.zones:
+            zone.save()
+
+    def create_address_records(self, *addresses, **kwargs):
+        records = [
+            Record(
+                zone=self.zones[0],
+                name=f"name{index}",
+                fqdn=f"name{index}.{self.zones[0].name}.",
+                type=(
+                    RecordTypeChoices.AAAA if ":" in address else RecordTypeChoices.A
+                ),
+                value=address,
+                ip_address=address,
+                **kwargs,
+            )
+            for index, address in enumerate(addresses, start=1)
+        ]
+        Record.objects.bulk_create(records)
+
+        return Record.objects.filter(pk__in=[record.pk for record in records])
+
+    def get_ptr_record(self, address_record):
+        address_record.refresh_from_db()
+        return address_record.ptr_record
+
+    def test_create_ptr_records(self):
+        records = self.create_address_records(
+            "10.0.1.1", "10.0.2.1", "fe80:dead:beef:0:0:0:0:1"
+        )
+
+        zone_pks = update_ptr_records(records)
+
+        ptr_records = [self.get_ptr_record(record) for record in records]
+
+        self.assertEqual(ptr_records[0].zone, self.zones[2])
+        self.assertEqual(ptr_records[0].name, "1")
+        self.assertEqual(ptr_records[0].value, "name1.zone1.example.com.")
+        self.assertEqual(ptr_records[1].zone, self.zones[1])
+        self.assertEqual(ptr_records[1].name, "1.2")
+        self.assertEqual(ptr_records[2].zone, self.zones[3])
+        self.assertTrue(all(ptr_record.managed for ptr_record in ptr_records))
+
+        self.assertEqual(
+            zone_pks, {self.zones[1].pk, self.zones[2].pk, self.zones[3].pk}
+        )
+
+    def test_unchanged_ptr_records(self):
+        records = self.create_address_records("10.0.1.1", "10.0.2.1")
+        update_ptr_records(records)
+
+        self.assertEqual(update_ptr_records(records), set())
+
+    def test_move_ptr_records(self):
+        records = self.create_address_records("10.0.2.1", "10.0.2.2")
+        update_ptr_records(records)
+
+        ptr_record_pks = {self.get_ptr_record(record).pk for record in records}
+
+        zone = Zone.objects.create(name="2.0.10.in-addr.arpa", **self.zone_data)
+
+        for record in records:
+            ptr_record = self.get_ptr_record(record)
+
+            self.assertEqual(ptr_record.zone, zone)
+            self.assertIn(ptr_record.pk, ptr_record_pks)
+            self.assertEqual(ptr_record.fqdn, f"{ptr_record.name}.{zone.name}.")
+
+        self.assertFalse(
+            Record.objects.filter(
+                zone=self.zones[1], type=RecordTypeChoices.PTR
+            ).exists()
+        )
+
+    def test_delete_ptr_zone(self):
+        records = self.create_address_records("10.0.1.1", "10.0.1.2")
+        update_ptr_records(records)
+
+        self.zones[2].delete()
+
+        for record in records:
+            ptr_record = self.get_ptr_record(record)
+
+            self.assertEqual(ptr_record.zone, self.zones[1])
+            self.assertEqual(ptr_record.name, f"{record.value.split('.')[-1]}.1")
+
+    def test_disable_ptr(self):
+        records = self.create_address_records("10.0.1.1")
+        update_ptr_records(records)
+
+        ptr_record = self.get_ptr_record(records.get())
+
+        records.update(disable_ptr=True)
+        update_ptr_records(records)
+
+        self.assertIsNone(self.get_ptr_record(records.get()))
+        self.assertFalse(Record.objects.filter(pk=ptr_record.pk).exists())
+
+    def test_shared_ptr_record(self):
+        records = self.create_address_records("10.0.1.1", "10.0.1.1")
+        records.update(name="shared", fqdn="shared.zone1.example.com.")
+
+        update_ptr_records(records)
+
+        ptr_records = {self.get_ptr_record(record) for record in records}
+        self.assertEqual(len(ptr_records), 1)
+
+        record1, record2 = records.order_by("pk")
+        Record.objects.filter(pk=record1.pk).update(disable_ptr=True)
+        update_ptr_records(records)
+
+        self.assertIsNone(self.get_ptr_record(record1))
+        self.assertEqual(self.get_ptr_record(record2), ptr_records.pop())
+
+    def test_rfc2317_ptr_records(self):
+        rfc2317_zone = Zone.objects.create(
+            name="0-31.1.0.10.in-addr.arpa",
+            **self.zone_data,
+            rfc2317_prefix="10.0.1.0/27",
+            rfc2317_parent_managed=True,
+        )
+
+        records = self.create_address_records("10.0.1.1", "10.0.1.2")
+        update_ptr_records(records)
+
+        for record in records:
+            ptr_record = self.get_ptr_record(record)
+
+            self.assertEqual(ptr_record.zone, rfc2317_zone)
+            self.assertEqual(ptr_record.rfc2317_cname_record.zone, self.zones[2])
+            self.assertEqual(
+                ptr_record.rfc2317_cname_record.value,
+                f"{ptr_record.name}.{rfc2317_zone.name}.",
+            )
@@ -0,0 +1,132 @@
+from datetime import datetime, timedelta
+from math import ceil
+from unittest.mock import patch
+
+from django.db import transaction
+from django.test import TestCase
+
+from netbox_dns.models import NameServer, Record, Zone
+from netbox_dns.choices import RecordTypeChoices
+from netbox_dns.utilities import deferred_serials
+
+
+def set_soa_serial_back(zone):
+    zone.last_updated = datetime.now() - timedelta(days=1)
+    zone.soa_serial = ceil(zone.last_updated.timestamp())
+    super(Zone, zone).save()
+    zone.update_soa_record()
+
+
+class DeferredSerialsTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.nameserver = NameServer.objects.create(name="ns1.example.com")
+
+        cls.zone_data = {
+            "soa_mname": cls.nameserver,
+            "soa_rname": "hostmaster.example.com",
+            "soa_serial_auto": True,
+        }
+
+        cls.zones = (
+            Zone(name="zone1.example.com", **cls.zone_data),
+            Zone(name="0.0.10.in-addr.arpa", **cls.zone_data),
+        )
+        for zone in cls.zones:
+            zone.save()
+
+    def setUp(self):
+        self.soa_serials = {}
+        for zone in self.zones:
+            set_soa_serial_back(zone)
+            self.soa_serials[zone.pk] = zone.soa_serial
+
+    def get_soa_serial(self, zone):
+        return Zone.objects.get(pk=zone.pk).soa_serial
+
+    def create_records(self, count=5):
+        for index in range(1, count + 1):
+            Record.objects.create(
+                zone=self.zones[0],
+                name=f"name{index}",
+                type=RecordTypeChoices.A,
+                value=f"10.0.0.{index}",
+            )
+
+    def test_deferred_serials(self):
+        original_update_soa_record = Zone.update_soa_record
+
+        with patch.object(
+            Zone,
+            "update_soa_record",
+            autospec=True,
+            side_effect=original_update_soa_record,
+        ) as update_soa_record:
+            with deferred_serials():
+                self.create_records()
+
+                for zone in self.zones:
+                    self.assertEqual(
+                        self.get_soa_serial(zone), self.soa_serials[zone.pk]
+                    )
+
+        self.assertEqual(update_soa_record.call_count, len(self.zones))
+
+        for zone in self.zones:
+            zone = Zone.objects.get(pk=zone.pk)
+
+            self.assertGreater(zone.soa_serial, self.soa_serials[zone.pk])
+
+            soa_record = zone.records.get(type=RecordTypeChoices.SOA)
+            self.assertIn(f" {zone.soa_serial} ", soa_record.value)
+
+    def test_deferred_serials_nested(self):
+        with deferred_serials():
+            with deferred_serials():
+                self.create_records()
+
+            self.assertEqual(
+                self.get_soa_serial(self.zones[0]), self.soa_serials[self.zones[0].pk]
+            )
+
+        self.assertGreater(
+            self.get_soa_serial(self.zones[0]), self.soa_serials[self.zones[0].pk]
+        )
+
+    def test_deferred_serials_rollback(self):
+        with self.assertRaises(RuntimeError):
+            with deferred_serials():
+                self.create_records()
+                raise RuntimeError
+
+        self.assertFalse(Record.objects.filter(type=RecordTypeChoices.A).exists())
+        for zone in self.zones:
+            self.assertEqual(self.get_soa_serial(zone), self.soa_serials[zone.pk])
+
+    def test_deferred_serials_savepoint_rollback(self):
+        with deferred_serials():
+            with self.assertRaises(RuntimeError):
+                with transaction.atomic():
+                    self.create_records()
+                    raise RuntimeError
+
+            Record.objects.create(
+                zone=self.zones[0],
+                name="name1",
+                type=RecordTypeChoices.TXT,
+                value="text",
+            )
+
+        self.assertFalse(Record.objects.filter(type=RecordTypeChoices.A).exists())
+        self.assertGreater(
+            self.get_soa_serial(self.zones[0]), self.soa_serials[self.zones[0].pk]
+        )
+        self.assertEqual(
+            self.get_soa_serial(self.zones[1]), self.soa_serials[self.zones[1].pk]
+        )
+
+    def test_serials_not_deferred(self):
+        self.create_records(count=1)
+
+        for zone in self.zones:
+            self.assertGreater(self.get_soa_serial(zone), self.soa_serials[zone.pk])
@@ -0,0 +1,215 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from math import ceil
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+
+from netbox_dns.models import NameServer, Record, Zone
+from netbox_dns.choices import RecordTypeChoices
+
+PLUGINS_CONFIG = {
+    "netbox_dns": {
+        **settings.PLUGINS_CONFIG.get("netbox_dns", {}),
+        "zone_soa_serial_on_commit": True,
+    }
+}
+
+
+def set_soa_serial(zone, soa_serial):
+    zone.soa_serial = soa_serial
+    super(Zone, zone).save()
+    zone.update_soa_record()
+
+
+@override_settings(PLUGINS_CONFIG=PLUGINS_CONFIG)
+class ZoneSOASerialOnCommitTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.nameserver = NameServer.objects.create(name="ns1.example.com")
+
+        cls.zone_data = {
+            "soa_mname": cls.nameserver,
+            "soa_rname": "hostmaster.example.com",
+            "soa_serial_auto": True,
+        }
+
+        cls.zones = (
+            Zone(name="zone1.example.com", **cls.zone_data),
+            Zone(name="0.0.10.in-addr.arpa", **cls.zone_data),
+        )
+        for zone in cls.zones:
+            zone.save()
+
+    def get_soa_serial(self, zone):
+        return Zone.objects.get(pk=zone.pk).soa_serial
+
+    def test_serial_allocated_on_commit(self):
+        soa_serials = {}
+        for zone in self.zones:
+            set_soa_serial(zone, ceil((datetime.now() - timedelta(days=1)).timestamp()))
+            soa_serials[zone.pk] = zone.soa_serial
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            for index in range(1, 6):
+                Record.objects.create(
+                    zone=self.zones[0],
+                    name=f"name{index}",
+                    type=RecordTypeChoices.A,
+                    value=f"10.0.0.{index}",
+                )
+
+            for zone in self.zones:
+                self.assertEqual(self.get_soa_serial(zone), soa_serials[zone.pk])
+
+        self.assertEqual(len(callbacks), 1)
+
+        for zone in self.zones:
+            zone = Zone.objects.get(pk=zone.pk)
+
+            self.assertGreater(zone.soa_serial, soa_serials[zone.pk])
+
+            soa_record = zone.records.get(type=RecordTypeChoices.SOA)
+            self.assertIn(f" {zone.soa_serial} ", soa_record.value)
+
+    def test_serial_does_not_decrease(self):
+        zone = self.zones[0]
+        soa_serial = ceil((datetime.now() + timedelta(days=1)).timestamp())
+        set_soa_serial(zone, soa_serial)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Record.objects.create(
+                zone=zone,
+                name="name1",
+                type=RecordTypeChoices.A,
+                value="10.0.0.1",
+            )
+
+        self.assertEqual(self.get_soa_serial(zone), soa_serial + 1)
+
+    def test_serial_increases_within_one_second(self):
+        zone = self.zones[0]
+
+        soa_serials = []
+        for index in range(1, 4):
+            with self.captureOnCommitCallbacks(execute=True):
+                Record.objects.create(
+                    zone=zone,
+                    name=f"name{index}",
+                    type=RecordTypeChoices.A,
+                    value=f"10.0.0.{index}",
+                )
+
+            soa_serials.append(self.get_soa_serial(zone))
+
+        self.assertLess(soa_serials[0], soa_serials[1])
+        self.assertLess(soa_serials[1], soa_serials[2])
+
+    def test_serial_ahead(self):
+        zone = self.zones[0]
+        soa_serial = ceil(datetime.now().timestamp()) + 2**31 - 3600
+        set_soa_serial(zone, soa_serial)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            Record.objects.create(
+                zone=zone,
+                name="name1",
+                type=RecordTypeChoices.A,
+                value="10.0.0.1",
+            )
+
+        self.assertEqual(self.get_soa_serial(zone), soa_serial + 1)
+
+    def test_serial_wrap(self):
+        zone = self.zones[0]
+        set_soa_serial(zone, 2**32 - 1)
+
+        timestamp = ceil(datetime.now().timestamp())
+        with self.captureOnCommitCallbacks(execute=True):
+            Record.objects.create(
+                zone=zone,
+                name="name1",
+                type=RecordTypeChoices.A,
+                value="10.0.0.1",
+            )
+
+        self.assertGreaterEqual(self.get_soa_serial(zone), timestamp)
+        self.assertLess(self.get_soa_serial(zone), 2**31)
+
+    def test_serial_rollback(self):
+        zone = self.zones[0]
+        set_soa_serial(zone, ceil((datetime.now() - timedelta(days=1)).timestamp()))
+
+        try:
+            with transaction.atomic():
+                Record.objects.create(
+                    zone=zone,
+                    name="name1",
+                    type=RecordTypeChoices.A,
+                    value="10.0.0.1",
+                )
+                raise RuntimeError
+        except RuntimeError:
+            pass
+
+        with self.captureOnCommitCallbacks(execute=True) as callbacks:
+            Record.objects.create(
+                zone=zone,
+                name="name2",
+                type=RecordTypeChoices.A,
+                value="10.0.0.2",
+            )
+
+        self.assertEqual(len(callbacks), 1)
+        self.assertGreater(self.get_soa_serial(zone), zone.soa_serial)
+
+
+@override_settings(PLUGINS_CONFIG=PLUGINS_CONFIG)
+class ZoneSOASerialConcurrencyTestCase(TransactionTestCase):
+    writers = 32
+    records_per_writer = 5
+
+    def setUp(self):
+        self.nameserver = NameServer.objects.create(name="ns1.example.com")
+
+        self.zone = Zone.objects.create(
+            name="zone1.example.com",
+            soa_mname=self.nameserver,
+            soa_rname="hostmaster.example.com",
+            soa_serial_auto=True,
+        )
+
+    def write_records(self, writer):
+        try:
+            for index in range(self.records_per_writer):
+                with transaction.atomic():
+                    Record.objects.create(
+                        zone=self.zone,
+                        name=f"writer{writer}-{index}",
+                        type=RecordTypeChoices.TXT,
+                        value=f"writer{writer}-{index}",
+                    )
+        finally:
+            connection.close()
+
+    def test_concurrent_writers(self):
+        soa_serial = self.get_soa_serial()
+
+        with ThreadPoolExecutor(max_workers=self.writers) as executor:
+            for result in executor.map(self.write_records, range(self.writers)):
+                self.assertIsNone(result)
+
+        self.assertEqual(
+            Record.objects.filter(zone=self.zone, type=RecordTypeChoices.TXT).count(),
+            self.writers * self.records_per_writer,
+        )
+
+        zone = Zone.objects.get(pk=self.zone.pk)
+        self.assertGreater(zone.soa_serial, soa_serial)
+
+        soa_record = zone.records.get(type=RecordTypeChoices.SOA)
+        self.assertIn(f" {zone.soa_serial} ", soa_record.value)
+
+    def get_soa_serial(self):
+        return Zone.objects.get(pk=self.zone.pk).soa_serial
@@ -0,0 +1,63 @@
+from django.urls import reverse
+from rest_framework import status
+
+from netbox_dns.tests.custom import APITestCase
+from netbox_dns.models import Record, View, Zone
+from netbox_dns.choices import RecordTypeChoices
+
+ZONE_FILE = """
+$ORIGIN zone1.example.com.
+$TTL 86400
+@       IN SOA  ns1.example.com. hostmaster.example.com. 1 172800 7200 2592000 3600
+        IN NS   ns1.example.com.
+name1   IN A    10.0.0.1
+name2   IN AAAA fe80:dead:beef::1
+"""
+
+
+class ZoneImportAPITestCase(APITestCase):
+    model = Zone
+
+    def import_zone_file(self, zone_file, **params):
+        return self.client.post(
+            f"{reverse('plugins-api:netbox_dns-api:zone-import')}"
+            f"?{'&'.join(f'{key}={value}' for key, value in params.items())}",
+            zone_file,
+            content_type="text/dns",
+            **self.header,
+        )
+
+    def test_import(self):
+        self.add_permissions("netbox_dns.add_zone", "netbox_dns.add_record")
+        view = View.objects.create(name="view1")
+
+        response = self.import_zone_file(ZONE_FILE, view_id=view.pk)
+        self.assertHttpStatus(response, status.HTTP_201_CREATED)
+
+        zone = Zone.objects.get(pk=response.data["id"])
+        self.assertEqual(zone.view, view)
+        self.assertEqual(zone.name, "zone1.example.com")
+        self.assertEqual(
+            set(
+                Record.objects.filter(zone=zone, managed=False).values_list(
+                    "name", "type", "value"
+                )
+            ),
+            {
+                ("name1", RecordTypeChoices.A, "10.0.0.1"),
+                ("name2", RecordTypeChoices.AAAA, "fe80:dead:beef::1"),
+            },
+        )
+
+    def test_import_invalid(self):
+        self.add_permissions("netbox_dns.add_zone", "netbox_dns.add_record")
+
+        response = self.import_zone_file("name1 IN A 10.0.0.1\n")
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+
+    def test_import_permission_denied(self):
+        self.add_permissions("netbox_dns.add_zone")
+
+        response = self.import_zone_file(ZONE_FILE)
+        self.assertHttpStatus(response, status.HTTP_403_FORBIDDEN)
+        self.assertFalse(Zone.objects.filter(name="zone1.example.com").exists())
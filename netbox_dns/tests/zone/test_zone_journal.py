@@ -0,0 +1,263 @@
+import json
+
+from django.urls import reverse
+from rest_framework import status
+
+from netbox_dns.tests.custom import APITestCase
+from netbox_dns.models import NameServer, Record, Zone, ZoneChange
+from netbox_dns.choices import (
+    RecordTypeChoices,
+    RecordStatusChoices,
+    ZoneChangeActionChoices,
+)
+from netbox_dns.utilities import commit_zone_changes, get_zone_changes
+
+
+def rr(name, record_type, value, ttl=None):
+    return {"name": name, "ttl": ttl, "type": record_type, "value": value}
+
+
+class ZoneJournalTestCase(APITestCase):
+    model = Zone
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.nameserver = NameServer.objects.create(name="ns1.example.com")
+
+    def setUp(self):
+        super().setUp()
+
+        self.zone = Zone.objects.create(
+            name="zone1.example.com",
+            soa_mname=self.nameserver,
+            soa_rname="hostmaster.example.com",
+            soa_serial_auto=False,
+            soa_serial=1,
+            journal_retention=2,
+        )
+
+    def set_serial(self, serial):
+        self.zone.soa_serial = serial
+        self.zone.save()
+
+    def test_record_changes(self):
+        record = Record.objects.create(
+            zone=self.zone,
+            name="name1",
+            type=RecordTypeChoices.A,
+            value="10.0.0.1",
+        )
+        self.set_serial(2)
+
+        record.value = "10.0.0.2"
+        record.save()
+        Record.objects.create(
+            zone=self.zone,
+            name="name2",
+            type=RecordTypeChoices.TXT,
+            value="inactive",
+            status=RecordStatusChoices.STATUS_INACTIVE,
+        )
+        self.set_serial(3)
+
+        record.delete()
+        self.set_serial(4)
+
+        self.assertEqual(
+            get_zone_changes(self.zone, 2),
+            [
+                {
+                    "previous_serial": 2,
+                    "serial": 3,
+                    "deleted": [rr("name1", RecordTypeChoices.A, "10.0.0.1")],
+                    "added": [rr("name1", RecordTypeChoices.A, "10.0.0.2")],
+                },
+                {
+                    "previous_serial": 3,
+                    "serial": 4,
+                    "deleted": [rr("name1", RecordTypeChoices.A, "10.0.0.2")],
+                    "added": [],
+                },
+            ],
+        )
+        self.assertEqual(len(get_zone_changes(self.zone, 3)), 1)
+        self.assertEqual(get_zone_changes(self.zone, 4), [])
+
+    def test_compaction(self):
+        for serial in range(2, 6):
+            Record.objects.create(
+                zone=self.zone,
+                name=f"name{serial}",
+                type=RecordTypeChoices.A,
+                value=f"10.0.0.{serial}",
+            )
+            self.set_serial(serial)
+
+        self.assertEqual(
+            set(
+                ZoneChange.objects.filter(zone=self.zone).values_list(
+                    "serial", flat=True
+                )
+            ),
+            {4, 5},
+        )
+        self.assertIsNone(get_zone_changes(self.zone, 1))
+        self.assertIsNone(get_zone_changes(self.zone, 2))
+        self.assertEqual(
+            [change["serial"] for change in get_zone_changes(self.zone, 3)], [4, 5]
+        )
+
+    def test_compaction_interleaved(self):
+        def add_change(serial, previous_serial, name):
+            ZoneChange.objects.create(
+                zone=self.zone,
+                serial=serial,
+                previous_serial=previous_serial,
+                action=ZoneChangeActionChoices.ACTION_ADD,
+                name=name,
+                type=RecordTypeChoices.A,
+                value="10.0.0.1",
+            )
+
+        # +
+        # The changes of serial 2 have both lower and higher PKs than the
+        # changes of serial 3, as happens if the serials are assigned on
+        # commit.
+        # -
+        add_change(2, 1, "name1")
+        add_change(3, 2, "name2")
+        add_change(2, 1, "name3")
+        add_change(3, 2, "name4")
+        add_change(None, None, "name5")
+
+        commit_zone_changes(self.zone, 3, 4)
+
+        self.assertEqual(
+            sorted(
+                ZoneChange.objects.filter(zone=self.zone).values_list("serial", "name")
+            ),
+            [(3, "name2"), (3, "name4"), (4, "name5")],
+        )
+
+    def test_serial_wrap(self):
+        self.set_serial(2**32 - 2)
+
+        Record.objects.create(
+            zone=self.zone,
+            name="name1",
+            type=RecordTypeChoices.A,
+            value="10.0.0.1",
+        )
+        self.set_serial(2**32 - 1)
+
+        Record.objects.create(
+            zone=self.zone,
+            name="name2",
+            type=RecordTypeChoices.A,
+            value="10.0.0.2",
+        )
+        self.set_serial(1)
+
+        self.assertEqual(
+            [
+                (change["previous_serial"], change["serial"])
+                for change in get_zone_changes(self.zone, 2**32 - 2)
+            ],
+            [(2**32 - 2, 2**32 - 1), (2**32 - 1, 1)],
+        )
+        self.assertEqual(
+            [change["serial"] for change in get_zone_changes(self.zone, 2**32 - 1)],
+            [1],
+        )
+        self.assertEqual(get_zone_changes(self.zone, 1), [])
+        self.assertIsNone(get_zone_changes(self.zone, 2**32 - 3))
+        self.assertIsNone(get_zone_changes(self.zone, 2))
+
+    def test_reset(self):
+        Record.objects.create(
+            zone=self.zone,
+            name="name1",
+            type=RecordTypeChoices.A,
+            value="10.0.0.1",
+        )
+        self.set_serial(2)
+        self.assertIsNotNone(get_zone_changes(self.zone, 1))
+
+        self.zone.default_ttl = 3600
+        self.zone.soa_serial = 3
+        self.zone.save()
+
+        self.assertFalse(ZoneChange.objects.filter(zone=self.zone).exists())
+        self.assertIsNone(get_zone_changes(self.zone, 2))
+        self.assertEqual(get_zone_changes(self.zone, 3), [])
+
+    def test_journal_disabled(self):
+        self.zone.journal_retention = 0
+        self.zone.save()
+
+        Record.objects.create(
+            zone=self.zone,
+            name="name1",
+            type=RecordTypeChoices.A,
+            value="10.0.0.1",
+        )
+        self.set_serial(2)
+
+        self.assertFalse(ZoneChange.objects.filter(zone=self.zone).exists())
+        self.assertIsNone(get_zone_changes(self.zone, 1))
+
+    def test_api_ixfr(self):
+        Record.objects.create(
+            zone=self.zone,
+            name="name1",
+            type=RecordTypeChoices.A,
+            value="10.0.0.1",
+        )
+        self.set_serial(2)
+        self.add_permissions("netbox_dns.view_zone")
+
+        url = reverse(
+            "plugins-api:netbox_dns-api:zone-ixfr", kwargs={"pk": self.zone.pk}
+        )
+        response = self.client.get(f"{url}?serial=1", **self.header)
+
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertEqual(response.data["type"], "ixfr")
+        self.assertEqual(
+            response.data["changes"][0]["added"],
+            [rr("name1", RecordTypeChoices.A, "10.0.0.1")],
+        )
+
+    def test_api_axfr_fallback(self):
+        Record.objects.create(
+            zone=self.zone,
+            name="name1",
+            type=RecordTypeChoices.A,
+            value="10.0.0.1",
+        )
+        self.set_serial(2)
+        self.add_permissions("netbox_dns.view_zone")
+
+        url = reverse(
+            "plugins-api:netbox_dns-api:zone-ixfr", kwargs={"pk": self.zone.pk}
+        )
+        response = self.client.get(f"{url}?serial=0", **self.header)
+
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        transfer = json.loads(b"".join(response.streaming_content))
+        self.assertEqual(transfer["type"], "axfr")
+        self.assertEqual(transfer["serial"], 2)
+        self.assertEqual(
+            [record["type"] for record in transfer["records"]],
+            [RecordTypeChoices.SOA, RecordTypeChoices.A],
+        )
+
+    def test_api_invalid_serial(self):
+        self.add_permissions("netbox_dns.view_zone")
+
+        url = reverse(
+            "plugins-api:netbox_dns-api:zone-ixfr", kwargs={"pk": self.zone.pk}
+        )
+        response = self.client.get(f"{url}?serial=abc", **self.header)
+
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
@@ -0,0 +1,196 @@
+from unittest import mock
+
+from django.test import TestCase
+
+from netbox_dns.models import NameServer, View, Zone
+from netbox_dns.choices import ZoneStatusChoices
+from netbox_dns.utilities import zone_name_trie, ProcessCache
+
+
+class ZoneNameTrieTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.views = (
+            View(name="test1"),
+            View(name="test2"),
+        )
+        View.objects.bulk_create(cls.views)
+
+        cls.nameserver = NameServer.objects.create(name="ns1.example.com")
+
+        cls.zone_data = {
+            "soa_mname": cls.nameserver,
+            "soa_rname": "hostmaster.example.com",
+        }
+
+        cls.zones = (
+            Zone(name="example.com", view=cls.views[0], **cls.zone_data),
+            Zone(name="sub.example.com", view=cls.views[0], **cls.zone_data),
+            Zone(name="sub2.sub.example.com", view=cls.views[0], **cls.zone_data),
+            Zone(name="sub.example.com", view=cls.views[1], **cls.zone_data),
+        )
+        for zone in cls.zones:
+            zone.save()
+
+    def test_get_zone_pk(self):
+        self.assertEqual(
+            zone_name_trie.get_zone_pk(self.views[0].pk, "sub.example.com"),
+            self.zones[1].pk,
+        )
+        self.assertEqual(
+            zone_name_trie.get_zone_pk(self.views[0].pk, "SUB.Example.com."),
+            self.zones[1].pk,
+        )
+        self.assertEqual(
+            zone_name_trie.get_zone_pk(self.views[1].pk, "sub.example.com"),
+            self.zones[3].pk,
+        )
+        self.assertIsNone(zone_name_trie.get_zone_pk(self.views[1].pk, "example.com"))
+        self.assertIsNone(zone_name_trie.get_zone_pk(self.views[0].pk, "com"))
+
+    def test_get_closest_zone_pk(self):
+        view = self.views[0]
+
+        self.assertEqual(
+            zone_name_trie.get_closest_zone_pk(view.pk, "name.sub2.sub.example.com"),
+            self.zones[2].pk,
+        )
+        self.assertEqual(
+            zone_name_trie.get_closest_zone_pk(view.pk, "name.sub3.sub.example.com"),
+            self.zones[1].pk,
+        )
+        self.assertEqual(
+            zone_name_trie.get_closest_zone_pk(view.pk, "sub.example.com"),
+            self.zones[1].pk,
+        )
+        self.assertEqual(
+            zone_name_trie.get_closest_zone_pk(
+                view.pk, "sub.example.com", include_self=False
+            ),
+            self.zones[0].pk,
+        )
+        self.assertEqual(
+            zone_name_trie.get_closest_zone_pk(
+                view.pk, "name.sub2.sub.example.com", exclude_pk=self.zones[2].pk
+            ),
+            self.zones[1].pk,
+        )
+        self.assertIsNone(
+            zone_name_trie.get_closest_zone_pk(view.pk, "name.example.org")
+        )
+        self.assertIsNone(
+            zone_name_trie.get_closest_zone_pk(
+                view.pk, "name.example.com", min_labels=3
+            )
+        )
+
+    def test_get_closest_zone_pk_inactive(self):
+        zone = self.zones[2]
+        zone.status = ZoneStatusChoices.STATUS_DEPRECATED
+        zone.save()
+
+        self.assertEqual(
+            zone_name_trie.get_closest_zone_pk(
+                self.views[0].pk, "name.sub2.sub.example.com"
+            ),
+            zone.pk,
+        )
+        self.assertEqual(
+            zone_name_trie.get_closest_zone_pk(
+                self.views[0].pk, "name.sub2.sub.example.com", active=True
+            ),
+            self.zones[1].pk,
+        )
+
+    def test_get_ancestor_zone_pks(self):
+        self.assertEqual(
+            zone_name_trie.get_ancestor_zone_pks(
+                self.views[0].pk, "sub2.sub.example.com"
+            ),
+            [self.zones[0].pk, self.zones[1].pk],
+        )
+        self.assertEqual(
+            zone_name_trie.get_ancestor_zone_pks(self.views[1].pk, "sub.example.com"),
+            [],
+        )
+
+    def test_rename_zone(self):
+        zone = self.zones[2]
+        zone.name = "sub2.example.com"
+        zone.save()
+
+        self.assertIsNone(
+            zone_name_trie.get_zone_pk(self.views[0].pk, "sub2.sub.example.com")
+        )
+        self.assertEqual(
+            zone_name_trie.get_zone_pk(self.views[0].pk, "sub2.example.com"),
+            zone.pk,
+        )
+
+    def test_move_zone_to_view(self):
+        zone = self.zones[0]
+        zone.view = self.views[1]
+        zone.save()
+
+        self.assertIsNone(zone_name_trie.get_zone_pk(self.views[0].pk, "example.com"))
+        self.assertEqual(
+            zone_name_trie.get_closest_zone_pk(self.views[1].pk, "name.example.com"),
+            zone.pk,
+        )
+
+    def test_delete_zone(self):
+        self.zones[1].delete()
+
+        self.assertIsNone(
+            zone_name_trie.get_zone_pk(self.views[0].pk, "sub.example.com")
+        )
+        self.assertEqual(
+            zone_name_trie.get_closest_zone_pk(
+                self.views[0].pk, "name.sub2.sub.example.com"
+            ),
+            self.zones[2].pk,
+        )
+        self.assertEqual(
+            zone_name_trie.get_closest_zone_pk(
+                self.views[0].pk, "name.sub3.sub.example.com"
+            ),
+            self.zones[0].pk,
+        )
+
+    def test_bulk_create_zones(self):
+        zone_name_trie.get_zone_pk(self.views[0].pk, "example.com")
+
+        zone = Zone(name="example.org", view=self.views[0], **self.zone_data)
+        Zone.objects.bulk_create([zone])
+
+        self.assertEqual(
+            zone_name_trie.get_zone_pk(self.views[0].pk, "example.org"),
+            Zone.objects.get(name="example.org").pk,
+        )
+
+    def test_parent_and_ancestor_zones(self):
+        zone = Zone.objects.get(pk=self.zones[2].pk)
+
+        self.assertEqual(zone.parent_zone, self.zones[1])
+        self.assertEqual(list(zone.ancestor_zones), [self.zones[0], self.zones[1]])
+
+        zone = Zone.objects.get(pk=self.zones[3].pk)
+
+        self.assertIsNone(zone.parent_zone)
+        self.assertEqual(list(zone.ancestor_zones), [])
+
+    def test_version_checked_once(self):
+        ProcessCache.expire_versions()
+
+        with mock.patch(
+            "netbox_dns.utilities.process_cache.cache.get", return_value=None
+        ) as cache_get:
+            for index in range(100):
+                zone_name_trie.get_closest_zone_pk(
+                    self.views[0].pk, f"name{index}.sub.example.com"
+                )
+                zone_name_trie.get_ancestor_zone_pks(
+                    self.views[0].pk, f"name{index}.sub2.sub.example.com"
+                )
+
+        self.assertEqual(cache_get.call_count, 1)
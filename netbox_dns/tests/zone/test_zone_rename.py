@@ -0,0 +1,104 @@
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+
+from netbox_dns.models import NameServer, Record, Zone
+from netbox_dns.choices import RecordTypeChoices
+
+
+class ZoneRenameTestCase(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.zone_data = {
+            "soa_mname": NameServer.objects.create(name="ns1.example.com"),
+            "soa_rname": "hostmaster.example.com",
+        }
+
+        cls.zone = Zone.objects.create(name="zone1.example.com", **cls.zone_data)
+        cls.reverse_zone = Zone.objects.create(
+            name="0.0.10.in-addr.arpa", **cls.zone_data
+        )
+
+        cls.records = (
+            Record(
+                zone=cls.zone,
+                name="name1",
+                type=RecordTypeChoices.A,
+                value="10.0.0.1",
+            ),
+            Record(
+                zone=cls.zone,
+                name="name2.sub",
+                type=RecordTypeChoices.A,
+                value="10.0.0.2",
+            ),
+            Record(
+                zone=cls.zone,
+                name="@",
+                type=RecordTypeChoices.TXT,
+                value="apex",
+            ),
+        )
+        for record in cls.records:
+            record.save()
+
+    def test_rename_zone(self):
+        self.zone.name = "zone2.example.com"
+        self.zone.save()
+
+        for record in self.zone.records.all():
+            if record.name == "@":
+                self.assertEqual(record.fqdn, "zone2.example.com.")
+            else:
+                self.assertEqual(record.fqdn, f"{record.name}.zone2.example.com.")
+
+    def test_rename_zone_ptr_records(self):
+        self.zone.name = "zone2.example.com"
+        self.zone.save()
+
+        for record in Record.objects.filter(zone=self.zone, type=RecordTypeChoices.A):
+            self.assertEqual(record.ptr_record.zone, self.reverse_zone)
+            self.assertEqual(record.ptr_record.value, record.fqdn)
+            self.assertTrue(record.ptr_record.value.endswith(".zone2.example.com."))
+
+    def test_rename_zone_serial(self):
+        soa_serial = Zone.objects.get(pk=self.reverse_zone.pk).soa_serial
+
+        Zone.objects.filter(pk=self.reverse_zone.pk).update(soa_serial=soa_serial - 1)
+
+        self.zone.name = "zone2.example.com"
+        self.zone.save()
+
+        self.assertGreaterEqual(
+            Zone.objects.get(pk=self.reverse_zone.pk).soa_serial, soa_serial
+        )
+
+    def test_rename_zone_journal_entry(self):
+        self.zone.name = "zone2.example.com"
+        self.zone.save()
+
+        journal_entry = self.zone.journal_entries.get()
+        self.assertIn("zone1.example.com", journal_entry.comments)
+        self.assertIn("zone2.example.com", journal_entry.comments)
+
+    def test_rename_zone_queries(self):
+        for index in range(3, 53):
+            Record.objects.create(
+                zone=self.zone,
+                name=f"name{index}",
+                type=RecordTypeChoices.TXT,
+                value=f"name{index}",
+            )
+
+        zone = Zone.objects.get(pk=self.zone.pk)
+        zone.name = "zone2.example.com"
+
+        with CaptureQueriesContext(connection) as context:
+            zone.save()
+
+        self.assertLess(len(context.captured_queries), 50)
+        self.assertFalse(
+            zone.records.exclude(fqdn__endswith=".zone2.example.com.")
+            .exclude(name="@")
+            .exists()
+        )
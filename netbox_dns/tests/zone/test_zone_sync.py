@@ -0,0 +1,271 @@
+from unittest import mock
+
+from django.urls import reverse
+from rest_framework import status
+
+from core.models import ObjectType
+from users.models import ObjectPermission
+
+from netbox_dns.tests.custom import APITestCase
+from netbox_dns.models import NameServer, Record, Zone
+from netbox_dns.choices import RecordTypeChoices
+from netbox_dns.utilities import (
+    diff_zone_records,
+    parse_zone_records,
+    sync_zone_records,
+    update_serials,
+)
+
+
+class ZoneSyncTestCase(APITestCase):
+    model = Zone
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.zone = Zone.objects.create(
+            name="zone1.example.com",
+            soa_mname=NameServer.objects.create(name="ns1.example.com"),
+            soa_rname="hostmaster.example.com",
+            default_ttl=86400,
+        )
+        cls.zone.nameservers.set(NameServer.objects.all())
+        cls.zone.save()
+
+        for name, record_type, value in (
+            ("name1", RecordTypeChoices.A, "10.0.0.1"),
+            ("name2", RecordTypeChoices.A, "10.0.0.2"),
+            ("name3", RecordTypeChoices.CNAME, "name1"),
+        ):
+            Record.objects.create(
+                zone=cls.zone, name=name, type=record_type, value=value
+            )
+
+    def sync(
+        self,
+        data,
+        dry_run=False,
+        content_type="application/json",
+        permissions=(
+            "netbox_dns.view_zone",
+            "netbox_dns.change_zone",
+            "netbox_dns.add_record",
+            "netbox_dns.change_record",
+            "netbox_dns.delete_record",
+        ),
+    ):
+        self.add_permissions(*permissions)
+
+        url = reverse(
+            "plugins-api:netbox_dns-api:zone-sync", kwargs={"pk": self.zone.pk}
+        )
+        if dry_run:
+            url += "?dry_run=true"
+
+        if content_type == "application/json":
+            return self.client.post(url, data, format="json", **self.header)
+
+        return self.client.post(url, data, content_type=content_type, **self.header)
+
+    def get_records(self):
+        return set(
+            self.zone.records.filter(managed=False).values_list(
+                "name", "type", "value", "ttl"
+            )
+        )
+
+    def test_diff(self):
+        diff = diff_zone_records(
+            self.zone,
+            [
+                {"name": "name1", "type": "a", "value": "10.0.0.1"},
+                {
+                    "name": "name2.zone1.example.com.",
+                    "type": "A",
+                    "value": "10.0.0.2",
+                    "ttl": 3600,
+                },
+                {"name": "name4", "type": "A", "value": "10.0.0.4"},
+                {"name": "@", "type": "NS", "value": "ns1.example.com."},
+            ],
+        )
+
+        self.assertEqual([item["name"] for item in diff["create"]], ["name4"])
+        self.assertEqual([record.name for record, item in diff["update"]], ["name2"])
+        self.assertEqual([record.name for record in diff["delete"]], ["name3"])
+
+    def test_sync(self):
+        response = self.sync(
+            [
+                {"name": "name1", "type": "A", "value": "10.0.0.1"},
+                {"name": "name2", "type": "A", "value": "10.0.0.2", "ttl": 3600},
+                {"name": "name3", "type": "CNAME", "value": "name2"},
+            ]
+        )
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+
+        self.assertEqual(len(response.data["create"]), 1)
+        self.assertEqual(len(response.data["update"]), 1)
+        self.assertEqual(len(response.data["delete"]), 1)
+        self.assertEqual(
+            self.get_records(),
+            {
+                ("name1", RecordTypeChoices.A, "10.0.0.1", None),
+                ("name2", RecordTypeChoices.A, "10.0.0.2", 3600),
+                ("name3", RecordTypeChoices.CNAME, "name2", None),
+            },
+        )
+
+    def test_dry_run(self):
+        records = self.get_records()
+
+        response = self.sync(
+            [{"name": "name4", "type": "A", "value": "10.0.0.4"}], dry_run=True
+        )
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+
+        self.assertTrue(response.data["dry_run"])
+        self.assertEqual(len(response.data["create"]), 1)
+        self.assertEqual(len(response.data["delete"]), 3)
+        self.assertEqual(self.get_records(), records)
+
+    def test_sync_error(self):
+        records = self.get_records()
+
+        response = self.sync(
+            [
+                {"name": "name1", "type": "A", "value": "10.0.0.1"},
+                {"name": "name1", "type": "CNAME", "value": "name2"},
+            ]
+        )
+        self.assertHttpStatus(response, status.HTTP_400_BAD_REQUEST)
+
+        self.assertEqual(len(response.data["errors"]), 1)
+        self.assertEqual(self.get_records(), records)
+
+    def test_sync_zone_file(self):
+        zone_file = (
+            "@      IN NS    ns1.example.com.\n"
+            "name1 IN A     10.0.0.1\n"
+            "name2 3600 IN A 10.0.0.2\n"
+            'name5 IN TXT   "text"\n'
+        )
+        self.assertEqual(
+            parse_zone_records(self.zone, zone_file)[1:],
+            [
+                {"name": "name1", "type": "A", "value": "10.0.0.1", "ttl": None},
+                {"name": "name2", "type": "A", "value": "10.0.0.2", "ttl": 3600},
+                {"name": "name5", "type": "TXT", "value": '"text"', "ttl": None},
+            ],
+        )
+
+        response = self.sync(zone_file, content_type="text/dns")
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+
+        self.assertEqual(
+            self.get_records(),
+            {
+                ("name1", RecordTypeChoices.A, "10.0.0.1", None),
+                ("name2", RecordTypeChoices.A, "10.0.0.2", 3600),
+                ("name5", RecordTypeChoices.TXT, '"text"', None),
+            },
+        )
+
+    def test_permission_denied(self):
+        records = self.get_records()
+
+        response = self.sync(
+            [{"name": "name4", "type": "A", "value": "10.0.0.4"}],
+            permissions=(
+                "netbox_dns.view_zone",
+                "netbox_dns.add_record",
+                "netbox_dns.change_record",
+                "netbox_dns.delete_record",
+            ),
+        )
+        self.assertHttpStatus(response, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(self.get_records(), records)
+
+    def test_delete_constraint_denied(self):
+        records = self.get_records()
+
+        permission = ObjectPermission.objects.create(
+            name="Record delete",
+            actions=["delete"],
+            constraints={"name": "other"},
+        )
+        permission.object_types.add(ObjectType.objects.get_for_model(Record))
+        permission.users.add(self.user)
+
+        response = self.sync(
+            [{"name": "name4", "type": "A", "value": "10.0.0.4"}],
+            permissions=(
+                "netbox_dns.view_zone",
+                "netbox_dns.change_zone",
+                "netbox_dns.add_record",
+                "netbox_dns.change_record",
+            ),
+        )
+        self.assertHttpStatus(response, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(self.get_records(), records)
+
+    def test_read_only_token(self):
+        records = self.get_records()
+
+        self.token.write_enabled = False
+        self.token.save()
+
+        response = self.sync([{"name": "name4", "type": "A", "value": "10.0.0.4"}])
+        self.assertHttpStatus(response, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(self.get_records(), records)
+
+    def test_sync_rfc2317_ptr_records(self):
+        zone_data = {
+            "soa_mname": NameServer.objects.get(name="ns1.example.com"),
+            "soa_rname": "hostmaster.example.com",
+        }
+        parent_zone = Zone.objects.create(name="0.0.10.in-addr.arpa", **zone_data)
+        rfc2317_zone = Zone.objects.create(
+            name="0-15.0.0.10.in-addr.arpa",
+            **zone_data,
+            rfc2317_prefix="10.0.0.0/28",
+            rfc2317_parent_managed=True,
+        )
+
+        for name, value in (
+            ("1", "name1.zone1.example.com."),
+            ("1", "name2.zone1.example.com."),
+            ("2", "name3.zone1.example.com."),
+        ):
+            Record.objects.create(
+                zone=rfc2317_zone, name=name, type=RecordTypeChoices.PTR, value=value
+            )
+
+        def get_cname_names():
+            return set(
+                parent_zone.records.filter(type=RecordTypeChoices.CNAME).values_list(
+                    "name", flat=True
+                )
+            )
+
+        self.assertEqual(get_cname_names(), {"1", "2"})
+
+        with mock.patch(
+            "netbox_dns.utilities.zone_sync.update_serials", wraps=update_serials
+        ) as serials:
+            diff, errors = sync_zone_records(
+                rfc2317_zone,
+                [{"name": "1", "type": "PTR", "value": "name1.zone1.example.com."}],
+            )
+
+        self.assertEqual(errors, [])
+        self.assertEqual(len(diff["delete"]), 2)
+        self.assertEqual(get_cname_names(), {"1"})
+        self.assertIn(
+            parent_zone.pk,
+            set().union(*(call.args[0] for call in serials.call_args_list)),
+        )
+
+        diff, errors = sync_zone_records(rfc2317_zone, [])
+
+        self.assertEqual(errors, [])
+        self.assertEqual(get_cname_names(), set())
@@ -0,0 +1,127 @@
+from unittest import mock
+
+import dns.message
+import dns.rrset
+from dns import rdatatype
+
+from django.test import SimpleTestCase
+
+from netbox_dns.utilities import ZoneTransfer
+
+SOA_VALUE = "ns1.example.com. hostmaster.example.com. {serial} 172800 7200 2592000 3600"
+
+
+def soa(serial):
+    return dns.rrset.from_text("@", 3600, "IN", "SOA", SOA_VALUE.format(serial=serial))
+
+
+def rrset(name, record_type, value, ttl=86400):
+    return dns.rrset.from_text(name, ttl, "IN", record_type, value)
+
+
+def message(*rrsets):
+    response = dns.message.Message()
+    response.answer = list(rrsets)
+
+    return response
+
+
+def records(items):
+    return [
+        (name.to_text(), rdatatype.to_text(rr.rdtype), rr.to_text())
+        for name, ttl, rr in items
+    ]
+
+
+class ZoneTransferIXFRTestCase(SimpleTestCase):
+    def ixfr(self, serial, *messages):
+        transfer = ZoneTransfer("192.0.2.1", "zone1.example.com")
+
+        with mock.patch("dns.query.xfr", return_value=iter(messages)) as xfr:
+            result = transfer.ixfr(serial)
+
+        self.assertEqual(xfr.call_args.kwargs["rdtype"], rdatatype.IXFR)
+        self.assertEqual(xfr.call_args.kwargs["serial"], serial)
+
+        return result
+
+    def test_ixfr_multiple_steps(self):
+        transfer_type, soa_record, changes = self.ixfr(
+            1,
+            message(
+                soa(3),
+                soa(1),
+                rrset("name3", "CNAME", "name1"),
+                soa(2),
+                rrset("name4", "A", "10.0.0.4"),
+            ),
+            message(
+                soa(2),
+                rrset("@", "NS", "ns2.example.com."),
+                rrset("name4", "A", "10.0.0.4"),
+                soa(3),
+                rrset("name4", "A", "10.0.0.5", ttl=600),
+                soa(3),
+            ),
+        )
+
+        self.assertEqual(transfer_type, "ixfr")
+        self.assertEqual(soa_record[2].serial, 3)
+        self.assertEqual(
+            [(records(deleted), records(added)) for deleted, added in changes],
+            [
+                (
+                    [("name3", "CNAME", "name1")],
+                    [("name4", "A", "10.0.0.4")],
+                ),
+                (
+                    [("@", "NS", "ns2.example.com."), ("name4", "A", "10.0.0.4")],
+                    [("name4", "A", "10.0.0.5")],
+                ),
+            ],
+        )
+        self.assertEqual(changes[1][1][0][1], 600)
+
+    def test_ixfr_empty_steps(self):
+        transfer_type, soa_record, changes = self.ixfr(
+            1,
+            message(soa(3), soa(1), soa(2), soa(2), soa(3), soa(3)),
+        )
+
+        self.assertEqual(transfer_type, "ixfr")
+        self.assertEqual(changes, [([], []), ([], [])])
+
+    def test_axfr_fallback(self):
+        transfer_type, soa_record, changes = self.ixfr(
+            1,
+            message(
+                soa(3),
+                rrset("@", "NS", "ns1.example.com."),
+                rrset("name1", "A", "10.0.0.1"),
+            ),
+            message(rrset("name2", "A", "10.0.0.2", ttl=300), soa(3)),
+        )
+
+        self.assertEqual(transfer_type, "axfr")
+        self.assertEqual(soa_record[2].serial, 3)
+        self.assertEqual(
+            records(changes),
+            [
+                ("@", "NS", "ns1.example.com."),
+                ("name1", "A", "10.0.0.1"),
+                ("name2", "A", "10.0.0.2"),
+            ],
+        )
+
+    def test_axfr_fallback_empty_zone(self):
+        transfer_type, soa_record, changes = self.ixfr(1, message(soa(3), soa(3)))
+
+        self.assertEqual(transfer_type, "axfr")
+        self.assertEqual(changes, [])
+
+    def test_current(self):
+        transfer_type, soa_record, changes = self.ixfr(3, message(soa(3)))
+
+        self.assertEqual(transfer_type, "current")
+        self.assertEqual(soa_record[2].serial, 3)
+        self.assertIsNone(changes)
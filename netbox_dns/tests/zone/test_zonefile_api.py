@@ -0,0 +1,165 @@
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
+from django.urls import reverse
+from django.utils import timezone
+from rest_framework import status
+
+from netbox_dns.tests.custom import APITestCase
+from netbox_dns.models import NameServer, Record, Zone
+from netbox_dns.choices import RecordTypeChoices, RecordStatusChoices
+from netbox_dns.utilities import get_zone_file_etag
+
+
+class ZoneFileAPITestCase(APITestCase):
+    model = Zone
+
+    @classmethod
+    def setUpTestData(cls):
+        cls.zone = Zone.objects.create(
+            name="zone1.example.com",
+            soa_mname=NameServer.objects.create(name="ns1.example.com"),
+            soa_rname="hostmaster.example.com",
+            default_ttl=86400,
+        )
+
+        cls.records = (
+            Record(
+                zone=cls.zone,
+                name="name2",
+                type=RecordTypeChoices.A,
+                value="10.0.0.2",
+            ),
+            Record(
+                zone=cls.zone,
+                name="name1",
+                type=RecordTypeChoices.A,
+                value="10.0.0.1",
+                ttl=3600,
+            ),
+            Record(
+                zone=cls.zone,
+                name="name3",
+                type=RecordTypeChoices.TXT,
+                value="inactive",
+                status=RecordStatusChoices.STATUS_INACTIVE,
+            ),
+        )
+        for record in cls.records:
+            record.save()
+
+    def get_url(self):
+        return reverse(
+            "plugins-api:netbox_dns-api:zone-zonefile", kwargs={"pk": self.zone.pk}
+        )
+
+    def get_zone_file(self, response):
+        return b"".join(response.streaming_content).decode()
+
+    def test_zonefile(self):
+        self.add_permissions("netbox_dns.view_zone")
+
+        response = self.client.get(self.get_url(), **self.header)
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+
+        zone = Zone.objects.get(pk=self.zone.pk)
+        self.assertEqual(response["ETag"], get_zone_file_etag(zone))
+
+        lines = [
+            line.split()
+            for line in self.get_zone_file(response).splitlines()
+            if line and not line.startswith(";")
+        ]
+
+        self.assertEqual(lines[0], ["$ORIGIN", "zone1.example.com."])
+        self.assertEqual(lines[1], ["$TTL", "86400"])
+        self.assertEqual(lines[2][0:3], ["@", "86400", "IN"])
+        self.assertEqual(lines[2][3], RecordTypeChoices.SOA)
+
+        records = [line for line in lines[3:] if line[0].startswith("name")]
+        self.assertEqual(
+            records,
+            [
+                ["name1", "3600", "IN", "A", "10.0.0.1"],
+                ["name2", "IN", "A", "10.0.0.2"],
+            ],
+        )
+
+    def test_zonefile_not_modified(self):
+        self.add_permissions("netbox_dns.view_zone")
+
+        response = self.client.get(self.get_url(), **self.header)
+        etag = response["ETag"]
+
+        with CaptureQueriesContext(connection) as context:
+            response = self.client.get(
+                self.get_url(), HTTP_IF_NONE_MATCH=etag, **self.header
+            )
+        self.assertHttpStatus(response, status.HTTP_304_NOT_MODIFIED)
+        self.assertEqual(response["ETag"], etag)
+
+        record_queries = [
+            query["sql"]
+            for query in context.captured_queries
+            if Record._meta.db_table in query["sql"]
+        ]
+        self.assertEqual(len(record_queries), 1)
+        self.assertIn("COUNT(", record_queries[0])
+
+    def test_zonefile_modified(self):
+        self.add_permissions("netbox_dns.view_zone")
+
+        response = self.client.get(self.get_url(), **self.header)
+        etag = response["ETag"]
+
+        zone = Zone.objects.get(pk=self.zone.pk)
+        Zone.objects.filter(pk=zone.pk).update(soa_serial=zone.soa_serial + 1)
+
+        response = self.client.get(
+            self.get_url(), HTTP_IF_NONE_MATCH=etag, **self.header
+        )
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def assertZoneFileModified(self, modify):
+        self.add_permissions("netbox_dns.view_zone")
+
+        response = self.client.get(self.get_url(), **self.header)
+        etag = response["ETag"]
+
+        modify()
+
+        response = self.client.get(
+            self.get_url(), HTTP_IF_NONE_MATCH=etag, **self.header
+        )
+        self.assertHttpStatus(response, status.HTTP_200_OK)
+        self.assertNotEqual(response["ETag"], etag)
+
+    def test_zonefile_modified_view_rename(self):
+        def rename_view():
+            view = self.zone.view
+            view.name = "renamed"
+            view.save()
+
+        self.assertZoneFileModified(rename_view)
+
+    def test_zonefile_modified_record_without_serial_change(self):
+        Zone.objects.filter(pk=self.zone.pk).update(soa_serial_auto=False)
+
+        def update_record():
+            Record.objects.filter(pk=self.records[0].pk).update(
+                value="10.0.0.3", last_updated=timezone.now()
+            )
+
+        self.assertZoneFileModified(update_record)
+
+    def test_zonefile_modified_record_delete_without_serial_change(self):
+        Zone.objects.filter(pk=self.zone.pk).update(soa_serial_auto=False)
+
+        def delete_record():
+            Record.objects.filter(pk=self.records[0].pk).delete()
+
+        self.assertZoneFileModified(delete_record)
+
+    def test_zonefile_without_permission(self):
+        response = self.client.get(self.get_url(), **self.header)
+        self.assertHttpStatus(response, status.HTTP_403_FORBIDDEN)
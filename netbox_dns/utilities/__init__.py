@@ -1,3 +1,22 @@
 from .dns import *
 from .conversions import *
+from .process_cache import *
+from .serials import *
+from .prefix_tree import *
+from .zone_trie import *
+from .ptr_records import *
+from .effective_views import *
 from .ipam_dnssync import *
+from .dnssync_engine import *
+from .dnssync_batch import *
+from .dnssync_jobs import *
+from .zonefile import *
+from .journal import *
+from .changes_feed import *
+from .record_upsert import *
+from .zone_sync import *
+from .zone_import import *
+from .zone_transfer import *
+from .record_export import *
+from .record_lookup import *
+from .ip_address_filter import *
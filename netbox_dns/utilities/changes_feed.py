@@ -0,0 +1,152 @@
+import base64
+import json
+from datetime import datetime, timedelta
+
+from django.db.models import Q
+from django.utils import timezone
+
+from netbox.plugins.utils import get_plugin_config
+
+__all__ = (
+    "FeedCursorError",
+    "FeedCursorExpired",
+    "prune_tombstones",
+    "get_changes",
+)
+
+
+class FeedCursorError(Exception):
+    pass
+
+
+class FeedCursorExpired(FeedCursorError):
+    pass
+
+
+def _get_retention():
+    return timedelta(
+        seconds=get_plugin_config("netbox_dns", "changes_feed_retention", 2592000)
+    )
+
+
+def _get_safety_lag():
+    return timedelta(
+        seconds=get_plugin_config("netbox_dns", "changes_feed_safety_lag", 5)
+    )
+
+
+def _encode_position(timestamp, pk):
+    return [timestamp.isoformat(), pk]
+
+
+def _decode_position(position):
+    if position is None:
+        return None
+
+    timestamp, pk = position
+    return datetime.fromisoformat(timestamp), int(pk)
+
+
+def _encode_cursor(poll_time, changed_position, deleted_position):
+    cursor = json.dumps(
+        {
+            "t": poll_time.isoformat(),
+            "c": changed_position,
+            "d": deleted_position,
+        },
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(cursor.encode()).decode()
+
+
+def _decode_cursor(cursor):
+    try:
+        data = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return (
+            datetime.fromisoformat(data["t"]),
+            _decode_position(data["c"]),
+            _decode_position(data["d"]),
+        )
+    except (ValueError, TypeError, KeyError) as exc:
+        raise FeedCursorError(f"Invalid cursor: {exc}") from exc
+
+
+def _after(queryset, field, position):
+    queryset = queryset.order_by(field, "pk")
+    if position is None:
+        return queryset
+
+    timestamp, pk = position
+    return queryset.filter(
+        Q(**{f"{field}__gt": timestamp}) | Q(**{field: timestamp, "pk__gt": pk})
+    )
+
+
+def prune_tombstones():
+    """
+    Remove the tombstones that are older than the retention period of the
+    changes feed. This is done by the `TombstoneCleanupJob` system job.
+    """
+    from netbox_dns.models import Tombstone
+
+    return Tombstone.objects.filter(
+        deleted__lt=timezone.now() - _get_retention()
+    ).delete()
+
+
+def get_changes(queryset, tombstones, cursor=None, limit=1000):
+    """
+    Return the objects in `queryset` that were changed and the tombstones in
+    `tombstones` that were created since the position described by the opaque
+    string `cursor`, or all objects and tombstones if `cursor` is None.
+
+    Objects are returned in the order of their `last_updated` timestamps and
+    tombstones in the order of their `deleted` timestamps, at most `limit` of
+    each. Changes are only returned once they are older than the safety lag,
+    so changes committed late by a transaction that was still running at the
+    time of the previous call are not skipped. The result is a dictionary
+    containing the lists `changed` and `deleted`, the cursor for the next call
+    and the flag `more`, which is set if further changes are available
+    immediately.
+
+    FeedCursorExpired is raised if the cursor is older than the retention
+    period of the tombstones, in which case a full resynchronisation is
+    required.
+    """
+    poll_time = timezone.now()
+    cutoff = poll_time - _get_safety_lag()
+    changed_position = deleted_position = None
+
+    if cursor is not None:
+        last_poll_time, changed_position, deleted_position = _decode_cursor(cursor)
+        if last_poll_time < poll_time - _get_retention():
+            raise FeedCursorExpired("The cursor has expired")
+
+    changed = list(
+        _after(
+            queryset.filter(last_updated__isnull=False, last_updated__lte=cutoff),
+            "last_updated",
+            changed_position,
+        )[:limit]
+    )
+    deleted = list(
+        _after(tombstones.filter(deleted__lte=cutoff), "deleted", deleted_position)[
+            :limit
+        ]
+    )
+
+    if changed:
+        changed_position = (changed[-1].last_updated, changed[-1].pk)
+    if deleted:
+        deleted_position = (deleted[-1].deleted, deleted[-1].pk)
+
+    return {
+        "changed": changed,
+        "deleted": deleted,
+        "cursor": _encode_cursor(
+            poll_time,
+            _encode_position(*changed_position) if changed_position else None,
+            _encode_position(*deleted_position) if deleted_position else None,
+        ),
+        "more": len(changed) == limit or len(deleted) == limit,
+    }
@@ -0,0 +1,118 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils.translation import gettext as _
+
+from ipam.models import IPAddress
+
+from .dnssync_engine import DNSsyncEngine
+
+__all__ = (
+    "DNSsyncBatch",
+    "dnssync_batch",
+    "get_dnssync_batch",
+)
+
+_current_batch = ContextVar("netbox_dns_dnssync_batch", default=None)
+
+
+class DNSsyncBatch:
+    """
+    Deferred DNSsync work for IPAddress objects saved while the batch is
+    active.
+
+    Instead of updating the address records of each IP address when it is
+    saved, the IP addresses are collected and synchronized by the DNSsync
+    engine in chunks when the batch is flushed. Zones resolved while the
+    batch is active are shared between all IP addresses.
+    """
+
+    chunk_size = 1000
+
+    def __init__(self):
+        self.ip_address_pks = set()
+        self._zones = {}
+
+    def add(self, ip_address):
+        self.ip_address_pks.add(ip_address.pk)
+
+    def get_zones(self, zone_pks):
+        from netbox_dns.models import Zone
+
+        if missing_pks := set(zone_pks) - self._zones.keys():
+            self._zones.update(
+                {
+                    zone.pk: zone
+                    for zone in Zone.objects.filter(pk__in=missing_pks).select_related(
+                        "view"
+                    )
+                }
+            )
+
+        return [self._zones[pk] for pk in zone_pks if pk in self._zones]
+
+    def flush(self):
+        """
+        Synchronize the address records of all collected IP addresses.
+
+        Raises a ValidationError listing all IP addresses whose records could
+        not be synchronized.
+        """
+        engine = None
+        errors = []
+
+        while self.ip_address_pks:
+            pks = sorted(self.ip_address_pks)
+            self.ip_address_pks.clear()
+
+            if engine is None:
+                engine = DNSsyncEngine()
+
+            for index in range(0, len(pks), self.chunk_size):
+                result = engine.sync(
+                    IPAddress.objects.filter(
+                        pk__in=pks[index : index + self.chunk_size]
+                    )
+                )
+                errors += result["errors"]
+
+        if errors:
+            raise ValidationError(
+                [
+                    _("IP address {address}: {error}").format(
+                        address=ip_address, error=", ".join(exc.messages)
+                    )
+                    for ip_address, exc in errors
+                ]
+            )
+
+
+@contextmanager
+def dnssync_batch():
+    """
+    Defer DNSsync work for IPAddress objects saved in the context to a
+    `DNSsyncBatch` that is flushed at the end of the context.
+
+    The context runs in a transaction, so the IP addresses are rolled back if
+    their address records cannot be synchronized. Nested contexts use the
+    batch of the outermost context.
+    """
+    if (batch := _current_batch.get()) is not None:
+        yield batch
+        return
+
+    batch = DNSsyncBatch()
+    token = _current_batch.set(batch)
+
+    try:
+        with transaction.atomic():
+            yield batch
+            batch.flush()
+    finally:
+        _current_batch.reset(token)
+
+
+def get_dnssync_batch():
+    return _current_batch.get()
@@ -0,0 +1,281 @@
+from collections import defaultdict
+
+import netaddr
+
+from django.conf import settings
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils import timezone
+
+from netbox.search.backends import search_backend
+from ipam.models import IPAddress, Prefix
+
+from .journal import reset_zone_changes
+from .prefix_tree import prefix_view_tree
+from .ptr_records import update_ptr_records
+from .serials import update_serials
+from .zone_trie import zone_name_trie
+
+__all__ = (
+    "DNSsyncEngine",
+    "partition_ip_addresses",
+)
+
+RECORD_UPDATE_FIELDS = (
+    "name",
+    "fqdn",
+    "value",
+    "status",
+    "ttl",
+    "disable_ptr",
+    "ip_address",
+    "last_updated",
+)
+
+
+class DNSsyncEngine:
+    """
+    Batch engine for IPAM DNSsync.
+
+    The engine loads all active zones in views assigned to prefixes once and
+    uses them together with the prefix view tree and the zone name trie to compute
+    the desired address records for a chunk of IPAddress objects in memory.
+    The difference to the existing records is then applied using bulk
+    operations, and the SOA serial of each zone affected is updated only once
+    per chunk.
+    """
+
+    def __init__(self):
+        self.min_labels = settings.PLUGINS_CONFIG["netbox_dns"].get(
+            "dnssync_minimum_zone_labels", 2
+        )
+
+        self.load()
+
+    def load(self):
+        from netbox_dns.models import Zone
+
+        self._zones = {
+            zone.pk: zone
+            for zone in Zone.objects.filter(view__prefixes__isnull=False, active=True)
+            .distinct()
+            .select_related("view")
+        }
+
+    def get_zone(self, view_id, name):
+        """
+        Return the active zone in the view that is the closest enclosing zone
+        for the DNS name, or None if there is no such zone.
+        """
+        zone_pk = zone_name_trie.get_closest_zone_pk(
+            view_id, name, min_labels=self.min_labels, active=True
+        )
+
+        return self._zones.get(zone_pk)
+
+    def get_zones(self, ip_address):
+        if not ip_address.dns_name:
+            return {}
+
+        zones = {}
+        for view_id in prefix_view_tree.get_view_ids(
+            ip_address.vrf_id, ip_address.address.ip
+        ):
+            if (zone := self.get_zone(view_id, ip_address.dns_name)) is not None:
+                zones[zone.pk] = zone
+
+        return zones
+
+    def sync(self, ip_addresses):
+        """
+        Synchronize the address records for a chunk of IPAddress objects.
+
+        Returns a dictionary with the number of records created, updated and
+        deleted, the list of IP addresses whose records were changed and a list
+        of (IP address, ValidationError) tuples for addresses that could not be
+        synchronized.
+        """
+        from netbox_dns.models import Record
+
+        ip_addresses = list(ip_addresses)
+
+        address_records = defaultdict(list)
+        for record in Record.objects.filter(
+            ipam_ip_address__in=[ip_address.pk for ip_address in ip_addresses]
+        ).select_related(
+            "zone",
+            "ptr_record",
+            "ptr_record__zone",
+            "ptr_record__rfc2317_cname_record",
+        ):
+            address_records[record.ipam_ip_address_id].append(record)
+
+        create_records = []
+        update_records = []
+        delete_records = []
+        changed_addresses = []
+        errors = []
+
+        for ip_address in ip_addresses:
+            zones = self.get_zones(ip_address)
+
+            ip_address_create = []
+            ip_address_update = []
+            ip_address_delete = []
+
+            for record in address_records[ip_address.pk]:
+                if (zone := zones.pop(record.zone_id, None)) is None:
+                    ip_address_delete.append(record)
+                    continue
+
+                record.zone = zone
+                updated, deleted = record.update_from_ip_address(ip_address)
+
+                if deleted:
+                    ip_address_delete.append(record)
+                elif updated:
+                    ip_address_update.append(record)
+
+            for zone in zones.values():
+                if (
+                    record := Record.create_from_ip_address(ip_address, zone)
+                ) is not None:
+                    ip_address_create.append(record)
+
+            try:
+                for record in ip_address_create + ip_address_update:
+                    record.full_clean()
+            except ValidationError as exc:
+                errors.append((ip_address, exc))
+                continue
+
+            if ip_address_create or ip_address_update or ip_address_delete:
+                changed_addresses.append(ip_address)
+
+            create_records += ip_address_create
+            update_records += ip_address_update
+            delete_records += ip_address_delete
+
+        dirty_zone_ids = set()
+
+        with transaction.atomic():
+            if delete_records:
+                ptr_address_records = {
+                    record.ptr_record_id: record
+                    for record in delete_records
+                    if record.ptr_record_id is not None
+                }
+
+                Record.objects.filter(
+                    pk__in=[record.pk for record in delete_records]
+                ).delete()
+
+                for record in ptr_address_records.values():
+                    dirty_zone_ids.add(record.ptr_record.zone_id)
+                    record.refresh_ptr_record(record.ptr_record, save_zone_serial=False)
+
+            now = timezone.now()
+
+            for record in create_records + update_records:
+                record.ip_address = netaddr.IPAddress(record.value)
+                record.last_updated = now
+
+                record.handle_conflicting_address_records()
+
+            if create_records:
+                Record.objects.bulk_create(create_records)
+            if update_records:
+                Record.objects.bulk_update(update_records, fields=RECORD_UPDATE_FIELDS)
+
+            dirty_zone_ids |= update_ptr_records(create_records + update_records)
+
+            if create_records or update_records:
+                search_backend.cache(create_records + update_records)
+
+            record_zone_ids = {
+                record.zone_id
+                for record in create_records + update_records + delete_records
+            }
+            reset_zone_changes(record_zone_ids)
+            dirty_zone_ids |= record_zone_ids
+
+            update_serials(dirty_zone_ids)
+
+        return {
+            "created": len(create_records),
+            "updated": len(update_records),
+            "deleted": len(delete_records),
+            "changed_addresses": changed_addresses,
+            "errors": errors,
+        }
+
+
+def _chunk_list(items, chunk_size):
+    return [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
+
+
+def partition_ip_addresses(partition=None, chunk_size=1000):
+    """
+    Split the IPAddress objects into partitions and the partitions into chunks
+    of PKs.
+
+    With partition "vrf", there is one partition per VRF. With partition
+    "prefix", there is one partition per top-level prefix and a partition for
+    all IP addresses not contained in any top-level prefix. Otherwise, all IP
+    addresses are in the same partition.
+
+    Returns a list of (label, chunks) tuples.
+    """
+    partitions = []
+
+    match partition:
+        case "vrf":
+            pks = defaultdict(list)
+            vrf_names = {}
+            for pk, vrf_id, vrf_name in IPAddress.objects.order_by("pk").values_list(
+                "pk", "vrf", "vrf__name"
+            ):
+                pks[vrf_id].append(pk)
+                vrf_names[vrf_id] = vrf_name
+
+            for vrf_id, vrf_pks in pks.items():
+                label = (
+                    f"VRF {vrf_names[vrf_id]}" if vrf_id is not None else "Global VRF"
+                )
+                partitions.append((label, vrf_pks))
+
+        case "prefix":
+            assigned = set()
+            for prefix in Prefix.objects.filter(_depth=0):
+                prefix_pks = [
+                    pk
+                    for pk in IPAddress.objects.filter(
+                        vrf=prefix.vrf, address__net_host_contained=prefix.prefix
+                    )
+                    .order_by("pk")
+                    .values_list("pk", flat=True)
+                    if pk not in assigned
+                ]
+                if prefix_pks:
+                    assigned.update(prefix_pks)
+                    partitions.append(
+                        (f"Prefix {prefix}, VRF {prefix.vrf}", prefix_pks)
+                    )
+
+            remaining_pks = [
+                pk
+                for pk in IPAddress.objects.order_by("pk").values_list("pk", flat=True)
+                if pk not in assigned
+            ]
+            if remaining_pks:
+                partitions.append(("No prefix", remaining_pks))
+
+        case _:
+            partitions.append(
+                (
+                    "All IP addresses",
+                    list(IPAddress.objects.order_by("pk").values_list("pk", flat=True)),
+                )
+            )
+
+    return [(label, _chunk_list(pks, chunk_size)) for label, pks in partitions]
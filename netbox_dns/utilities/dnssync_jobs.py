@@ -0,0 +1,118 @@
+from functools import partial
+
+from django.db import transaction
+from django.core.exceptions import ValidationError
+from django.utils.translation import gettext as _
+
+from netbox.context import current_request
+from netbox.plugins.utils import get_plugin_config
+from core.choices import JobStatusChoices
+from utilities.exceptions import AbortRequest
+
+__all__ = (
+    "get_dnssync_job_pks",
+    "enqueue_dnssync_job",
+    "check_dnssync_job_lock",
+)
+
+
+def get_dnssync_job_pks(ip_addresses):
+    """
+    Return the sorted PKs of the IP addresses if synchronizing their address
+    records should be offloaded to a background job, and None otherwise.
+
+    Work is only offloaded in requests, and only if the number of IP
+    addresses exceeds the `dnssync_job_threshold` setting.
+    """
+    threshold = get_plugin_config("netbox_dns", "dnssync_job_threshold")
+    if not threshold or current_request.get() is None:
+        return None
+
+    pks = sorted(set(ip_addresses.values_list("pk", flat=True)))
+    if len(pks) <= threshold:
+        return None
+
+    return pks
+
+
+def _enqueue_pending_jobs(request):
+    from netbox_dns.jobs import DNSsyncJob
+
+    pending_jobs = request._netbox_dns_dnssync_jobs
+    del request._netbox_dns_dnssync_jobs
+
+    for instance, pks in pending_jobs.values():
+        DNSsyncJob.enqueue(
+            instance=instance if instance is not None and instance.pk else None,
+            user=request.user if request.user.is_authenticated else None,
+            ip_address_pks=sorted(pks),
+        )
+
+
+def enqueue_dnssync_job(ip_addresses, instance=None):
+    """
+    Offload synchronizing the address records of the IP addresses to a
+    `DNSsyncJob` if the number of IP addresses exceeds the job threshold. The
+    job is assigned to `instance`, which is locked against changes until the
+    job is finished.
+
+    The jobs are enqueued when the transaction is committed, with one job per
+    object combining all IP addresses offloaded for it in the request.
+
+    Returns True if the work was offloaded, and False if the caller needs to
+    synchronize the address records itself.
+    """
+    if (pks := get_dnssync_job_pks(ip_addresses)) is None:
+        return False
+
+    request = current_request.get()
+
+    if (pending_jobs := getattr(request, "_netbox_dns_dnssync_jobs", None)) is None:
+        pending_jobs = request._netbox_dns_dnssync_jobs = {}
+        register = True
+    else:
+        register = False
+
+    key = (instance._meta.label, instance.pk) if instance is not None else None
+    pending_jobs.setdefault(key, (instance, set()))[1].update(pks)
+
+    # +
+    # The callback is registered after the PKs have been added, as it runs
+    # immediately if there is no active transaction.
+    # -
+    if register:
+        transaction.on_commit(partial(_enqueue_pending_jobs, request))
+
+    return True
+
+
+def check_dnssync_job_lock(instance):
+    """
+    Raise an exception if a DNSsync job assigned to the object is pending or
+    running.
+    """
+    from netbox_dns.jobs import DNSsyncJob
+
+    if instance.pk is None:
+        return
+
+    job = (
+        instance.jobs.filter(
+            name=DNSsyncJob.name,
+            status__in=JobStatusChoices.ENQUEUED_STATE_CHOICES,
+        )
+        .order_by("pk")
+        .first()
+    )
+    if job is None:
+        return
+
+    message = _(
+        "The DNS records related to {object} are being updated by background job "
+        "{job}. Please wait until the job is finished."
+    ).format(object=instance, job=job.pk)
+
+    if current_request.get() is not None:
+        raise AbortRequest(message)
+
+    raise ValidationError(message)
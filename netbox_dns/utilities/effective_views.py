@@ -0,0 +1,215 @@
+from collections import defaultdict
+
+from netaddr import IPNetwork
+
+from django.db import transaction
+from django.db.models import Q
+
+from ipam.models import Prefix
+
+__all__ = (
+    "compute_effective_views",
+    "rebuild_effective_views",
+    "update_effective_views",
+    "verify_effective_views",
+)
+
+# +
+# Updates for more prefixes than this rebuild the whole table, which is
+# cheaper than a query with one condition per prefix.
+# -
+UPDATE_MAX_PREFIXES = 100
+
+
+def _network_key(network, prefixlen):
+    return network.value >> (network.max_prefixlen - prefixlen)
+
+
+class _AssignedPrefixes:
+    """
+    Longest prefix match over the prefixes with views assigned directly,
+    considering only strict parents of a prefix.
+    """
+
+    def __init__(self, assignments):
+        self.view_ids = defaultdict(set)
+        self.levels = defaultdict(lambda: defaultdict(dict))
+
+        for prefix_pk, vrf_id, prefix, view_id in assignments:
+            network = IPNetwork(prefix)
+            self.view_ids[prefix_pk].add(view_id)
+
+            # +
+            # For duplicate prefixes, the views of the prefix with the highest
+            # PK are inherited, as it is the last one in NetBox's ordering.
+            # -
+            level = self.levels[(vrf_id, network.version)][network.prefixlen]
+            key = _network_key(network, network.prefixlen)
+            if level.get(key, 0) < prefix_pk:
+                level[key] = prefix_pk
+
+        self.lengths = {
+            family: sorted(levels.keys(), reverse=True)
+            for family, levels in self.levels.items()
+        }
+
+    def get_view_ids(self, prefix_pk, vrf_id, prefix):
+        if prefix_pk in self.view_ids:
+            return self.view_ids[prefix_pk], False
+
+        network = IPNetwork(prefix)
+        family = (vrf_id, network.version)
+
+        for prefixlen in self.lengths.get(family, ()):
+            if prefixlen >= network.prefixlen:
+                continue
+
+            parent_pk = self.levels[family][prefixlen].get(
+                _network_key(network, prefixlen)
+            )
+            if parent_pk is not None:
+                return self.view_ids[parent_pk], True
+
+        return set(), False
+
+
+def _get_assignments():
+    return (
+        Prefix.netbox_dns_views.through.objects.order_by("prefix_id")
+        .values_list("prefix_id", "prefix__vrf_id", "prefix__prefix", "view_id")
+        .iterator()
+    )
+
+
+def compute_effective_views(prefixes, assignments):
+    """
+    Generate (prefix PK, view PK, inherited) tuples for the effective views of
+    the prefixes given as (PK, VRF PK, prefix) tuples. The direct view
+    assignments are given as (prefix PK, VRF PK, prefix, view PK) tuples.
+    """
+    assigned_prefixes = _AssignedPrefixes(assignments)
+
+    for prefix_pk, vrf_id, prefix in prefixes:
+        view_ids, inherited = assigned_prefixes.get_view_ids(prefix_pk, vrf_id, prefix)
+        for view_id in view_ids:
+            yield prefix_pk, view_id, inherited
+
+
+def _sync_effective_views(prefixes, prefix_pks=None):
+    from netbox_dns.models import EffectiveView
+
+    desired = {
+        (prefix_pk, view_id): inherited
+        for prefix_pk, view_id, inherited in compute_effective_views(
+            prefixes, _get_assignments()
+        )
+    }
+
+    existing = EffectiveView.objects.all()
+    if prefix_pks is not None:
+        existing = existing.filter(prefix_id__in=prefix_pks)
+
+    delete_pks = []
+    for pk, prefix_pk, view_id, inherited in existing.values_list(
+        "pk", "prefix_id", "view_id", "inherited"
+    ).iterator():
+        if desired.get((prefix_pk, view_id)) == inherited:
+            del desired[(prefix_pk, view_id)]
+        else:
+            delete_pks.append(pk)
+
+    with transaction.atomic():
+        EffectiveView.objects.filter(pk__in=delete_pks).delete()
+        EffectiveView.objects.bulk_create(
+            EffectiveView(prefix_id=prefix_pk, view_id=view_id, inherited=inherited)
+            for (prefix_pk, view_id), inherited in desired.items()
+        )
+
+    return {
+        "created": len(desired),
+        "deleted": len(delete_pks),
+    }
+
+
+def rebuild_effective_views():
+    """
+    Recompute the effective views of all prefixes and apply the differences
+    to the table.
+
+    Returns a dictionary with the number of entries created and deleted.
+    """
+    return _sync_effective_views(
+        Prefix.objects.values_list("pk", "vrf_id", "prefix").iterator()
+    )
+
+
+def update_effective_views(prefixes, include_children=True):
+    """
+    Recompute the effective views of the prefixes and, with
+    `include_children`, of all prefixes contained in them, after their view
+    assignments have changed.
+    """
+    prefixes = list(prefixes)
+    if not prefixes:
+        return {"created": 0, "deleted": 0}
+
+    if not include_children:
+        return _sync_effective_views(
+            [(prefix.pk, prefix.vrf_id, prefix.prefix) for prefix in prefixes],
+            prefix_pks=[prefix.pk for prefix in prefixes],
+        )
+
+    if len(prefixes) > UPDATE_MAX_PREFIXES:
+        return rebuild_effective_views()
+
+    query = Q()
+    for prefix in prefixes:
+        query |= Q(vrf=prefix.vrf_id, prefix__net_contained_or_equal=prefix.prefix)
+
+    affected_prefixes = list(
+        Prefix.objects.filter(query).values_list("pk", "vrf_id", "prefix")
+    )
+
+    return _sync_effective_views(
+        affected_prefixes,
+        prefix_pks=[prefix_pk for prefix_pk, vrf_id, prefix in affected_prefixes],
+    )
+
+
+def _get_recursive_view_ids(prefix):
+    if view_ids := set(prefix.netbox_dns_views.values_list("pk", flat=True)):
+        return view_ids, False
+
+    for parent in prefix.get_parents().reverse():
+        if view_ids := set(parent.netbox_dns_views.values_list("pk", flat=True)):
+            return view_ids, True
+
+    return set(), False
+
+
+def verify_effective_views():
+    """
+    Compare the effective views in the table with the views determined
+    recursively from the view assignments of each prefix and its parents.
+
+    Returns a list of (prefix, expected, actual) tuples for the prefixes with
+    differences, where expected and actual are sets of (view PK, inherited)
+    tuples.
+    """
+    from netbox_dns.models import EffectiveView
+
+    actual = defaultdict(set)
+    for prefix_pk, view_id, inherited in EffectiveView.objects.values_list(
+        "prefix_id", "view_id", "inherited"
+    ).iterator():
+        actual[prefix_pk].add((view_id, inherited))
+
+    differences = []
+    for prefix in Prefix.objects.all().iterator():
+        view_ids, inherited = _get_recursive_view_ids(prefix)
+        expected = {(view_id, inherited) for view_id in view_ids}
+
+        if expected != (actual_views := actual.pop(prefix.pk, set())):
+            differences.append((prefix, expected, actual_views))
+
+    return differences
@@ -0,0 +1,388 @@
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.db import models
+
+from ipam.models import IPAddress
+
+from .ipam_dnssync import check_filter
+from .process_cache import ProcessCache
+
+__all__ = (
+    "UnsupportedFilterError",
+    "compile_ip_address_filter",
+    "IPAddressFilterCache",
+    "ip_address_filter_cache",
+)
+
+_FIELD_TYPES = (
+    models.CharField,
+    models.TextField,
+    models.IntegerField,
+    models.BooleanField,
+)
+
+_STRING_LOOKUPS = {
+    "iexact": lambda value, rhs: value.upper() == rhs.upper(),
+    "startswith": lambda value, rhs: value.startswith(rhs),
+    "istartswith": lambda value, rhs: value.upper().startswith(rhs.upper()),
+    "endswith": lambda value, rhs: value.endswith(rhs),
+    "iendswith": lambda value, rhs: value.upper().endswith(rhs.upper()),
+    "contains": lambda value, rhs: rhs in value,
+    "icontains": lambda value, rhs: rhs.upper() in value.upper(),
+}
+
+_LOOKUPS = {"exact", "in", "isnull", *_STRING_LOOKUPS}
+
+# +
+# Lookups on JSON keys that are not evaluated in Python. `contains` on a key
+# transform tests JSON containment rather than substrings.
+# -
+_JSON_UNSUPPORTED_LOOKUPS = {
+    "contains",
+    "contained_by",
+    "has_key",
+    "has_keys",
+    "has_any_keys",
+    "regex",
+    "iregex",
+    "lt",
+    "lte",
+    "gt",
+    "gte",
+    "range",
+}
+
+_TAG_FIELDS = {
+    "pk": "pk",
+    "id": "pk",
+    "name": "name",
+    "slug": "slug",
+}
+
+_MISSING = object()
+
+
+class UnsupportedFilterError(Exception):
+    pass
+
+
+def _split_lookup(parts):
+    if len(parts) > 1 and parts[-1] in _LOOKUPS:
+        return parts[:-1], parts[-1]
+
+    return parts, "exact"
+
+
+def _value_predicate(lookup, rhs, prepare, string_lookups=True):
+    """
+    Return a predicate for a lookup on a field value. `prepare` converts the
+    right hand side to the Python type of the field.
+    """
+    if lookup == "isnull":
+        if not isinstance(rhs, bool):
+            raise UnsupportedFilterError
+
+        return lambda value: (value is None) == rhs
+
+    if rhs is None:
+        if lookup in ("exact", "iexact"):
+            return lambda value: value is None
+
+        raise UnsupportedFilterError
+
+    try:
+        if lookup == "exact":
+            rhs = prepare(rhs)
+            return lambda value: value is not None and value == rhs
+
+        if lookup == "in":
+            if not isinstance(rhs, list):
+                raise UnsupportedFilterError
+
+            rhs = {prepare(item) for item in rhs if item is not None}
+            return lambda value: value is not None and value in rhs
+
+    except (TypeError, ValueError, ValidationError):
+        raise UnsupportedFilterError
+
+    if not string_lookups or not isinstance(rhs, str):
+        raise UnsupportedFilterError
+
+    string_lookup = _STRING_LOOKUPS[lookup]
+    return lambda value: value is not None and string_lookup(value, rhs)
+
+
+def _field_predicate(parts, rhs):
+    field_name, lookup = _split_lookup(parts)
+    if len(field_name) != 1:
+        raise UnsupportedFilterError
+
+    try:
+        if field_name[0] == "pk":
+            field = IPAddress._meta.pk
+        else:
+            field = IPAddress._meta.get_field(field_name[0])
+    except FieldDoesNotExist:
+        raise UnsupportedFilterError
+
+    if field.many_to_one:
+        target_field = field.target_field
+    elif field.concrete and not field.is_relation:
+        target_field = field
+    else:
+        raise UnsupportedFilterError
+
+    if not isinstance(target_field, _FIELD_TYPES):
+        raise UnsupportedFilterError
+
+    predicate = _value_predicate(
+        lookup,
+        rhs,
+        target_field.to_python,
+        string_lookups=isinstance(field, (models.CharField, models.TextField)),
+    )
+    attname = field.attname
+
+    return lambda ip_address: predicate(getattr(ip_address, attname))
+
+
+def _json_equal(value, rhs):
+    if isinstance(value, bool) or isinstance(rhs, bool):
+        return type(value) is type(rhs) and value == rhs
+
+    if isinstance(value, dict) and isinstance(rhs, dict):
+        return value.keys() == rhs.keys() and all(
+            _json_equal(value[key], rhs[key]) for key in value
+        )
+
+    if isinstance(value, list) and isinstance(rhs, list):
+        return len(value) == len(rhs) and all(map(_json_equal, value, rhs))
+
+    if isinstance(value, (dict, list)) or isinstance(rhs, (dict, list)):
+        return False
+
+    return value == rhs
+
+
+def _json_text(value):
+    """
+    Return the text representation of a JSON value as returned by the `->>`
+    operator, which is used for string lookups on JSON keys.
+    """
+    if value is None or isinstance(value, str):
+        return value
+
+    if isinstance(value, bool):
+        return "true" if value else "false"
+
+    if isinstance(value, int):
+        return str(value)
+
+    raise UnsupportedFilterError
+
+
+def _json_path_value(data, keys):
+    for key in keys:
+        try:
+            index = int(key)
+        except ValueError:
+            index = None
+
+        if index is not None:
+            if not isinstance(data, list) or not -len(data) <= index < len(data):
+                return _MISSING
+            data = data[index]
+        elif isinstance(data, dict) and key in data:
+            data = data[key]
+        else:
+            return _MISSING
+
+    return data
+
+
+def _custom_field_predicate(parts, rhs):
+    keys, lookup = _split_lookup(parts)
+    if (
+        not keys
+        or keys[-1] in _LOOKUPS | _JSON_UNSUPPORTED_LOOKUPS
+        or lookup in _JSON_UNSUPPORTED_LOOKUPS
+    ):
+        raise UnsupportedFilterError
+
+    if lookup == "isnull":
+        if not isinstance(rhs, bool):
+            raise UnsupportedFilterError
+
+        def predicate(data):
+            return (_json_path_value(data, keys) is _MISSING) == rhs
+
+    elif lookup == "exact":
+
+        def predicate(data):
+            value = _json_path_value(data, keys)
+            return value is not _MISSING and _json_equal(value, rhs)
+
+    elif lookup == "in":
+        if not isinstance(rhs, list):
+            raise UnsupportedFilterError
+        items = [item for item in rhs if item is not None]
+
+        def predicate(data):
+            value = _json_path_value(data, keys)
+            return value is not _MISSING and any(
+                _json_equal(value, item) for item in items
+            )
+
+    else:
+        if rhs is None:
+            raise UnsupportedFilterError
+        text_predicate = _value_predicate(lookup, rhs, str)
+
+        def predicate(data):
+            value = _json_path_value(data, keys)
+            return value is not _MISSING and text_predicate(_json_text(value))
+
+    return lambda ip_address: predicate(ip_address.custom_field_data or {})
+
+
+def _tag_predicate(conditions):
+    """
+    Return a predicate for the conditions on tags of a filter condition. As
+    with a database query, all conditions must be satisfied by the same tag.
+    """
+    if any(parts and parts[-1] == "isnull" for parts, rhs in conditions):
+        if len(conditions) != 1 or not isinstance(conditions[0][1], bool):
+            raise UnsupportedFilterError
+        rhs = conditions[0][1]
+
+        return lambda ip_address: (not _get_tags(ip_address)) == rhs
+
+    tag_predicates = []
+    for parts, rhs in conditions:
+        if not parts or parts[0] in _LOOKUPS:
+            parts = ["pk", *parts]
+        field_name, lookup = _split_lookup(parts)
+        if len(field_name) != 1 or field_name[0] not in _TAG_FIELDS or rhs is None:
+            raise UnsupportedFilterError
+
+        attribute = _TAG_FIELDS[field_name[0]]
+        tag_predicates.append(
+            (
+                attribute,
+                _value_predicate(
+                    lookup,
+                    rhs,
+                    int if attribute == "pk" else str,
+                    string_lookups=attribute != "pk",
+                ),
+            )
+        )
+
+    return lambda ip_address: any(
+        all(
+            predicate(getattr(tag, attribute))
+            for attribute, predicate in tag_predicates
+        )
+        for tag in _get_tags(ip_address)
+    )
+
+
+def _get_tags(ip_address):
+    if ip_address.pk is None:
+        return ()
+
+    return ip_address.tags.all()
+
+
+def _condition_predicate(condition):
+    if not isinstance(condition, dict):
+        raise UnsupportedFilterError
+
+    predicates = []
+    tag_conditions = []
+    for key, rhs in condition.items():
+        parts = key.split("__")
+
+        if parts[0] == "custom_field_data":
+            predicates.append(_custom_field_predicate(parts[1:], rhs))
+        elif parts[0] == "tags":
+            tag_conditions.append((parts[1:], rhs))
+        else:
+            predicates.append(_field_predicate(parts, rhs))
+
+    if tag_conditions:
+        predicates.append(_tag_predicate(tag_conditions))
+
+    return lambda ip_address: all(predicate(ip_address) for predicate in predicates)
+
+
+def compile_ip_address_filter(ip_address_filter):
+    """
+    Compile an IP address filter into a Python predicate for IP addresses
+    that has the same result as the query built by `get_query_from_filter()`.
+
+    Supported are lookups on the concrete fields and foreign keys of IP
+    addresses, on keys in `custom_field_data` and on the ID, name and slug of
+    tags. If the filter contains other lookups, `UnsupportedFilterError` is
+    raised. The predicate raises `UnsupportedFilterError` as well if a value
+    in `custom_field_data` cannot be compared in Python.
+    """
+    if not isinstance(ip_address_filter, list):
+        ip_address_filter = [ip_address_filter]
+
+    if not all(ip_address_filter):
+        return lambda ip_address: True
+
+    predicates = [_condition_predicate(condition) for condition in ip_address_filter]
+
+    return lambda ip_address: any(predicate(ip_address) for predicate in predicates)
+
+
+def _compile(ip_address_filter):
+    try:
+        return compile_ip_address_filter(ip_address_filter)
+    except UnsupportedFilterError:
+        return None
+
+
+class IPAddressFilterCache(ProcessCache):
+    """
+    Per-process cache of the compiled IP address filters of all views.
+
+    Each entry contains the filter it was compiled from, so views with unsaved
+    filter changes are not checked against a stale predicate. Filters that
+    cannot be compiled are checked using the database.
+    """
+
+    version_key = "netbox_dns:ip_address_filter_cache:version"
+
+    def build(self):
+        from netbox_dns.models import View
+
+        return {
+            pk: (ip_address_filter, _compile(ip_address_filter))
+            for pk, ip_address_filter in View.objects.filter(
+                ip_address_filter__isnull=False
+            ).values_list("pk", "ip_address_filter")
+        }
+
+    def get_predicate(self, view):
+        entry = self.data.get(view.pk)
+        if entry is not None and entry[0] == view.ip_address_filter:
+            return entry[1]
+
+        return _compile(view.ip_address_filter)
+
+    def check(self, ip_address, view):
+        if view.ip_address_filter is None:
+            return True
+
+        if (predicate := self.get_predicate(view)) is not None:
+            try:
+                return predicate(ip_address)
+            except UnsupportedFilterError:
+                pass
+
+        return check_filter(ip_address, view.ip_address_filter)
+
+
+ip_address_filter_cache = IPAddressFilterCache()
@@ -5,15 +5,18 @@ from collections import defaultdict
 from dns import name as dns_name
 
 from django.conf import settings
-from django.db.models import Q
+from django.db.models import Exists, F, Func, IntegerField, OuterRef, Q, Subquery
+from django.db.models.lookups import IsNull
 
 from netbox.context import current_request
 from ipam.models import IPAddress, Prefix
+from ipam.lookups import NetHostContained
 
 from netbox_dns.choices import RecordStatusChoices, RecordTypeChoices
 
-from .dns import get_parent_zone_names
-from .conversions import regex_from_list
+from .dnssync_batch import get_dnssync_batch
+from .prefix_tree import prefix_view_tree
+from .zone_trie import zone_name_trie
 
 __all__ = (
     "get_zones",
@@ -30,17 +33,8 @@ __all__ = (
 )
 
 
-def _get_assigned_views(ip_address):
-    longest_prefix = Prefix.objects.filter(
-        vrf=ip_address.vrf,
-        prefix__net_contains_or_equals=str(ip_address.address.ip),
-        netbox_dns_views__isnull=False,
-    ).last()
-
-    if longest_prefix is None:
-        return []
-
-    return longest_prefix.netbox_dns_views.all()
+def _get_assigned_view_ids(ip_address):
+    return prefix_view_tree.get_view_ids(ip_address.vrf_id, ip_address.address.ip)
 
 
 def _get_record_status(ip_address):
@@ -55,7 +49,7 @@ def _get_record_status(ip_address):
 
 
 def _valid_entry(ip_address, zone):
-    return zone.view in _get_assigned_views(ip_address) and dns_name.from_text(
+    return zone.view_id in _get_assigned_view_ids(ip_address) and dns_name.from_text(
         ip_address.dns_name
     ).is_subdomain(dns_name.from_text(zone.name))
 
@@ -78,33 +72,41 @@ def get_zones(ip_address, view=None, old_zone=None):
     from netbox_dns.models import Zone
 
     if view is None:
-        views = _get_assigned_views(ip_address)
-        if not views:
+        view_ids = _get_assigned_view_ids(ip_address)
+        if not view_ids:
             return []
 
     else:
-        views = [view]
+        view_ids = [view.pk]
 
     min_labels = settings.PLUGINS_CONFIG["netbox_dns"].get(
         "dnssync_minimum_zone_labels", 2
     )
 
-    zones = Zone.objects.filter(
-        view__in=views,
-        name__iregex=regex_from_list(
-            get_parent_zone_names(
-                ip_address.dns_name, min_labels=min_labels, include_self=True
+    zone_pks = [
+        zone_pk
+        for view_id in view_ids
+        if (
+            zone_pk := zone_name_trie.get_closest_zone_pk(
+                view_id,
+                ip_address.dns_name,
+                min_labels=min_labels,
+                active=True,
+                exclude_pk=old_zone.pk if old_zone is not None else None,
             )
-        ),
-        active=True,
-    )
+        )
+        is not None
+    ]
 
     zone_map = defaultdict(list)
 
-    if old_zone is not None:
-        zones = zones.exclude(pk=old_zone.pk)
-        if _valid_entry(ip_address, old_zone):
-            zone_map[old_zone.view].append(old_zone)
+    if old_zone is not None and _valid_entry(ip_address, old_zone):
+        zone_map[old_zone.view].append(old_zone)
+
+    if (batch := get_dnssync_batch()) is not None:
+        zones = batch.get_zones(zone_pks)
+    else:
+        zones = Zone.objects.filter(pk__in=zone_pks).select_related("view")
 
     for zone in zones:
         zone_map[zone.view].append(zone)
@@ -252,15 +254,19 @@ def delete_dns_records(ip_address, view=None):
 
 
 def get_views_by_prefix(prefix):
-    from netbox_dns.models import View
+    from netbox_dns.models import EffectiveView, View
+
+    return View.objects.filter(
+        pk__in=EffectiveView.objects.filter(prefix=prefix).values("view_id")
+    )
+
 
-    if (views := prefix.netbox_dns_views.all()).exists():
-        return views
+def _same_vrf(vrf):
+    return Q(vrf=vrf) | Q(IsNull(vrf, True), vrf__isnull=True)
 
-    if (parent := prefix.get_parents().filter(netbox_dns_views__isnull=False)).exists():
-        return parent.last().netbox_dns_views.all()
 
-    return View.objects.none()
+def _mask_length(prefix):
+    return Func(prefix, function="MASKLEN", output_field=IntegerField())
 
 
 def get_ip_addresses_by_prefix(prefix, check_view=True):
@@ -276,19 +282,18 @@ def get_ip_addresses_by_prefix(prefix, check_view=True):
     if check_view and not get_views_by_prefix(prefix):
         return IPAddress.objects.none()
 
-    queryset = IPAddress.objects.filter(
-        vrf=prefix.vrf, address__net_host_contained=prefix.prefix
+    child_prefixes = Prefix.objects.filter(
+        NetHostContained(OuterRef("address"), F("prefix")),
+        vrf=prefix.vrf,
+        prefix__net_contained=prefix.prefix,
+        netbox_dns_views__isnull=False,
     )
 
-    for exclude_child in (
-        prefix.get_children().filter(netbox_dns_views__isnull=False).distinct()
-    ):
-        queryset = queryset.exclude(
-            vrf=exclude_child.vrf,
-            address__net_host_contained=exclude_child.prefix,
-        )
-
-    return queryset
+    return IPAddress.objects.filter(
+        ~Exists(child_prefixes),
+        vrf=prefix.vrf,
+        address__net_host_contained=prefix.prefix,
+    )
 
 
 def get_ip_addresses_by_view(view):
@@ -299,22 +304,42 @@ def get_ip_addresses_by_view(view):
     Inheritance is defined recursively if the prefix is assigned to the view or
     if it is a child prefix of the prefix that is not assigned to a view directly
     or by inheritance.
+
+    An IP address is in the view if the most specific prefix in its VRF that
+    contains it has the view as one of its effective views. If there are
+    several prefixes with the same length, the one with the highest primary
+    key is used, in the same way as in `PrefixViewTree`.
+
+    The candidate IP addresses are restricted to the addresses contained in a
+    prefix with the view as an effective view, which are taken from the
+    `EffectiveView` table, before the most specific prefix is determined for
+    them using the index on the prefixes. This way the query does neither
+    evaluate the most specific prefix for IP addresses outside the view nor
+    compare all prefixes with each other.
     """
-    queryset = IPAddress.objects.none()
-    for prefix in Prefix.objects.filter(netbox_dns_views__in=[view]):
-        sub_queryset = IPAddress.objects.filter(
-            vrf=prefix.vrf, address__net_host_contained=prefix.prefix
-        )
-        for exclude_child in prefix.get_children().exclude(
-            Q(netbox_dns_views__isnull=True) | Q(netbox_dns_views__in=[view])
-        ):
-            sub_queryset = sub_queryset.exclude(
-                vrf=exclude_child.vrf,
-                address__net_host_contained=exclude_child.prefix,
-            )
-        queryset |= sub_queryset
+    from netbox_dns.models import EffectiveView
 
-    return queryset
+    effective_prefixes = EffectiveView.objects.filter(
+        Q(prefix__vrf=OuterRef("vrf"))
+        | Q(IsNull(OuterRef("vrf"), True), prefix__vrf__isnull=True),
+        NetHostContained(OuterRef("address"), F("prefix__prefix")),
+        view=view,
+    )
+
+    containing_prefixes = Prefix.objects.filter(
+        _same_vrf(OuterRef("vrf")),
+        NetHostContained(OuterRef("address"), F("prefix")),
+    ).order_by(_mask_length(F("prefix")).desc(), "-pk")
+
+    return (
+        IPAddress.objects.filter(Exists(effective_prefixes))
+        .alias(netbox_dns_prefix=Subquery(containing_prefixes.values("pk")[:1]))
+        .filter(
+            netbox_dns_prefix__in=EffectiveView.objects.filter(view=view).values(
+                "prefix"
+            )
+        )
+    )
 
 
 def get_ip_addresses_by_zone(zone):
@@ -0,0 +1,267 @@
+import json
+from collections import defaultdict
+
+from netbox.plugins.utils import get_plugin_config
+
+from .zonefile import get_zone_records
+
+__all__ = (
+    "get_journal_retention",
+    "journal_record_change",
+    "journal_record_changes",
+    "commit_zone_changes",
+    "reset_zone_changes",
+    "get_zone_changes",
+    "generate_zone_transfer",
+)
+
+SOA_SERIAL_WRAP = 2**32
+SOA_SERIAL_HALF = 2**31
+
+
+def get_journal_retention(zone):
+    """
+    Return the number of serials for which the changes to the zone are kept.
+    A value of 0 means that no changes are recorded for the zone.
+    """
+    if zone.journal_retention is not None:
+        return zone.journal_retention
+
+    return get_plugin_config("netbox_dns", "zone_journal_retention", 0)
+
+
+def _journal_entries(zone, old_rr, new_rr, old_zone=None):
+    from netbox_dns.models import ZoneChange
+    from netbox_dns.choices import ZoneChangeActionChoices
+
+    if old_rr == new_rr and old_zone is None:
+        return []
+
+    entries = []
+    if old_rr is not None and get_journal_retention(old_zone or zone):
+        entries.append(
+            ZoneChange(
+                zone=old_zone or zone,
+                action=ZoneChangeActionChoices.ACTION_DELETE,
+                **dict(zip(("name", "ttl", "type", "value"), old_rr)),
+            )
+        )
+    if new_rr is not None and get_journal_retention(zone):
+        entries.append(
+            ZoneChange(
+                zone=zone,
+                action=ZoneChangeActionChoices.ACTION_ADD,
+                **dict(zip(("name", "ttl", "type", "value"), new_rr)),
+            )
+        )
+
+    return entries
+
+
+def journal_record_change(zone, old_rr, new_rr, old_zone=None):
+    """
+    Record the replacement of the resource record `old_rr` by `new_rr` in the
+    journal. Each resource record is a tuple of name, TTL, type and value, or
+    None if there is no such record. `old_zone` is the zone `old_rr` belonged
+    to if it is different from `zone`.
+    """
+    from netbox_dns.models import ZoneChange
+
+    if entries := _journal_entries(zone, old_rr, new_rr, old_zone=old_zone):
+        ZoneChange.objects.bulk_create(entries)
+
+
+def journal_record_changes(changes):
+    """
+    Record a batch of changes in the journal using one query. `changes` is an
+    iterable of (zone, old_rr, new_rr) tuples as for `journal_record_change()`.
+    """
+    from netbox_dns.models import ZoneChange
+
+    entries = []
+    for zone, old_rr, new_rr in changes:
+        entries += _journal_entries(zone, old_rr, new_rr)
+
+    if entries:
+        ZoneChange.objects.bulk_create(entries)
+
+
+def commit_zone_changes(zone, previous_serial, serial):
+    """
+    Assign the pending changes of the zone to the serial published in its SOA
+    record and remove the changes for serials exceeding the retention of the
+    zone.
+
+    If the pending changes include a reset, the changes since the previous
+    serial are incomplete and the complete journal of the zone is removed.
+    """
+    from netbox_dns.models import ZoneChange
+    from netbox_dns.choices import ZoneChangeActionChoices
+
+    changes = ZoneChange.objects.filter(zone=zone)
+
+    if not (retention := get_journal_retention(zone)):
+        changes.delete()
+        return
+    pending_changes = changes.filter(serial__isnull=True)
+
+    if pending_changes.filter(action=ZoneChangeActionChoices.ACTION_RESET).exists():
+        changes.delete()
+        return
+
+    if not pending_changes.update(serial=serial, previous_serial=previous_serial):
+        return
+
+    # +
+    # The retained serials are found by following the previous serials back
+    # from the current serial, using the closest preceding serial in RFC 1982
+    # serial number arithmetic if there are several. Neither the values of
+    # the serials, which wrap around, nor the PKs of the changes, which can be
+    # interleaved between serials if the serials are assigned on commit,
+    # reflect the order of the serials.
+    # -
+    previous_serials = defaultdict(set)
+    for change_previous_serial, change_serial in (
+        changes.filter(serial__isnull=False)
+        .values_list("previous_serial", "serial")
+        .distinct()
+    ):
+        previous_serials[change_serial].add(change_previous_serial)
+
+    retained_serials = set()
+    current_serial = serial
+    while (
+        current_serial in previous_serials
+        and current_serial not in retained_serials
+        and len(retained_serials) < retention
+    ):
+        retained_serials.add(current_serial)
+        current_serial = min(
+            previous_serials[current_serial],
+            key=lambda previous_serial: (current_serial - previous_serial - 1)
+            % SOA_SERIAL_WRAP,
+        )
+
+    if expired_serials := previous_serials.keys() - retained_serials:
+        changes.filter(serial__in=expired_serials).delete()
+
+
+def reset_zone_changes(zone_pks):
+    """
+    Mark the journals of the zones as incomplete. This is used for changes to
+    the records of a zone that are not made through `Record.save()` or
+    `Record.delete()`, e.g. bulk operations.
+    """
+    from netbox_dns.models import Zone, ZoneChange
+    from netbox_dns.choices import ZoneChangeActionChoices
+
+    ZoneChange.objects.bulk_create(
+        ZoneChange(zone=zone, action=ZoneChangeActionChoices.ACTION_RESET)
+        for zone in Zone.objects.filter(pk__in=zone_pks).only("pk", "journal_retention")
+        if get_journal_retention(zone)
+    )
+
+
+def get_zone_changes(zone, serial):
+    """
+    Return the changes to the zone since `serial` as a list of differences
+    between consecutive serials, each consisting of the previous and the new
+    serial and the lists of deleted and added resource records.
+
+    If the journal does not cover all changes since `serial`, None is returned
+    and a full zone transfer is required.
+    """
+    from netbox_dns.models import ZoneChange
+    from netbox_dns.choices import ZoneChangeActionChoices
+
+    if serial == zone.soa_serial:
+        return []
+
+    if not get_journal_retention(zone) or not zone.is_active:
+        return None
+
+    changes = ZoneChange.objects.filter(zone=zone, serial__isnull=False)
+
+    # +
+    # Serials are compared by their distance to the current serial in RFC 1982
+    # serial number arithmetic, as the values wrap around. Serials more than
+    # half the serial number space away are not comparable.
+    # -
+    def distance(change_serial):
+        return (zone.soa_serial - change_serial) % SOA_SERIAL_WRAP
+
+    serial_pairs = list(changes.values_list("previous_serial", "serial").distinct())
+    if not serial_pairs or not 0 < distance(serial) < SOA_SERIAL_HALF:
+        return None
+
+    if distance(serial) > max(
+        (
+            distance(previous_serial)
+            for previous_serial, _ in serial_pairs
+            if distance(previous_serial) < SOA_SERIAL_HALF
+        ),
+        default=0,
+    ):
+        return None
+
+    serials = {
+        change_serial
+        for _, change_serial in serial_pairs
+        if distance(change_serial) < distance(serial)
+    }
+
+    differences = []
+    for change in sorted(
+        changes.filter(serial__in=serials),
+        key=lambda change: (-distance(change.serial), change.pk),
+    ):
+        if not differences or differences[-1]["serial"] != change.serial:
+            differences.append(
+                {
+                    "previous_serial": change.previous_serial,
+                    "serial": change.serial,
+                    "deleted": [],
+                    "added": [],
+                }
+            )
+
+        differences[-1][
+            (
+                "deleted"
+                if change.action == ZoneChangeActionChoices.ACTION_DELETE
+                else "added"
+            )
+        ].append(
+            {
+                "name": change.name,
+                "ttl": change.ttl,
+                "type": change.type,
+                "value": change.value,
+            }
+        )
+
+    return differences
+
+
+def generate_zone_transfer(zone, chunk_size=2000):
+    """
+    Generate the JSON representation of a full transfer of the zone.
+    """
+    header = json.dumps(
+        {
+            "zone": zone.pk,
+            "serial": zone.soa_serial,
+            "default_ttl": zone.default_ttl,
+            "type": "axfr",
+        }
+    )
+    yield f'{header[:-1]}, "records": ['
+
+    separator = ""
+    for name, ttl, record_type, value in get_zone_records(zone, chunk_size=chunk_size):
+        yield separator + json.dumps(
+            {"name": name, "ttl": ttl, "type": record_type, "value": value}
+        )
+        separator = ", "
+
+    yield "]}"
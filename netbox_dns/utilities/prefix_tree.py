@@ -0,0 +1,97 @@
+from collections import defaultdict
+
+from netaddr import IPNetwork
+
+from ipam.models import Prefix
+
+from .process_cache import ProcessCache
+
+__all__ = (
+    "PrefixViewTree",
+    "prefix_view_tree",
+)
+
+
+class PrefixViewTree(ProcessCache):
+    """
+    Per-process longest prefix match structure for prefixes with DNS views
+    assigned to them.
+
+    The tree is keyed by VRF and address family. Instead of a bitwise trie,
+    each prefix length present is a level holding a hash of the network bits,
+    so a lookup takes at most one dictionary access per distinct prefix length.
+    """
+
+    version_key = "netbox_dns:prefix_view_tree:version"
+
+    def __init__(self):
+        super().__init__()
+
+        self.hits = 0
+        self.misses = 0
+
+    def build(self):
+        tree = defaultdict(lambda: defaultdict(dict))
+        prefix_pks = {}
+
+        for prefix_pk, vrf_id, prefix, view_id in (
+            Prefix.netbox_dns_views.through.objects.order_by("prefix_id")
+            .values_list("prefix_id", "prefix__vrf_id", "prefix__prefix", "view_id")
+            .iterator()
+        ):
+            network = IPNetwork(prefix)
+            level = tree[(vrf_id, network.version)][network.prefixlen]
+            key = int(network.network) >> (network.max_prefixlen - network.prefixlen)
+
+            # +
+            # For duplicate prefixes, the views of the prefix with the highest
+            # PK are used.
+            # -
+            if prefix_pks.get((vrf_id, network)) != prefix_pk:
+                level[key] = ()
+                prefix_pks[(vrf_id, network)] = prefix_pk
+
+            level[key] += (view_id,)
+
+        lengths = {
+            family: sorted(levels.keys(), reverse=True)
+            for family, levels in tree.items()
+        }
+
+        return tree, lengths
+
+    def get_view_ids(self, vrf_id, network):
+        """
+        Return the PKs of the views assigned to the longest prefix in the VRF that
+        contains or equals the network, which can be a host address. An empty
+        tuple is returned if there is no such prefix.
+        """
+        network = IPNetwork(network)
+        family = (vrf_id, network.version)
+
+        tree, lengths = self.data
+
+        for prefixlen in lengths.get(family, ()):
+            if prefixlen > network.prefixlen:
+                continue
+
+            view_ids = tree[family][prefixlen].get(
+                int(network.ip) >> (network.max_prefixlen - prefixlen)
+            )
+            if view_ids is not None:
+                self.hits += 1
+                return view_ids
+
+        self.misses += 1
+        return ()
+
+    @property
+    def stats(self):
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "rebuilds": self.rebuilds,
+        }
+
+
+prefix_view_tree = PrefixViewTree()
@@ -0,0 +1,113 @@
+import time
+import weakref
+from uuid import uuid4
+
+from django.core.cache import cache
+from django.core.signals import request_started
+from django.db import connection, transaction
+
+__all__ = ("ProcessCache",)
+
+
+class ProcessCache:
+    """
+    Base class for lazily built per-process data structures derived from the
+    database.
+
+    The data is built on first access and rebuilt after it has been
+    invalidated. A version key in the Django cache is changed whenever an
+    invalidation or change is committed, so other processes rebuild their copy
+    when they check the version. The version is checked on the first access
+    in each request and at most once every `version_check_interval` seconds
+    otherwise, so lookups do not cost a cache round trip each.
+
+    Changes inside a transaction that is rolled back are detected as well.
+    Django discards the pending on_commit callback with the transaction, and
+    as only a weak reference to it is kept, that reference is gone afterwards.
+
+    Subclasses set `version_key` and implement `build()`.
+    """
+
+    version_key = None
+    version_check_interval = 1.0
+
+    _instances = weakref.WeakSet()
+
+    def __init__(self):
+        self._data = None
+        self._version = None
+        self._checked = None
+        self._pending = None
+
+        self.rebuilds = 0
+
+        self._instances.add(self)
+
+    def build(self):
+        raise NotImplementedError
+
+    def invalidate(self):
+        self._data = None
+        self.changed()
+
+    def changed(self):
+        """
+        Propagate a change to other processes when the current transaction is
+        committed. Subclasses patching their local data in place call this
+        method instead of `invalidate()`.
+        """
+
+        def commit_version():
+            self._pending = None
+
+            cache.set(self.version_key, uuid4().hex, timeout=None)
+
+        if connection.in_atomic_block:
+            self._pending = weakref.ref(commit_version)
+
+        transaction.on_commit(commit_version)
+
+    def expire_version(self):
+        """
+        Check the version on the next access regardless of the interval.
+        """
+        self._checked = None
+
+    @classmethod
+    def expire_versions(cls, **kwargs):
+        for instance in list(cls._instances):
+            instance.expire_version()
+
+    def _rolled_back(self):
+        return self._pending is not None and self._pending() is None
+
+    @property
+    def data(self):
+        if self._rolled_back():
+            self._pending = None
+            self._data = None
+
+        now = time.monotonic()
+        if (
+            self._data is None
+            or self._checked is None
+            or now - self._checked >= self.version_check_interval
+        ):
+            version = cache.get(self.version_key)
+            self._checked = now
+
+            if self._data is None or version != self._version:
+                self._data = self.build()
+                self._version = version
+                self.rebuilds += 1
+
+        return self._data
+
+    @property
+    def is_loaded(self):
+        return self._data is not None
+
+
+request_started.connect(
+    ProcessCache.expire_versions, dispatch_uid="netbox_dns_process_cache"
+)
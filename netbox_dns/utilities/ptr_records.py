@@ -0,0 +1,369 @@
+import ipaddress
+from collections import defaultdict
+
+import netaddr
+from dns import name as dns_name
+
+from django.db.models import Count, Q, QuerySet
+from django.utils import timezone
+
+from netbox.search.backends import search_backend
+
+from .journal import reset_zone_changes
+
+__all__ = (
+    "PTRZoneMap",
+    "update_ptr_records",
+)
+
+PTR_UPDATE_FIELDS = (
+    "zone",
+    "name",
+    "fqdn",
+    "value",
+    "ttl",
+    "managed",
+    "ip_address",
+    "rfc2317_cname_record",
+    "last_updated",
+)
+
+
+class PTRZoneMap:
+    """
+    Longest prefix match of IP addresses to the reverse zones of a set of
+    views.
+
+    As with `Record.ptr_zone`, RFC2317 zones take precedence over regular
+    reverse zones for IPv4 addresses. Each prefix length present is a level
+    holding a hash of the network bits, so a lookup takes at most one
+    dictionary access per distinct prefix length.
+    """
+
+    def __init__(self, view_ids):
+        from netbox_dns.models import Zone
+
+        self._levels = defaultdict(dict)
+
+        for zone in Zone.objects.filter(
+            Q(arpa_network__isnull=False) | Q(rfc2317_prefix__isnull=False),
+            view_id__in=view_ids,
+        ).select_related("rfc2317_parent_zone"):
+            if zone.rfc2317_prefix is not None:
+                self._add(
+                    zone.view_id, True, netaddr.IPNetwork(zone.rfc2317_prefix), zone
+                )
+            if zone.arpa_network is not None:
+                self._add(
+                    zone.view_id, False, netaddr.IPNetwork(zone.arpa_network), zone
+                )
+
+        self._lengths = {
+            key: sorted(
+                {prefixlen for prefixlen, network in level.keys()}, reverse=True
+            )
+            for key, level in self._levels.items()
+        }
+
+    def _add(self, view_id, rfc2317, network, zone):
+        # +
+        # Only zones strictly containing an address are considered, so networks
+        # consisting of a single address are ignored.
+        # -
+        if network.prefixlen == network.max_prefixlen:
+            return
+
+        self._levels[(view_id, rfc2317, network.version)][
+            (
+                network.prefixlen,
+                int(network.network) >> (network.max_prefixlen - network.prefixlen),
+            )
+        ] = zone
+
+    def _lookup(self, view_id, rfc2317, address):
+        level = self._levels.get((view_id, rfc2317, address.version))
+        if level is None:
+            return None
+
+        max_prefixlen = 32 if address.version == 4 else 128
+        for prefixlen in self._lengths[(view_id, rfc2317, address.version)]:
+            zone = level.get((prefixlen, int(address) >> (max_prefixlen - prefixlen)))
+            if zone is not None:
+                return zone
+
+        return None
+
+    def get_ptr_zone(self, view_id, address):
+        """
+        Return the reverse zone for the address in the view, or None if there
+        is no such zone.
+        """
+        address = netaddr.IPAddress(address)
+
+        if address.version == 4:
+            if (zone := self._lookup(view_id, True, address)) is not None:
+                return zone
+
+        return self._lookup(view_id, False, address)
+
+
+def _ptr_name(address_record, ptr_zone):
+    if ptr_zone.is_rfc2317_zone:
+        return address_record.rfc2317_ptr_name
+
+    return (
+        dns_name.from_text(ipaddress.ip_address(address_record.value).reverse_pointer)
+        .relativize(dns_name.from_text(ptr_zone.name))
+        .to_text()
+    )
+
+
+def _ptr_key(ptr_record):
+    return (ptr_record.zone_id, ptr_record.name, ptr_record.value)
+
+
+def update_ptr_records(address_records, update_rfc2317_cname=True):
+    """
+    Reconcile the PTR records for a batch of A and AAAA records.
+
+    This is the batch equivalent of calling `update_ptr_record()` and
+    `refresh_ptr_record()` for each of the address records and saving their
+    `ptr_record` field. The PTR zones are determined in memory, all existing
+    PTR records that are candidates for reuse are fetched with one query, and
+    the resulting changes are written using bulk operations.
+
+    PTR records that are created or changed are validated with `full_clean()`,
+    so validation errors are raised as with individual saves. RFC2317 CNAME
+    records are maintained for the PTR records in RFC2317 zones unless
+    `update_rfc2317_cname` is False.
+
+    Returns the set of PKs of zones whose data changed, so the caller can
+    update their SOA serials.
+    """
+    from netbox_dns.models import Record
+    from netbox_dns.choices import RecordTypeChoices
+
+    if isinstance(address_records, QuerySet):
+        address_records = address_records.select_related(
+            "zone",
+            "ptr_record",
+            "ptr_record__zone",
+            "ptr_record__rfc2317_cname_record",
+        )
+
+    address_records = [record for record in address_records if record.is_address_record]
+    if not address_records:
+        return set()
+
+    zone_map = PTRZoneMap({record.zone.view_id for record in address_records})
+
+    # +
+    # Determine the target PTR zone, name and value for each address record.
+    # -
+    targets = {}
+    for record in address_records:
+        ptr_zone = zone_map.get_ptr_zone(record.zone.view_id, record.value)
+
+        if (
+            ptr_zone is None
+            or record.disable_ptr
+            or not record.is_active
+            or record.name.startswith("*")
+        ):
+            targets[record.pk] = None
+        else:
+            targets[record.pk] = (ptr_zone, _ptr_name(record, ptr_zone), record.fqdn)
+
+    # +
+    # Fetch all PTR records matching any of the targets and count the address
+    # records using each of the current PTR records.
+    # -
+    existing_ptr_records = {}
+    target_values = [target for target in targets.values() if target is not None]
+    if target_values:
+        for ptr_record in Record.objects.filter(
+            type=RecordTypeChoices.PTR,
+            zone__in={target[0] for target in target_values},
+            name__in={target[1] for target in target_values},
+            value__in={target[2] for target in target_values},
+        ).select_related("zone", "rfc2317_cname_record"):
+            existing_ptr_records.setdefault(_ptr_key(ptr_record), ptr_record)
+
+    ptr_usage = defaultdict(int)
+    ptr_usage.update(
+        (entry["ptr_record"], entry["count"])
+        for entry in Record.raw_objects.filter(
+            ptr_record__in={
+                record.ptr_record_id
+                for record in address_records
+                if record.ptr_record_id is not None
+            }
+        )
+        .values("ptr_record")
+        .annotate(count=Count("pk"))
+    )
+
+    now = timezone.now()
+
+    new_ptr_records = {}
+    modified_ptr_records = {}
+    update_address_records = []
+    cleanup_ptr_records = {}
+    delete_cname_records = {}
+    dirty_zone_pks = set()
+
+    for record in address_records:
+        target = targets[record.pk]
+        ptr_record = record.ptr_record
+
+        if target is None:
+            if ptr_record is not None:
+                cleanup_ptr_records[ptr_record.pk] = ptr_record
+                ptr_usage[ptr_record.pk] -= 1
+                record.ptr_record = None
+                update_address_records.append(record)
+            continue
+
+        ptr_zone, ptr_name, ptr_value = target
+        key = (ptr_zone.pk, ptr_name, ptr_value)
+
+        if ptr_record is not None and _ptr_key(ptr_record) == key:
+            if ptr_record.ttl != record.ttl and ptr_usage[ptr_record.pk] == 1:
+                ptr_record.ttl = record.ttl
+                ptr_record.last_updated = now
+                modified_ptr_records[ptr_record.pk] = ptr_record
+                dirty_zone_pks.add(ptr_record.zone_id)
+            continue
+
+        if (target_ptr_record := existing_ptr_records.get(key)) is None:
+            target_ptr_record = new_ptr_records.get(key)
+
+        if target_ptr_record is None and ptr_record is not None:
+            # +
+            # If the current PTR record is used exclusively by the address
+            # record it can be modified to match the new target.
+            # -
+            if ptr_usage[ptr_record.pk] == 1:
+                if ptr_record.rfc2317_cname_record is not None and (
+                    ptr_record.zone_id != ptr_zone.pk or not ptr_zone.is_rfc2317_zone
+                ):
+                    cname_record = ptr_record.rfc2317_cname_record
+                    delete_cname_records[cname_record.pk] = cname_record
+                    ptr_record.rfc2317_cname_record = None
+
+                existing_ptr_records.pop(_ptr_key(ptr_record), None)
+                dirty_zone_pks.update((ptr_record.zone_id, ptr_zone.pk))
+
+                ptr_record.zone = ptr_zone
+                ptr_record.name = ptr_name
+                ptr_record.value = ptr_value
+                ptr_record.ttl = record.ttl
+                ptr_record.managed = True
+                ptr_record.ip_address = netaddr.IPAddress(record.value)
+                ptr_record.last_updated = now
+                ptr_record.full_clean()
+
+                existing_ptr_records[key] = ptr_record
+                modified_ptr_records[ptr_record.pk] = ptr_record
+                continue
+
+        if target_ptr_record is None:
+            target_ptr_record = Record(
+                zone=ptr_zone,
+                type=RecordTypeChoices.PTR,
+                name=ptr_name,
+                ttl=record.ttl,
+                value=ptr_value,
+                managed=True,
+                ip_address=netaddr.IPAddress(record.value),
+            )
+            target_ptr_record.full_clean()
+
+            new_ptr_records[key] = target_ptr_record
+            dirty_zone_pks.add(ptr_zone.pk)
+
+        if ptr_record is not None:
+            cleanup_ptr_records[ptr_record.pk] = ptr_record
+            ptr_usage[ptr_record.pk] -= 1
+
+        if target_ptr_record.pk is not None:
+            ptr_usage[target_ptr_record.pk] += 1
+
+        record.ptr_record = target_ptr_record
+        update_address_records.append(record)
+
+    for cname_record in delete_cname_records.values():
+        dirty_zone_pks.add(cname_record.zone_id)
+        cname_record.delete(save_zone_serial=False)
+
+    if modified_ptr_records:
+        Record.objects.bulk_update(
+            modified_ptr_records.values(), fields=PTR_UPDATE_FIELDS
+        )
+    if new_ptr_records:
+        Record.objects.bulk_create(new_ptr_records.values())
+
+    if update_address_records:
+        Record.objects.bulk_update(update_address_records, fields=("ptr_record",))
+
+    # +
+    # Remove PTR records that are no longer in use and maintain the RFC2317
+    # CNAME records of the ones still in use.
+    # -
+    used_ptr_pks = set(
+        Record.objects.filter(
+            ptr_record__in=list(cleanup_ptr_records.keys())
+        ).values_list("ptr_record", flat=True)
+    )
+    delete_ptr_records = []
+    cname_ptr_records = []
+    for ptr_record in cleanup_ptr_records.values():
+        if ptr_record.pk in modified_ptr_records:
+            continue
+
+        if ptr_record.pk not in used_ptr_pks:
+            if ptr_record.rfc2317_cname_record is not None:
+                dirty_zone_pks.add(ptr_record.rfc2317_cname_record.zone_id)
+                ptr_record.remove_from_rfc2317_cname_record(save_zone_serial=False)
+            delete_ptr_records.append(ptr_record)
+            dirty_zone_pks.add(ptr_record.zone_id)
+        elif update_rfc2317_cname and ptr_record.zone.is_rfc2317_zone:
+            cname_record_pk = ptr_record.rfc2317_cname_record_id
+            ptr_record.update_rfc2317_cname_record(save_zone_serial=False)
+
+            if ptr_record.rfc2317_cname_record_id != cname_record_pk:
+                cname_ptr_records.append(ptr_record)
+            dirty_zone_pks.add(ptr_record.zone_id)
+
+    if delete_ptr_records:
+        Record.objects.filter(
+            pk__in=[record.pk for record in delete_ptr_records]
+        ).delete()
+
+    changed_ptr_records = [
+        *modified_ptr_records.values(),
+        *new_ptr_records.values(),
+    ]
+
+    if update_rfc2317_cname:
+        for ptr_record in changed_ptr_records:
+            if not ptr_record.zone.is_rfc2317_zone:
+                continue
+
+            cname_record_pk = ptr_record.rfc2317_cname_record_id
+            ptr_record.update_rfc2317_cname_record(save_zone_serial=False)
+
+            if ptr_record.rfc2317_cname_record_id != cname_record_pk:
+                cname_ptr_records.append(ptr_record)
+            if ptr_record.rfc2317_cname_record is not None:
+                dirty_zone_pks.add(ptr_record.rfc2317_cname_record.zone_id)
+
+    if cname_ptr_records:
+        Record.objects.bulk_update(cname_ptr_records, fields=("rfc2317_cname_record",))
+
+    if changed_ptr_records:
+        search_backend.cache(changed_ptr_records)
+
+    reset_zone_changes(dirty_zone_pks)
+
+    return dirty_zone_pks
@@ -0,0 +1,60 @@
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+
+__all__ = (
+    "RECORD_EXPORT_FIELDS",
+    "generate_record_export",
+)
+
+# +
+# Field names in the export and the corresponding model fields. Related
+# objects are represented by their PKs.
+# -
+RECORD_EXPORT_FIELDS = (
+    ("id", "pk"),
+    ("view", "zone__view_id"),
+    ("zone", "zone_id"),
+    ("name", "name"),
+    ("fqdn", "fqdn"),
+    ("type", "type"),
+    ("value", "value"),
+    ("ttl", "ttl"),
+    ("status", "status"),
+    ("active", "active"),
+    ("managed", "managed"),
+    ("disable_ptr", "disable_ptr"),
+    ("ptr_record", "ptr_record_id"),
+    ("rfc2317_cname_record", "rfc2317_cname_record_id"),
+    ("ipam_ip_address", "ipam_ip_address_id"),
+    ("tenant", "tenant_id"),
+    ("description", "description"),
+    ("custom_fields", "custom_field_data"),
+    ("created", "created"),
+    ("last_updated", "last_updated"),
+)
+
+
+def generate_record_export(queryset, after=None, chunk_size=2000):
+    """
+    Generate the records in `queryset` as newline-delimited JSON, one flat
+    object per record, ordered by PK.
+
+    The records are read using a server-side cursor in chunks of `chunk_size`
+    rows, so memory usage does not depend on the number of records. If
+    `after` is specified, only records with a PK greater than `after` are
+    exported, which allows resuming an interrupted export.
+    """
+    if after is not None:
+        queryset = queryset.filter(pk__gt=after)
+
+    keys = [key for key, field in RECORD_EXPORT_FIELDS]
+    rows = (
+        queryset.prefetch_related(None)
+        .order_by("pk")
+        .values_list(*(field for key, field in RECORD_EXPORT_FIELDS))
+        .iterator(chunk_size=chunk_size)
+    )
+
+    for row in rows:
+        yield json.dumps(dict(zip(keys, row)), cls=DjangoJSONEncoder) + "\n"
@@ -0,0 +1,74 @@
+from dns import name as dns_name
+from dns.exception import DNSException
+from netaddr import AddrFormatError, IPAddress
+
+from django.core.exceptions import ValidationError
+from django.db.models import F
+from django.utils.translation import gettext as _
+
+__all__ = ("lookup_records",)
+
+RECORD_LOOKUP_FIELDS = (
+    ("id", "pk"),
+    ("view", "zone__view_id"),
+    ("zone", "zone_id"),
+    ("fqdn", "fqdn"),
+    ("type", "type"),
+    ("value", "value"),
+    ("ttl", "ttl"),
+    ("status", "status"),
+)
+
+
+def _group_records(queryset, key_field, keys):
+    from netbox_dns.fields import ArrayAny
+
+    results = {key: [] for key in keys}
+    if not keys:
+        return results
+
+    field_names = [name for name, field in RECORD_LOOKUP_FIELDS]
+    for key, *row in (
+        queryset.filter(ArrayAny(F(key_field), keys))
+        .order_by("pk")
+        .values_list(key_field, *(field for name, field in RECORD_LOOKUP_FIELDS))
+    ):
+        results[str(key)].append(dict(zip(field_names, row)))
+
+    return results
+
+
+def lookup_records(queryset, fqdns=(), ip_addresses=(), view=None):
+    """
+    Look up the records in `queryset` for lists of FQDNs and IP addresses,
+    optionally restricted to the zones in a view.
+
+    Each list is matched using one query with the list passed as an array.
+    Returns a dictionary with the normalised FQDNs and IP addresses mapped to
+    lists of records, each of which is a flat dictionary with related objects
+    represented by their PKs. FQDNs and IP addresses without records are
+    mapped to empty lists.
+    """
+    try:
+        fqdns = list(
+            dict.fromkeys(dns_name.from_text(fqdn).to_text() for fqdn in fqdns)
+        )
+    except DNSException as exc:
+        raise ValidationError({"fqdns": _("Invalid FQDN: {error}").format(error=exc)})
+
+    try:
+        ip_addresses = list(
+            dict.fromkeys(str(IPAddress(ip_address)) for ip_address in ip_addresses)
+        )
+    except (AddrFormatError, TypeError, ValueError) as exc:
+        raise ValidationError(
+            {"ip_addresses": _("Invalid IP address: {error}").format(error=exc)}
+        )
+
+    if view is not None:
+        queryset = queryset.filter(zone__view=view)
+
+    return {
+        "fqdns": _group_records(queryset, "fqdn", fqdns),
+        "ip_addresses": _group_records(queryset, "ip_address", ip_addresses),
+    }
@@ -0,0 +1,539 @@
+from collections import defaultdict
+
+import netaddr
+
+from django.core.exceptions import PermissionDenied, ValidationError
+from django.db import transaction
+from django.db.models import prefetch_related_objects
+from django.utils import timezone
+from django.utils.translation import gettext as _
+
+from netbox.context import current_request
+from netbox.plugins.utils import get_plugin_config
+from netbox.search.backends import search_backend
+
+from .journal import journal_record_changes
+from .ptr_records import PTRZoneMap, update_ptr_records
+from .serials import deferred_serials, update_serials
+
+__all__ = (
+    "RECORD_UPSERT_FIELDS",
+    "check_record_permissions",
+    "upsert_records",
+)
+
+RECORD_UPSERT_FIELDS = (
+    "ttl",
+    "status",
+    "disable_ptr",
+    "description",
+    "tenant",
+)
+
+UPSERT_UPDATE_FIELDS = (
+    "ttl",
+    "status",
+    "disable_ptr",
+    "description",
+    "tenant",
+    "last_updated",
+)
+
+
+def _error_dict(exc):
+    if hasattr(exc, "error_dict"):
+        return exc.message_dict
+
+    return {"__all__": exc.messages}
+
+
+def check_record_permissions(user, pks, action):
+    """
+    Raise PermissionDenied unless the user has the permission for `action` on
+    all records with the PKs given, including the object-level constraints.
+    """
+    from netbox_dns.models import Record
+
+    if pks and Record.objects.restrict(user, action).filter(pk__in=pks).count() != len(
+        pks
+    ):
+        raise PermissionDenied(
+            _("Insufficient permissions to {action} the records").format(action=action)
+        )
+
+
+def _check_permissions(user, created, updated):
+    if created and not user.has_perm("netbox_dns.add_record"):
+        raise PermissionDenied(_("Insufficient permissions to add records"))
+    if updated and not user.has_perm("netbox_dns.change_record"):
+        raise PermissionDenied(_("Insufficient permissions to change records"))
+
+    check_record_permissions(user, {record.pk for record in updated}, "change")
+
+
+def _log_record_changes(created, updated):
+    """
+    Create the change log entries for records written using bulk operations,
+    which do not send the signals NetBox uses to record changes. As for other
+    changes, entries are only created within a request.
+    """
+    from core.choices import ObjectChangeActionChoices
+    from core.models import ObjectChange
+
+    if (request := current_request.get()) is None:
+        return
+
+    prefetch_related_objects([*created, *updated], "tags")
+
+    object_changes = []
+    for action, records in (
+        (ObjectChangeActionChoices.ACTION_CREATE, created),
+        (ObjectChangeActionChoices.ACTION_UPDATE, updated),
+    ):
+        for record in records:
+            object_change = record.to_objectchange(action)
+            object_change.user = request.user
+            object_change.user_name = request.user.username
+            object_change.request_id = request.id
+            object_changes.append(object_change)
+
+    ObjectChange.objects.bulk_create(object_changes, batch_size=1000)
+
+
+class _ConflictIndex:
+    """
+    In-memory equivalent of `Record.check_conflicting_records()` and
+    `Record.check_unique_rrset_ttl()` for the active records of a set of
+    zones, which is kept up to date while records are created and updated.
+    """
+
+    def __init__(self):
+        self._types = defaultdict(dict)
+        self._ttls = defaultdict(dict)
+
+    def add(self, key, zone_id, name, record_type, ttl):
+        self._types[(zone_id, name)][key] = record_type
+        self._ttls[(zone_id, name, record_type)][key] = ttl
+
+    def remove(self, key, zone_id, name, record_type):
+        self._types[(zone_id, name)].pop(key, None)
+        self._ttls[(zone_id, name, record_type)].pop(key, None)
+
+    def check_conflicts(self, key, record):
+        from netbox_dns.choices import RecordTypeChoices
+
+        types = {
+            record_type
+            for other_key, record_type in self._types[
+                (record.zone_id, record.name)
+            ].items()
+            if other_key != key
+        }
+
+        if record.type == RecordTypeChoices.CNAME:
+            if types - {RecordTypeChoices.NSEC}:
+                raise ValidationError(
+                    {
+                        "type": _(
+                            "There is already an active record for name {name} in zone {zone}, CNAME is not allowed."
+                        ).format(name=record.name, zone=record.zone)
+                    }
+                )
+
+        elif RecordTypeChoices.CNAME in types and record.type != RecordTypeChoices.NSEC:
+            raise ValidationError(
+                {
+                    "type": _(
+                        "There is already an active CNAME record for name {name} in zone {zone}, no other record allowed."
+                    ).format(name=record.name, zone=record.zone)
+                }
+            )
+
+        elif record.type in RecordTypeChoices.SINGLETONS and record.type in types:
+            raise ValidationError(
+                {
+                    "type": _(
+                        "There is already an active {type} record for name {name} in zone {zone}, more than one are not allowed."
+                    ).format(type=record.type, name=record.name, zone=record.zone)
+                }
+            )
+
+    def check_rrset_ttl(self, key, record):
+        conflicting_ttls = {
+            ttl
+            for other_key, ttl in self._ttls[
+                (record.zone_id, record.name, record.type)
+            ].items()
+            if other_key != key and ttl != record.ttl
+        }
+        if not conflicting_ttls:
+            return
+
+        if len(conflicting_ttls) == 1 and record.ttl is None:
+            record.ttl = conflicting_ttls.pop()
+            return
+
+        raise ValidationError(
+            {
+                "ttl": _(
+                    "There is at least one active {type} record for name {name} in zone {zone} and TTL is different ({ttls})."
+                ).format(
+                    type=record.type,
+                    name=record.name,
+                    zone=record.zone,
+                    ttls=", ".join(str(ttl) for ttl in conflicting_ttls),
+                )
+            }
+        )
+
+
+def upsert_records(specs, user=None):
+    """
+    Create or update records identified by their zone, name, type and value.
+
+    `specs` is a list of dictionaries containing the PK of the zone, the
+    name, type and value of the record and optionally the fields listed in
+    `RECORD_UPSERT_FIELDS`, with the tenant given as a PK. If a record with
+    the same zone, name, type and value exists, the fields present in the
+    specification are updated, otherwise a new record is created.
+
+    All existing records of the zones involved are fetched once, the records
+    are validated in memory against each other and against the existing
+    records, and the changes are written using bulk operations. The SOA
+    serial of each zone changed is updated once. Records whose validation
+    or PTR handling involves RFC2317 zones, and TTL changes that must be
+    propagated to the RRset with `enforce_unique_rrset_ttl`, are saved
+    individually.
+
+    If `user` is given, the permissions of the user to add and change the
+    records are checked before anything is written, including the
+    object-level constraints for the existing records. Constraints can only
+    be evaluated against records in the database, so they are checked again
+    for all records written, and the changes are rolled back if they are
+    violated. PermissionDenied is raised if a permission is missing.
+
+    A specification matching more than one existing record is rejected, as
+    the record to update cannot be determined.
+
+    Returns a list containing a dictionary for each specification with the
+    `status` ("created", "updated", "unchanged" or "error"), the `id` of the
+    record and, for errors, the validation `errors`.
+    """
+    from tenancy.models import Tenant
+
+    from netbox_dns.models import Record, Zone
+    from netbox_dns.choices import RecordTypeChoices
+
+    zones = {
+        zone.pk: zone
+        for zone in Zone.objects.filter(
+            pk__in={spec["zone"] for spec in specs}
+        ).select_related("view", "rfc2317_parent_zone")
+    }
+    tenants = {
+        tenant.pk: tenant
+        for tenant in Tenant.objects.filter(
+            pk__in={spec["tenant"] for spec in specs if spec.get("tenant") is not None}
+        )
+    }
+    enforce_unique_rrset_ttl = get_plugin_config(
+        "netbox_dns", "enforce_unique_rrset_ttl", False
+    )
+    record_active_status = get_plugin_config("netbox_dns", "record_active_status")
+
+    # +
+    # Related objects are resolved in bulk above, so the foreign keys are not
+    # validated individually.
+    # -
+    exclude_fields = [field.name for field in Record._meta.fields if field.is_relation]
+
+    results = [{"status": None, "id": None} for spec in specs]
+
+    def set_error(index, exc):
+        results[index] = {"status": "error", "id": None, "errors": _error_dict(exc)}
+
+    # +
+    # Build and validate the records from the specifications. This also
+    # normalizes names and values, so they can be matched with the existing
+    # records.
+    # -
+    records = {}
+    for index, spec in enumerate(specs):
+        try:
+            if (zone := zones.get(spec["zone"])) is None:
+                raise ValidationError(
+                    {"zone": _("Zone {zone} not found").format(zone=spec["zone"])}
+                )
+
+            record = Record(
+                zone=zone,
+                name=spec["name"],
+                type=spec["type"],
+                value=spec["value"],
+            )
+            for field in RECORD_UPSERT_FIELDS:
+                if field not in spec:
+                    continue
+
+                if field == "tenant" and spec["tenant"] is not None:
+                    if (tenant := tenants.get(spec["tenant"])) is None:
+                        raise ValidationError(
+                            {
+                                "tenant": _("Tenant {tenant} not found").format(
+                                    tenant=spec["tenant"]
+                                )
+                            }
+                        )
+                    record.tenant = tenant
+                else:
+                    setattr(record, field, spec[field])
+
+            record.clean_fields(exclude=exclude_fields)
+            record.validate_name()
+            record.validate_value()
+
+            if record.type == RecordTypeChoices.SOA:
+                raise ValidationError(
+                    {"type": _("SOA records are created automatically by NetBox DNS")}
+                )
+
+            if not record.is_address_record:
+                record.disable_ptr = False
+
+        except ValidationError as exc:
+            set_error(index, exc)
+            continue
+
+        records[index] = record
+
+    # +
+    # Fetch the existing records of all zones involved once and build the
+    # indexes for matching and conflict checks.
+    # -
+    existing_pks = defaultdict(list)
+    conflict_index = _ConflictIndex()
+    for pk, zone_id, name, record_type, value, status, ttl in Record.objects.filter(
+        zone__in=zones.values()
+    ).values_list("pk", "zone_id", "name", "type", "value", "status", "ttl"):
+        existing_pks[(zone_id, name.lower(), record_type, value)].append(pk)
+
+        if zones[zone_id].is_active and status in record_active_status:
+            conflict_index.add(pk, zone_id, name, record_type, ttl)
+
+    keys = {
+        index: (record.zone_id, record.name.lower(), record.type, record.value)
+        for index, record in records.items()
+    }
+    existing_records = {
+        record.pk: record
+        for record in Record.objects.filter(
+            pk__in={
+                existing_pks[key][0]
+                for key in keys.values()
+                if len(existing_pks.get(key, ())) == 1
+            }
+        )
+        .select_related(
+            "zone",
+            "zone__view",
+            "ptr_record",
+            "ptr_record__zone",
+            "ptr_record__rfc2317_cname_record",
+        )
+        .prefetch_related("tags")
+    }
+
+    ptr_zone_map = None
+    if any(record.type == RecordTypeChoices.A for record in records.values()):
+        ptr_zone_map = PTRZoneMap({zone.view_id for zone in zones.values()})
+
+    def requires_save(record):
+        if record.is_ptr_record:
+            return record.zone.is_rfc2317_zone
+
+        if record.type == RecordTypeChoices.A and not record.disable_ptr:
+            ptr_zone = ptr_zone_map.get_ptr_zone(record.zone.view_id, record.value)
+            return (
+                ptr_zone is not None
+                and ptr_zone.is_rfc2317_zone
+                and ptr_zone.rfc2317_parent_managed
+            )
+
+        return False
+
+    # +
+    # Match the records with the existing records and check them for conflicts
+    # in the order of the specifications.
+    # -
+    create_records = {}
+    update_records = {}
+    save_records = {}
+    journal_changes = []
+    seen_keys = set()
+
+    for index, record in records.items():
+        key = keys[index]
+
+        try:
+            if key in seen_keys:
+                raise ValidationError(
+                    _("Duplicate record {name} {type} {value} in request").format(
+                        name=record.name, type=record.type, value=record.value
+                    )
+                )
+            seen_keys.add(key)
+
+            if len(pks := existing_pks.get(key, ())) > 1:
+                raise ValidationError(
+                    _(
+                        "There are {count} records {name} {type} {value} in zone {zone}, cannot determine the record to update"
+                    ).format(
+                        count=len(pks),
+                        name=record.name,
+                        type=record.type,
+                        value=record.value,
+                        zone=record.zone,
+                    )
+                )
+
+            if pks:
+                target = existing_records[pks[0]]
+
+                if target.managed or target.ipam_ip_address_id is not None:
+                    raise ValidationError(
+                        _("{record} is managed, refusing update").format(record=target)
+                    )
+
+                saved_rr = target.get_journal_rr(saved=True)
+                target.snapshot()
+                for field in RECORD_UPSERT_FIELDS:
+                    if field in specs[index]:
+                        setattr(target, field, getattr(record, field))
+                if not target.is_address_record:
+                    target.disable_ptr = False
+
+                if not (changed_fields := target.changed_fields):
+                    results[index] = {"status": "unchanged", "id": target.pk}
+                    continue
+
+                if requires_save(target) or (
+                    enforce_unique_rrset_ttl and "ttl" in changed_fields
+                ):
+                    save_records[index] = target
+                    continue
+
+                if target.is_active:
+                    conflict_index.check_conflicts(target.pk, target)
+                    conflict_index.add(
+                        target.pk, target.zone_id, target.name, target.type, target.ttl
+                    )
+                else:
+                    conflict_index.remove(
+                        target.pk, target.zone_id, target.name, target.type
+                    )
+
+                update_records[index] = target
+                journal_changes.append((target.zone, saved_rr, target.get_journal_rr()))
+
+            else:
+                if requires_save(record):
+                    save_records[index] = record
+                    continue
+
+                if record.is_active:
+                    conflict_index.check_conflicts(id(record), record)
+                    if enforce_unique_rrset_ttl:
+                        conflict_index.check_rrset_ttl(id(record), record)
+                    conflict_index.add(
+                        id(record), record.zone_id, record.name, record.type, record.ttl
+                    )
+
+                if record.is_ptr_record:
+                    record.ip_address = record.address_from_name
+                elif record.is_address_record:
+                    record.ip_address = netaddr.IPAddress(record.value)
+
+                create_records[index] = record
+                journal_changes.append((record.zone, None, record.get_journal_rr()))
+
+        except ValidationError as exc:
+            set_error(index, exc)
+
+    if user is not None:
+        _check_permissions(
+            user,
+            created=[
+                *create_records.values(),
+                *(record for record in save_records.values() if record._state.adding),
+            ],
+            updated=[
+                *update_records.values(),
+                *(
+                    record
+                    for record in save_records.values()
+                    if not record._state.adding
+                ),
+            ],
+        )
+
+    # +
+    # Write the changes. Records that require individual handling are saved
+    # after the bulk operations, so their validation takes the records
+    # written in bulk into account.
+    # -
+    with transaction.atomic(), deferred_serials():
+        now = timezone.now()
+        changed_records = list(create_records.values()) + list(update_records.values())
+
+        for record in changed_records:
+            record.last_updated = now
+
+        if create_records:
+            Record.objects.bulk_create(create_records.values(), batch_size=1000)
+        if update_records:
+            Record.objects.bulk_update(
+                update_records.values(), fields=UPSERT_UPDATE_FIELDS, batch_size=1000
+            )
+
+        dirty_zone_pks = update_ptr_records(changed_records)
+        dirty_zone_pks |= {record.zone_id for record in changed_records}
+
+        if changed_records:
+            search_backend.cache(changed_records)
+            _log_record_changes(create_records.values(), update_records.values())
+        journal_record_changes(journal_changes)
+
+        for index, record in create_records.items():
+            results[index] = {"status": "created", "id": record.pk}
+        for index, record in update_records.items():
+            results[index] = {"status": "updated", "id": record.pk}
+
+        for index, record in save_records.items():
+            adding = record._state.adding
+            try:
+                with transaction.atomic():
+                    record.save()
+            except ValidationError as exc:
+                set_error(index, exc)
+                continue
+
+            results[index] = {
+                "status": "created" if adding else "updated",
+                "id": record.pk,
+            }
+
+        if user is not None:
+            for result_status, action in (("created", "add"), ("updated", "change")):
+                check_record_permissions(
+                    user,
+                    {
+                        result["id"]
+                        for result in results
+                        if result["status"] == result_status
+                    },
+                    action,
+                )
+
+        update_serials(dirty_zone_pks)
+
+    return results
@@ -0,0 +1,190 @@
+import weakref
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime
+from math import ceil
+
+from django.db import connection, transaction
+
+from netbox.plugins.utils import get_plugin_config
+
+__all__ = (
+    "deferred_serials",
+    "defer_serial_update",
+    "update_serials",
+    "schedule_serial_update",
+    "allocate_serials",
+)
+
+SOA_SERIAL_WRAP = 2**32
+SOA_SERIAL_HALF = 2**31
+
+_deferred_zone_pks = ContextVar("netbox_dns_deferred_zone_pks", default=None)
+_scheduled_zone_pks = ContextVar("netbox_dns_scheduled_zone_pks", default=None)
+
+
+@contextmanager
+def deferred_serials():
+    """
+    Coalesce SOA serial updates for the duration of a transaction.
+
+    While the context is active, `Zone.update_serial()` only records the zone
+    as dirty. When the context is left, the SOA serial and the SOA record of
+    each dirty zone are updated once, inside the same transaction as the
+    changes causing the update. Nested contexts are merged into the outermost
+    one. If the transaction is rolled back, no serials are updated, and zones
+    that were only changed in savepoints that have been rolled back are not
+    updated either.
+    """
+    if _deferred_zone_pks.get() is not None:
+        yield
+        return
+
+    savepoints = {}
+    token = _deferred_zone_pks.set(savepoints)
+
+    try:
+        with transaction.atomic():
+            yield
+
+            _deferred_zone_pks.reset(token)
+            token = None
+
+            if not transaction.get_rollback():
+                update_serials(
+                    set().union(
+                        *(
+                            zone_pks
+                            for zone_pks, marker in savepoints.values()
+                            if marker() is not None
+                        )
+                    )
+                )
+    finally:
+        if token is not None:
+            _deferred_zone_pks.reset(token)
+
+
+def defer_serial_update(zone):
+    """
+    Record the zone as dirty if serial updates are currently deferred. Returns
+    True if the update was deferred and False otherwise.
+    """
+    if (savepoints := _deferred_zone_pks.get()) is None:
+        return False
+
+    # +
+    # The dirty zones are recorded per savepoint. Only a weak reference to an
+    # on_commit callback registered in the savepoint is kept, which is gone
+    # once Django has discarded the callback because the savepoint has been
+    # rolled back.
+    # -
+    savepoint_ids = tuple(connection.savepoint_ids)
+    savepoint = savepoints.get(savepoint_ids)
+    if savepoint is None or savepoint[1]() is None:
+
+        def savepoint_marker():
+            pass
+
+        savepoint = (set(), weakref.ref(savepoint_marker))
+        savepoints[savepoint_ids] = savepoint
+        transaction.on_commit(savepoint_marker)
+
+    savepoint[0].add(zone.pk)
+    return True
+
+
+def update_serials(zone_pks, exclude_pk=None):
+    """
+    Update the SOA serials of the zones with the given PKs. The zone with PK
+    `exclude_pk` is skipped, which is used for a zone that is being saved and
+    whose serial is updated by the save operation itself.
+    """
+    from netbox_dns.models import Zone
+
+    for zone in (
+        Zone.objects.filter(pk__in=zone_pks, soa_serial_auto=True)
+        .exclude(pk=exclude_pk)
+        .order_by("pk")
+    ):
+        zone.update_serial()
+
+
+def schedule_serial_update(zone):
+    """
+    If SOA serials are allocated on commit, schedule the serial update for the
+    zone at the commit of the current transaction. Returns True if the update
+    was scheduled and False otherwise.
+    """
+    if not connection.in_atomic_block or not get_plugin_config(
+        "netbox_dns", "zone_soa_serial_on_commit", False
+    ):
+        return False
+
+    # +
+    # There is one set of zones per transaction. Only a weak reference to the
+    # on_commit callback for the set is kept, so it is gone once the callback
+    # has run or Django has discarded it with a rolled back transaction, and a
+    # new set is started.
+    # -
+    scheduled = _scheduled_zone_pks.get()
+    if scheduled is None or scheduled[1]() is None:
+        zone_pks = set()
+
+        def commit_serials():
+            _scheduled_zone_pks.set(None)
+            allocate_serials(zone_pks)
+
+        scheduled = (zone_pks, weakref.ref(commit_serials))
+        _scheduled_zone_pks.set(scheduled)
+        transaction.on_commit(commit_serials)
+
+    scheduled[0].add(zone.pk)
+    return True
+
+
+def _next_serial(serial, timestamp):
+    """
+    Return the serial following `serial`, which is the timestamp if that is
+    greater than the serial in RFC 1982 serial number arithmetic, and the
+    serial incremented by one otherwise.
+    """
+    if serial is None or 0 < (timestamp - serial) % SOA_SERIAL_WRAP < SOA_SERIAL_HALF:
+        return timestamp
+
+    return (serial + 1) % SOA_SERIAL_WRAP
+
+
+def allocate_serials(zone_pks):
+    """
+    Allocate new SOA serials for the zones and update their SOA records.
+
+    Each zone is updated in a short transaction of its own, in the order of
+    the zone PKs, so only one zone row is locked at a time and only for the
+    duration of the serial update. The new serial is always greater than the
+    current one in RFC 1982 serial number arithmetic, even for several
+    allocations within one second, manually advanced serials or diverging
+    clocks of different workers.
+    """
+    from netbox_dns.models import Zone
+
+    for zone_pk in sorted(zone_pks):
+        last_updated = datetime.now()
+
+        with transaction.atomic():
+            serials = (
+                Zone.objects.select_for_update()
+                .filter(pk=zone_pk, soa_serial_auto=True)
+                .values_list("soa_serial", flat=True)
+            )
+            if not serials:
+                continue
+
+            Zone.objects.filter(pk=zone_pk).update(
+                soa_serial=_next_serial(
+                    serials[0], ceil(last_updated.timestamp()) % SOA_SERIAL_WRAP
+                ),
+                last_updated=last_updated,
+            )
+
+            Zone.objects.get(pk=zone_pk).update_soa_record()
@@ -0,0 +1,261 @@
+import dns.zone
+from dns import name as dns_name
+from dns import rdataclass, rdatatype
+from dns.exception import DNSException
+
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.db.models.functions import Lower
+from django.utils.translation import gettext as _
+
+from .record_upsert import upsert_records
+from .serials import deferred_serials
+
+__all__ = (
+    "IMPORT_SKIP_TYPES",
+    "read_zone_file",
+    "get_nameservers",
+    "get_zone_soa_fields",
+    "import_zone",
+    "import_zone_records",
+)
+
+# +
+# Record types that are generated by the signer or by the name server and
+# are not imported.
+# -
+IMPORT_SKIP_TYPES = (
+    rdatatype.SOA,
+    rdatatype.RRSIG,
+    rdatatype.NSEC,
+    rdatatype.NSEC3,
+    rdatatype.NSEC3PARAM,
+    rdatatype.CDS,
+    rdatatype.CDNSKEY,
+    65534,
+)
+
+
+def read_zone_file(source, origin=None):
+    """
+    Parse an RFC 1035 master file and return it as a `dns.zone.Zone` with
+    relative names.
+
+    `source` is a file name or a file object. If the file does not contain an
+    `$ORIGIN` directive, `origin` must be specified.
+    """
+    if isinstance(origin, str):
+        origin = dns_name.from_text(origin)
+
+    try:
+        return dns.zone.from_file(source, origin=origin, relativize=True)
+    except (DNSException, SyntaxError) as exc:
+        raise ValidationError(
+            _("Zone file could not be parsed: {error}").format(error=exc)
+        )
+
+
+def get_nameservers(names):
+    """
+    Return a dictionary mapping the given names to name servers, creating the
+    name servers that do not exist.
+
+    Name server names are unique regardless of case, and the name servers may
+    be created concurrently by other zone imports or transfers. If creating a
+    name server fails because it has been created in the meantime, the
+    existing name server is used. The name servers are created in the order
+    of their names, so concurrent transactions creating the same name servers
+    wait for each other instead of deadlocking.
+    """
+    from netbox_dns.models import NameServer
+
+    existing = {
+        nameserver.name.lower(): nameserver
+        for nameserver in NameServer.objects.annotate(lower_name=Lower("name")).filter(
+            lower_name__in={name.lower() for name in names}
+        )
+    }
+
+    nameservers = {}
+    for name in sorted(names, key=str.lower):
+        if (nameserver := existing.get(name.lower())) is None:
+            try:
+                with transaction.atomic():
+                    nameserver = NameServer.objects.create(name=name)
+            except (IntegrityError, ValidationError):
+                nameserver = NameServer.objects.filter(name__iexact=name).first()
+                if nameserver is None:
+                    raise
+
+            existing[name.lower()] = nameserver
+
+        nameservers[name] = nameserver
+
+    return nameservers
+
+
+def _zone_data_records(zone_data):
+    soa_rdataset = zone_data.get_rdataset(dns_name.empty, rdatatype.SOA)
+    if soa_rdataset is not None:
+        yield dns_name.empty, soa_rdataset.ttl, soa_rdataset[0]
+
+    for name, node in zone_data.nodes.items():
+        for rdataset in node.rdatasets:
+            if rdataset.rdtype == rdatatype.SOA:
+                continue
+
+            for rr in rdataset:
+                yield name, rdataset.ttl, rr
+
+
+def get_zone_soa_fields(origin, soa, soa_ttl):
+    """
+    Return the SOA fields of a zone as a dictionary from an SOA record and its
+    TTL.
+    """
+    return {
+        "soa_ttl": soa_ttl,
+        "soa_rname": soa.rname.derelativize(origin).to_text(omit_final_dot=True),
+        "soa_serial": soa.serial,
+        "soa_refresh": soa.refresh,
+        "soa_retry": soa.retry,
+        "soa_expire": soa.expire,
+        "soa_minimum": soa.minimum,
+        "soa_serial_auto": False,
+    }
+
+
+def import_zone(zone_data, view, **kwargs):
+    """
+    Create a zone in the view from a `dns.zone.Zone` returned by
+    `read_zone_file()`, see `import_zone_records()`.
+    """
+    return import_zone_records(
+        zone_data.origin, _zone_data_records(zone_data), view, **kwargs
+    )
+
+
+def import_zone_records(
+    origin,
+    records,
+    view,
+    default_ttl=None,
+    disable_ptr=False,
+    ignore_errors=False,
+    batch_size=5000,
+):
+    """
+    Create a zone in the view from a stream of records, which is an iterable
+    of (name, TTL, rdata) tuples with names relative to `origin`. The first
+    record must be the SOA record of the zone.
+
+    The SOA fields of the zone are taken from the SOA record and the SOA
+    serial is preserved, and the name servers of the zone are created from the
+    NS records at the zone apex. All other records are collected in batches of
+    `batch_size` records, which are validated in memory and inserted using
+    bulk operations, see `upsert_records()`. Records whose TTL equals the
+    default TTL of the zone are created without a TTL. Records of the types
+    in `IMPORT_SKIP_TYPES` are ignored.
+
+    If any record cannot be created, no changes are made unless
+    `ignore_errors` is True, in which case the zone is created with the
+    remaining records.
+
+    Returns the zone, which is None if it was not created, and a list of
+    errors.
+    """
+    from netbox_dns.models import Zone
+    from netbox_dns.choices import RecordTypeChoices
+
+    zone_name = origin.to_text(omit_final_dot=True)
+
+    if Zone.objects.filter(view=view, name=zone_name).exists():
+        raise ValidationError(
+            _("Zone {zone} already exists in view {view}").format(
+                zone=zone_name, view=view
+            )
+        )
+
+    records = iter(records)
+    name, soa_ttl, soa = next(records, (None, None, None))
+    if soa is None or soa.rdtype != rdatatype.SOA or name != dns_name.empty:
+        raise ValidationError(
+            _("Zone {zone} does not have an SOA record").format(zone=zone_name)
+        )
+    soa_mname = soa.mname.derelativize(origin).to_text(omit_final_dot=True)
+
+    # +
+    # The name server of the SOA record is created before the zone, so the
+    # transaction importing the zone only creates the name servers of the
+    # zone apex in a single call to `get_nameservers()`.
+    # -
+    soa_nameserver = get_nameservers({soa_mname})[soa_mname]
+
+    errors = []
+
+    def import_batch(specs):
+        for spec, result in zip(specs, upsert_records(specs)):
+            if result["status"] == "error":
+                errors.append(
+                    {
+                        "name": spec["name"],
+                        "type": spec["type"],
+                        "value": spec["value"],
+                        "errors": result["errors"],
+                    }
+                )
+
+    with transaction.atomic():
+        with deferred_serials():
+            zone = Zone(
+                view=view,
+                name=zone_name,
+                default_ttl=default_ttl,
+                soa_mname=soa_nameserver,
+                **get_zone_soa_fields(origin, soa, soa_ttl),
+            )
+            zone.save()
+
+            apex_ns_names = []
+            specs = []
+            for name, ttl, rr in records:
+                if rr.rdclass != rdataclass.IN or rr.rdtype in IMPORT_SKIP_TYPES:
+                    continue
+
+                if rr.rdtype == rdatatype.NS and name == dns_name.empty:
+                    apex_ns_names.append(
+                        rr.target.derelativize(origin).to_text(omit_final_dot=True)
+                    )
+                    continue
+
+                record_type = rdatatype.to_text(rr.rdtype)
+                specs.append(
+                    {
+                        "zone": zone.pk,
+                        "name": name.to_text(),
+                        "type": record_type,
+                        "value": rr.to_text(),
+                        "ttl": ttl if ttl != zone.default_ttl else None,
+                        "disable_ptr": (
+                            disable_ptr
+                            and record_type
+                            in (RecordTypeChoices.A, RecordTypeChoices.AAAA)
+                        ),
+                    }
+                )
+
+                if len(specs) >= batch_size:
+                    import_batch(specs)
+                    specs = []
+
+            if specs:
+                import_batch(specs)
+
+            nameservers = get_nameservers(set(apex_ns_names))
+            zone.nameservers.set(nameservers[name] for name in apex_ns_names)
+
+        if errors and not ignore_errors:
+            transaction.set_rollback(True)
+            return None, errors
+
+    return zone, errors
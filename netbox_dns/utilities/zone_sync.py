@@ -0,0 +1,373 @@
+import dns.zone
+from dns import name as dns_name
+from dns import rdata, rdatatype
+from dns.exception import DNSException
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.db.models import Min
+from django.utils.translation import gettext as _
+
+from .journal import journal_record_changes
+from .record_upsert import (
+    RECORD_UPSERT_FIELDS,
+    check_record_permissions,
+    upsert_records,
+)
+from .serials import deferred_serials, update_serials
+
+__all__ = (
+    "parse_zone_records",
+    "diff_zone_records",
+    "sync_zone_records",
+    "patch_zone_records",
+)
+
+
+def _record_key(origin, name, record_type, value):
+    """
+    Return the key used to match desired and existing records. Names are
+    compared case-insensitively and relative to the zone, values in their
+    canonical presentation format if they can be parsed.
+    """
+    from netbox_dns.choices import RecordClassChoices, RecordTypeChoices
+
+    name = dns_name.from_text(name, origin=origin).relativize(origin).to_text()
+    record_type = record_type.upper()
+
+    if record_type not in RecordTypeChoices.CUSTOM_TYPES:
+        try:
+            value = rdata.from_text(
+                RecordClassChoices.IN,
+                record_type,
+                value,
+                origin=origin,
+                relativize_to=origin,
+            ).to_text()
+        except (DNSException, SyntaxError, ValueError):
+            pass
+
+    return (name.lower(), record_type, value)
+
+
+def _record_data(record):
+    return {
+        "id": record.pk,
+        "name": record.name,
+        "type": record.type,
+        "value": record.value,
+        "ttl": record.ttl,
+        "status": record.status,
+    }
+
+
+def parse_zone_records(zone, text):
+    """
+    Return the records contained in an RFC 1035 master file for the zone as a
+    list of dictionaries with the name, type, value and TTL of each record.
+
+    Records without an explicit TTL and records whose TTL equals the default
+    TTL of the zone are returned without a TTL. SOA records are ignored.
+    """
+    from netbox_dns.choices import RecordTypeChoices
+
+    origin = dns_name.from_text(zone.name)
+
+    try:
+        zone_data = dns.zone.from_text(
+            f"$TTL {zone.default_ttl}\n{text}",
+            origin=origin,
+            relativize=True,
+            check_origin=False,
+        )
+    except (DNSException, SyntaxError) as exc:
+        raise ValidationError(
+            _("Zone file could not be parsed: {error}").format(error=exc)
+        )
+
+    records = []
+    for name, node in zone_data.nodes.items():
+        for rdataset in node.rdatasets:
+            record_type = rdatatype.to_text(rdataset.rdtype)
+            if record_type == RecordTypeChoices.SOA:
+                continue
+
+            for rr in rdataset:
+                records.append(
+                    {
+                        "name": name.to_text(),
+                        "type": record_type,
+                        "value": rr.to_text(),
+                        "ttl": (
+                            rdataset.ttl if rdataset.ttl != zone.default_ttl else None
+                        ),
+                    }
+                )
+
+    return records
+
+
+def diff_zone_records(zone, desired):
+    """
+    Compute the changes required to make the unmanaged records of the zone
+    match the list of desired records.
+
+    Each desired record is a dictionary containing the name, type and value
+    and optionally the fields listed in `RECORD_UPSERT_FIELDS`. A TTL or
+    status that is not specified is taken to be the default. Desired records
+    matching a managed record of the zone are ignored.
+
+    Both lists are sorted by name, type and value and merged in one pass.
+    Returns a dictionary with the lists of desired records to be created,
+    (record, desired record) tuples for records to be updated and records to
+    be deleted.
+    """
+    from netbox_dns.choices import RecordStatusChoices
+
+    origin = dns_name.from_text(zone.name)
+
+    desired_keys = []
+    errors = {}
+    for index, item in enumerate(desired):
+        try:
+            key = _record_key(origin, item["name"], item["type"], item["value"])
+        except DNSException as exc:
+            errors[index] = str(exc)
+            continue
+
+        desired_keys.append((key, index))
+
+    if errors:
+        raise ValidationError(
+            [
+                _("Record {index}: {error}").format(index=index, error=error)
+                for index, error in errors.items()
+            ]
+        )
+
+    managed_keys = set()
+    current = []
+    for record in zone.records.select_related(
+        "zone", "ptr_record", "ptr_record__zone", "ptr_record__rfc2317_cname_record"
+    ):
+        key = _record_key(origin, record.name, record.type, record.value)
+
+        if record.managed or record.ipam_ip_address_id is not None:
+            managed_keys.add(key)
+        else:
+            current.append((key, record.pk, record))
+
+    desired_keys = sorted(
+        entry for entry in desired_keys if entry[0] not in managed_keys
+    )
+    current.sort(key=lambda entry: entry[:2])
+
+    duplicates = {
+        desired_keys[index][0]
+        for index in range(1, len(desired_keys))
+        if desired_keys[index][0] == desired_keys[index - 1][0]
+    }
+    if duplicates:
+        raise ValidationError(
+            [
+                _("Duplicate record {name} {type} {value}").format(
+                    name=name, type=record_type, value=value
+                )
+                for name, record_type, value in sorted(duplicates)
+            ]
+        )
+
+    diff = {"create": [], "update": [], "delete": []}
+
+    desired_index = current_index = 0
+    while desired_index < len(desired_keys) or current_index < len(current):
+        if current_index == len(current) or (
+            desired_index < len(desired_keys)
+            and desired_keys[desired_index][0] < current[current_index][0]
+        ):
+            diff["create"].append(desired[desired_keys[desired_index][1]])
+            desired_index += 1
+
+        elif desired_index == len(desired_keys) or (
+            current[current_index][0] < desired_keys[desired_index][0]
+        ):
+            diff["delete"].append(current[current_index][2])
+            current_index += 1
+
+        else:
+            item = desired[desired_keys[desired_index][1]]
+            record = current[current_index][2]
+
+            expected = {
+                "ttl": item.get("ttl"),
+                "status": item.get("status", RecordStatusChoices.STATUS_ACTIVE),
+            }
+            expected.update(
+                (field, item[field])
+                for field in RECORD_UPSERT_FIELDS
+                if field in item and field not in expected
+            )
+            if any(
+                getattr(record, f"{field}_id" if field == "tenant" else field) != value
+                for field, value in expected.items()
+            ):
+                diff["update"].append((record, item))
+
+            desired_index += 1
+            current_index += 1
+
+    return diff
+
+
+def _delete_records(records):
+    from netbox_dns.models import Record
+
+    pks = {record.pk for record in records}
+    dirty_zone_pks = {record.zone_id for record in records}
+
+    ptr_address_records = {
+        record.ptr_record_id: record
+        for record in records
+        if record.ptr_record_id is not None
+    }
+    journal_changes = [
+        (record.zone, record.get_journal_rr(saved=True), None) for record in records
+    ]
+
+    # +
+    # Unmanaged PTR records in RFC2317 zones have a CNAME record in the parent
+    # zone, which is updated or deleted in the same way as by `Record.delete()`,
+    # but for all PTR records deleted at once.
+    # -
+    for cname_record in Record.objects.filter(
+        pk__in={
+            record.rfc2317_cname_record_id
+            for record in records
+            if record.rfc2317_cname_record_id is not None
+        }
+    ):
+        rfc2317_ptr_records = cname_record.rfc2317_ptr_records.exclude(pk__in=pks)
+
+        if rfc2317_ptr_records.exists():
+            cname_record.ttl = rfc2317_ptr_records.aggregate(Min("ttl")).get("ttl__min")
+            cname_record.save(update_fields=["ttl"], save_zone_serial=False)
+        else:
+            cname_record.delete(save_zone_serial=False)
+
+        dirty_zone_pks.add(cname_record.zone_id)
+
+    Record.objects.filter(pk__in=pks).delete()
+    journal_record_changes(journal_changes)
+
+    for record in ptr_address_records.values():
+        record.refresh_ptr_record(record.ptr_record)
+
+    update_serials(dirty_zone_pks)
+
+
+def sync_zone_records(zone, desired, dry_run=False, user=None):
+    """
+    Make the unmanaged records of the zone match the list of desired records,
+    see `diff_zone_records()`.
+
+    The records are deleted, updated and created in one transaction, which is
+    rolled back if any of the records cannot be created or updated, or if
+    `dry_run` is True. The SOA serial of the zone is updated once.
+
+    If `user` is given, the object-level permissions of the user to delete
+    and change the existing records are checked before anything is written,
+    and those to add and change records by `upsert_records()`.
+
+    Returns the differences and a list of errors, which is empty if the
+    changes were applied or could be applied successfully.
+    """
+    from netbox_dns.choices import RecordStatusChoices
+
+    diff = diff_zone_records(zone, desired)
+
+    specs = [{**item, "zone": zone.pk} for item in diff["create"]]
+    for record, item in diff["update"]:
+        specs.append(
+            {
+                **item,
+                "zone": zone.pk,
+                "name": record.name,
+                "type": record.type,
+                "value": record.value,
+                "ttl": item.get("ttl"),
+                "status": item.get("status", RecordStatusChoices.STATUS_ACTIVE),
+            }
+        )
+
+    if user is not None:
+        check_record_permissions(
+            user, {record.pk for record in diff["delete"]}, "delete"
+        )
+        check_record_permissions(
+            user, {record.pk for record, item in diff["update"]}, "change"
+        )
+
+    errors = []
+    with transaction.atomic():
+        with deferred_serials():
+            if diff["delete"]:
+                _delete_records(diff["delete"])
+
+            if specs:
+                for spec, result in zip(specs, upsert_records(specs, user=user)):
+                    if result["status"] == "error":
+                        errors.append(
+                            {
+                                "name": spec["name"],
+                                "type": spec["type"],
+                                "value": spec["value"],
+                                "errors": result["errors"],
+                            }
+                        )
+
+        if dry_run or errors:
+            transaction.set_rollback(True)
+
+    return {
+        "create": diff["create"],
+        "update": [
+            {**_record_data(record), "changes": item} for record, item in diff["update"]
+        ],
+        "delete": [_record_data(record) for record in diff["delete"]],
+    }, errors
+
+
+def patch_zone_records(zone, changes, dry_run=False):
+    """
+    Apply a sequence of incremental changes to the unmanaged records of the
+    zone, see `sync_zone_records()`.
+
+    `changes` is an iterable of (deleted, added) tuples, each containing
+    lists of records in the format used for the desired records in
+    `diff_zone_records()`. The changes are applied in order to the current
+    records of the zone and the result is synchronised with the zone.
+    """
+    origin = dns_name.from_text(zone.name)
+
+    desired = {
+        _record_key(origin, record.name, record.type, record.value): {
+            "name": record.name,
+            "type": record.type,
+            "value": record.value,
+            "ttl": record.ttl,
+            "status": record.status,
+        }
+        for record in zone.records.filter(managed=False, ipam_ip_address__isnull=True)
+    }
+
+    for deleted, added in changes:
+        for item in deleted:
+            desired.pop(
+                _record_key(origin, item["name"], item["type"], item["value"]), None
+            )
+        for item in added:
+            desired[_record_key(origin, item["name"], item["type"], item["value"])] = (
+                item
+            )
+
+    return sync_zone_records(zone, list(desired.values()), dry_run=dry_run)
@@ -0,0 +1,280 @@
+import dns.query
+from dns import name as dns_name
+from dns import rdataclass, rdatatype, tsig, tsigkeyring
+from dns.exception import DNSException
+
+from django.core.exceptions import ValidationError
+from django.db import transaction
+from django.utils.translation import gettext as _
+
+from .zone_import import (
+    IMPORT_SKIP_TYPES,
+    get_nameservers,
+    get_zone_soa_fields,
+    import_zone_records,
+)
+from .zone_sync import patch_zone_records, sync_zone_records
+
+__all__ = (
+    "ZoneTransfer",
+    "transfer_zone",
+    "refresh_zone",
+)
+
+
+class ZoneTransfer:
+    """
+    Zone transfer (AXFR or IXFR) of a zone from a name server using
+    `dns.query.xfr()`.
+
+    The records are returned as a stream of (name, TTL, rdata) tuples with
+    names relative to the zone origin, which are read from the transfer
+    messages as they arrive, so the zone is never held in memory as a whole.
+    """
+
+    def __init__(
+        self,
+        where,
+        zone_name,
+        port=53,
+        tsig_key_name=None,
+        tsig_key=None,
+        tsig_algorithm=tsig.default_algorithm,
+        timeout=30,
+    ):
+        self.where = where
+        self.origin = dns_name.from_text(zone_name)
+        self.port = port
+        self.timeout = timeout
+
+        self.tsig_params = {}
+        if tsig_key_name:
+            self.tsig_params = {
+                "keyring": tsigkeyring.from_text({tsig_key_name: tsig_key}),
+                "keyname": tsig_key_name,
+                "keyalgorithm": tsig_algorithm,
+            }
+
+    def _records(self, rdtype, serial=0):
+        try:
+            for message in dns.query.xfr(
+                self.where,
+                self.origin,
+                rdtype=rdtype,
+                port=self.port,
+                timeout=self.timeout,
+                relativize=True,
+                serial=serial,
+                **self.tsig_params,
+            ):
+                for rrset in message.answer:
+                    if rrset.rdclass != rdataclass.IN:
+                        continue
+
+                    for rr in rrset:
+                        yield rrset.name, rrset.ttl, rr
+        except (DNSException, OSError) as exc:
+            raise ValidationError(
+                _("Zone transfer for zone {zone} from {server} failed: {error}").format(
+                    zone=self.origin.to_text(omit_final_dot=True),
+                    server=self.where,
+                    error=exc,
+                )
+            )
+
+    def axfr(self):
+        """
+        Generate the records of the zone using AXFR. The first record is the
+        SOA record, the SOA record terminating the transfer is omitted.
+        """
+        records = self._records(rdatatype.AXFR)
+
+        soa_record = next(records, None)
+        if soa_record is None or soa_record[2].rdtype != rdatatype.SOA:
+            raise ValidationError(
+                _("Zone transfer for zone {zone} did not start with SOA").format(
+                    zone=self.origin.to_text(omit_final_dot=True)
+                )
+            )
+        yield soa_record
+
+        for record in records:
+            if record[2].rdtype == rdatatype.SOA and record[0] == dns_name.empty:
+                return
+
+            yield record
+
+    def ixfr(self, serial):
+        """
+        Request the changes of the zone since SOA serial `serial` using IXFR.
+
+        Returns a tuple of the transfer type, the SOA record and the changes.
+        For "ixfr", the changes are a list of (deleted, added) tuples with the
+        records removed and added for each serial increment, for "axfr" they
+        are a list of the records of the zone, and for "current" they are None
+        because the zone is unchanged.
+        """
+        records = self._records(rdatatype.IXFR, serial=serial)
+
+        soa_record = next(records, None)
+        if soa_record is None or soa_record[2].rdtype != rdatatype.SOA:
+            raise ValidationError(
+                _("Zone transfer for zone {zone} did not start with SOA").format(
+                    zone=self.origin.to_text(omit_final_dot=True)
+                )
+            )
+        new_serial = soa_record[2].serial
+
+        record = next(records, None)
+        if record is None:
+            return "current", soa_record, None
+
+        if record[2].rdtype == rdatatype.SOA and record[2].serial == new_serial:
+            if new_serial == serial:
+                return "current", soa_record, None
+
+            return "axfr", soa_record, []
+
+        # +
+        # If the server does not send incremental changes, the response is a
+        # full zone transfer, which does not start with the SOA record of the
+        # old serial.
+        # -
+        if record[2].rdtype != rdatatype.SOA:
+            zone_records = [record]
+            for record in records:
+                if record[2].rdtype == rdatatype.SOA and record[0] == dns_name.empty:
+                    break
+                zone_records.append(record)
+
+            return "axfr", soa_record, zone_records
+
+        # +
+        # Incremental changes are sequences of the old SOA, the records
+        # deleted, the new SOA and the records added. The transfer ends with
+        # the SOA record of the current serial.
+        # -
+        changes = []
+        deleted = added = None
+        for record in [record, *records]:
+            if record[2].rdtype == rdatatype.SOA:
+                if added is None and deleted is not None:
+                    added = []
+                    continue
+
+                if record[2].serial == new_serial and deleted is not None:
+                    changes.append((deleted, added))
+                    break
+
+                if deleted is not None:
+                    changes.append((deleted, added))
+                deleted, added = [], None
+                continue
+
+            if added is None:
+                deleted.append(record)
+            else:
+                added.append(record)
+
+        return "ixfr", soa_record, changes
+
+
+def _split_records(zone, records):
+    """
+    Split transferred records into the names of the name servers at the zone
+    apex and a list of the remaining records in the format used by
+    `sync_zone_records()`.
+    """
+    origin = dns_name.from_text(zone.name)
+
+    items = []
+    nameserver_names = []
+    for name, ttl, rr in records:
+        if rr.rdtype in IMPORT_SKIP_TYPES:
+            continue
+
+        if rr.rdtype == rdatatype.NS and name == dns_name.empty:
+            nameserver_names.append(
+                rr.target.derelativize(origin).to_text(omit_final_dot=True)
+            )
+            continue
+
+        items.append(
+            {
+                "name": name.to_text(),
+                "type": rdatatype.to_text(rr.rdtype),
+                "value": rr.to_text(),
+                "ttl": ttl if ttl != zone.default_ttl else None,
+            }
+        )
+
+    return items, nameserver_names
+
+
+def transfer_zone(transfer, view, **kwargs):
+    """
+    Create a zone in the view from an AXFR zone transfer, see
+    `import_zone_records()`.
+    """
+    return import_zone_records(transfer.origin, transfer.axfr(), view, **kwargs)
+
+
+def refresh_zone(zone, transfer, force_axfr=False):
+    """
+    Update an existing zone from a zone transfer.
+
+    The changes since the SOA serial of the zone are requested using IXFR,
+    unless `force_axfr` is True or the server responds with a full transfer.
+    The resulting records are compared with the unmanaged records of the
+    zone and only the differences are written, see `sync_zone_records()` and
+    `patch_zone_records()`. The name servers and the SOA fields of the zone
+    are updated from the NS records at the zone apex and the SOA record.
+
+    Returns the transfer type, the differences and a list of errors. If there
+    are errors, no changes are made.
+    """
+    if force_axfr:
+        records = transfer.axfr()
+        soa_record = next(records)
+        transfer_type, changes = "axfr", list(records)
+    else:
+        transfer_type, soa_record, changes = transfer.ixfr(zone.soa_serial)
+
+    if transfer_type == "current":
+        return transfer_type, {"create": [], "update": [], "delete": []}, []
+
+    origin = transfer.origin
+    nameserver_names = [nameserver.name for nameserver in zone.nameservers.all()]
+
+    with transaction.atomic():
+        if transfer_type == "axfr":
+            items, nameserver_names = _split_records(zone, changes)
+            diff, errors = sync_zone_records(zone, items)
+        else:
+            item_changes = []
+            for deleted, added in changes:
+                deleted_items, deleted_names = _split_records(zone, deleted)
+                added_items, added_names = _split_records(zone, added)
+                item_changes.append((deleted_items, added_items))
+                nameserver_names = [
+                    name for name in nameserver_names if name not in deleted_names
+                ] + [name for name in added_names if name not in nameserver_names]
+
+            diff, errors = patch_zone_records(zone, item_changes)
+
+        if errors:
+            transaction.set_rollback(True)
+            return transfer_type, diff, errors
+
+        soa_ttl, soa = soa_record[1:]
+        soa_mname = soa.mname.derelativize(origin).to_text(omit_final_dot=True)
+        nameservers = get_nameservers({soa_mname, *nameserver_names})
+
+        for field, value in get_zone_soa_fields(origin, soa, soa_ttl).items():
+            setattr(zone, field, value)
+        zone.soa_mname = nameservers[soa_mname]
+        zone.save()
+
+        zone.nameservers.set(nameservers[name] for name in nameserver_names)
+
+    return transfer_type, diff, errors
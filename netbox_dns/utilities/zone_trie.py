@@ -0,0 +1,162 @@
+from .process_cache import ProcessCache
+
+__all__ = (
+    "ZoneNameTrie",
+    "zone_name_trie",
+)
+
+
+def _labels(name):
+    name = name.lower().rstrip(".")
+
+    return name.split(".")[::-1] if name else []
+
+
+class ZoneNameTrie(ProcessCache):
+    """
+    Per-process trie of zone names for each view.
+
+    The trie is keyed by the labels of the zone names in reverse order, so the
+    zones enclosing a DNS name are found by walking down from the root along
+    the labels of that name. Each node holding a zone contains its PK and its
+    activity status under the key None.
+
+    Zone save and delete operations patch the local trie in place and propagate
+    the change to other processes via the version key.
+    """
+
+    version_key = "netbox_dns:zone_name_trie:version"
+
+    def build(self):
+        from netbox_dns.models import Zone
+
+        roots = {}
+        index = {}
+
+        for pk, view_id, name, active in Zone.objects.values_list(
+            "pk", "view_id", "name", "active"
+        ).iterator():
+            self._insert(roots, index, pk, view_id, name, active)
+
+        return roots, index
+
+    @staticmethod
+    def _insert(roots, index, pk, view_id, name, active):
+        labels = _labels(name)
+
+        node = roots.setdefault(view_id, {})
+        for label in labels:
+            node = node.setdefault(label, {})
+
+        node[None] = (pk, active)
+        index[pk] = (view_id, labels)
+
+    @staticmethod
+    def _remove(roots, index, pk):
+        if (entry := index.pop(pk, None)) is None:
+            return
+
+        view_id, labels = entry
+
+        path = [roots[view_id]]
+        for label in labels:
+            path.append(path[-1][label])
+
+        if path[-1].get(None, (None,))[0] == pk:
+            del path[-1][None]
+
+        for label, parent in zip(reversed(labels), reversed(path[:-1])):
+            if parent[label]:
+                break
+            del parent[label]
+
+    def update_zone(self, zone):
+        if self.is_loaded:
+            roots, index = self._data
+            self._remove(roots, index, zone.pk)
+            self._insert(roots, index, zone.pk, zone.view_id, zone.name, zone.is_active)
+
+        self.changed()
+
+    def remove_zone(self, pk):
+        if self.is_loaded:
+            self._remove(*self._data, pk)
+
+        self.changed()
+
+    def _walk(self, view_id, name, include_self=True):
+        roots, index = self.data
+
+        if (node := roots.get(view_id)) is None:
+            return
+
+        labels = _labels(name)
+        if not include_self:
+            labels = labels[:-1]
+
+        yield 0, node
+        for depth, label in enumerate(labels, start=1):
+            if (node := node.get(label)) is None:
+                return
+
+            yield depth, node
+
+    def get_zone_pk(self, view_id, name):
+        """
+        Return the PK of the zone with the given name in the view, or None.
+        """
+        roots, index = self.data
+
+        if (node := roots.get(view_id)) is None:
+            return None
+
+        for label in _labels(name):
+            if (node := node.get(label)) is None:
+                return None
+
+        if (entry := node.get(None)) is not None:
+            return entry[0]
+
+        return None
+
+    def get_closest_zone_pk(
+        self,
+        view_id,
+        name,
+        min_labels=0,
+        active=None,
+        include_self=True,
+        exclude_pk=None,
+    ):
+        """
+        Return the PK of the closest zone enclosing the DNS name in the view. Only
+        zones with at least min_labels labels are considered. If active is True,
+        only active zones are considered.
+        """
+        zone_pk = None
+
+        for depth, node in self._walk(view_id, name, include_self=include_self):
+            if depth < min_labels or (entry := node.get(None)) is None:
+                continue
+
+            pk, zone_active = entry
+            if pk == exclude_pk or (active and not zone_active):
+                continue
+
+            zone_pk = pk
+
+        return zone_pk
+
+    def get_ancestor_zone_pks(self, view_id, name, min_labels=1):
+        """
+        Return the PKs of all zones in the view enclosing the zone name, starting
+        with the zone closest to the root.
+        """
+        return [
+            node[None][0]
+            for depth, node in self._walk(view_id, name, include_self=False)
+            if depth >= min_labels and None in node
+        ]
+
+
+zone_name_trie = ZoneNameTrie()
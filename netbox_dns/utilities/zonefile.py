@@ -0,0 +1,88 @@
+from hashlib import sha256
+
+from dns import name as dns_name
+
+from django.db.models import Count, Max
+
+__all__ = (
+    "get_zone_file_etag",
+    "get_zone_records",
+    "generate_zone_file",
+)
+
+
+def get_zone_file_etag(zone):
+    """
+    Return the entity tag for the zone file of a zone.
+
+    The tag is a hash of the SOA serial and the last change of the zone and
+    its view, and of the number and the last change of the active records
+    of the zone. It can be determined with a single aggregate query without
+    reading the records, and it changes with every change of the rendered
+    zone file, including changes that do not affect the SOA serial.
+    """
+    from netbox_dns.models import Record
+
+    records = Record.objects.filter(zone=zone, active=True).aggregate(
+        count=Count("pk"), last_updated=Max("last_updated")
+    )
+
+    state = "|".join(
+        str(value)
+        for value in (
+            zone.pk,
+            zone.soa_serial,
+            zone.last_updated,
+            zone.view.last_updated,
+            records["count"],
+            records["last_updated"],
+        )
+    )
+
+    return f'"{sha256(state.encode()).hexdigest()[:32]}"'
+
+
+def _format_record(name, ttl, record_type, value):
+    return (
+        f"{name:<32} {(str(ttl) if ttl is not None else ''):<8} IN {record_type:<8} "
+        f"{value}\n"
+    )
+
+
+def get_zone_records(zone, chunk_size=2000):
+    """
+    Generate the name, TTL, type and value of the active records of the zone.
+
+    The SOA record is generated first, followed by the remaining records
+    ordered by owner name, which are read from the database using a
+    server-side cursor in chunks of `chunk_size` rows. Records of custom
+    record types are not included.
+    """
+    from netbox_dns.models import Record
+    from netbox_dns.choices import RecordTypeChoices
+
+    records = Record.objects.filter(zone=zone, active=True).exclude(
+        type__in=RecordTypeChoices.CUSTOM_TYPES
+    )
+    fields = ("name", "ttl", "type", "value")
+
+    yield from records.filter(type=RecordTypeChoices.SOA).values_list(*fields)
+    yield from (
+        records.exclude(type=RecordTypeChoices.SOA)
+        .order_by("name", "type", "pk")
+        .values_list(*fields)
+        .iterator(chunk_size=chunk_size)
+    )
+
+
+def generate_zone_file(zone, chunk_size=2000):
+    """
+    Generate an RFC 1035 master file for the active records of the zone line
+    by line.
+    """
+    yield f";\n; Zone file for zone {zone.name} [{zone.view.name}]\n;\n\n"
+    yield f"$ORIGIN {dns_name.from_text(zone.name).to_text()}\n"
+    yield f"$TTL {zone.default_ttl}\n\n"
+
+    for record in get_zone_records(zone, chunk_size=chunk_size):
+        yield _format_record(*record)
@@ -13,6 +13,7 @@ from netbox_dns.forms import (
     RecordBulkEditForm,
 )
 from netbox_dns.models import Record, Zone
+from netbox_dns.mixins import DeferredSerialsMixin
 from netbox_dns.choices import RecordTypeChoices
 from netbox_dns.tables import RecordTable, ManagedRecordTable, RelatedRecordTable
 from netbox_dns.utilities import (
@@ -204,7 +205,7 @@ class RecordDeleteView(generic.ObjectDeleteView):
 
 
 @register_model_view(Record, "bulk_import", detail=False)
-class RecordBulkImportView(generic.BulkImportView):
+class RecordBulkImportView(DeferredSerialsMixin, generic.BulkImportView):
     queryset = Record.objects.filter(managed=False).prefetch_related(
         "zone", "ptr_record"
     )
@@ -213,7 +214,7 @@ class RecordBulkImportView(generic.BulkImportView):
 
 
 @register_model_view(Record, "bulk_edit", path="edit", detail=False)
-class RecordBulkEditView(generic.BulkEditView):
+class RecordBulkEditView(DeferredSerialsMixin, generic.BulkEditView):
     queryset = Record.objects.filter(managed=False).prefetch_related("zone")
     filterset = RecordFilterSet
     table = RecordTable
@@ -221,7 +222,7 @@ class RecordBulkEditView(generic.BulkEditView):
 
 
 @register_model_view(Record, "bulk_delete", path="delete", detail=False)
-class RecordBulkDeleteView(generic.BulkDeleteView):
+class RecordBulkDeleteView(DeferredSerialsMixin, generic.BulkDeleteView):
     queryset = Record.objects.filter(managed=False)
     filterset = RecordFilterSet
     table = RecordTable
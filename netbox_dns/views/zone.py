@@ -13,6 +13,7 @@ from netbox_dns.forms import (
     ZoneBulkEditForm,
 )
 from netbox_dns.models import Record, Zone
+from netbox_dns.mixins import DeferredSerialsMixin
 from netbox_dns.tables import (
     ZoneTable,
     RecordTable,
@@ -80,14 +81,14 @@ class ZoneDeleteView(generic.ObjectDeleteView):
 
 
 @register_model_view(Zone, "bulk_import", detail=False)
-class ZoneBulkImportView(generic.BulkImportView):
+class ZoneBulkImportView(DeferredSerialsMixin, generic.BulkImportView):
     queryset = Zone.objects.prefetch_related("view", "tags", "nameservers", "soa_mname")
     model_form = ZoneImportForm
     table = ZoneTable
 
 
 @register_model_view(Zone, "bulk_edit", path="edit", detail=False)
-class ZoneBulkEditView(generic.BulkEditView):
+class ZoneBulkEditView(DeferredSerialsMixin, generic.BulkEditView):
     queryset = Zone.objects.prefetch_related("view", "tags", "nameservers", "soa_mname")
     filterset = ZoneFilterSet
     table = ZoneTable
@@ -95,7 +96,7 @@ class ZoneBulkEditView(generic.BulkEditView):
 
 
 @register_model_view(Zone, "bulk_delete", path="delete", detail=False)
-class ZoneBulkDeleteView(generic.BulkDeleteView):
+class ZoneBulkDeleteView(DeferredSerialsMixin, generic.BulkDeleteView):
     queryset = Zone.objects.all()
     filterset = ZoneFilterSet
     table = ZoneTable